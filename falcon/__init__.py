@@ -36,7 +36,12 @@ from falcon.redirects import *  # NOQA
 from falcon.http_error import HTTPError  # NOQA
 from falcon.http_status import HTTPStatus  # NOQA
 from falcon.stream import BoundedStream # NOQA
+from falcon.middleware import CachingMiddleware  # NOQA
+from falcon.middleware import CoalescingMiddleware  # NOQA
+from falcon.middleware import CompressionMiddleware  # NOQA
 from falcon.middleware import CORSMiddleware  # NOQA
+from falcon.middleware import ETagMiddleware  # NOQA
+from falcon.middleware import RateLimitMiddleware  # NOQA
 
 # NOTE(kgriffs): Ensure that "from falcon import uri" will import
 # the same front-door module as "import falcon.uri". This works by
@@ -548,7 +548,9 @@ class App:
 
         self._router.add_route(uri_template, resource, **kwargs)
 
-    def add_static_route(self, prefix, directory, downloadable=False, fallback_filename=None):
+    def add_static_route(self, prefix, directory, downloadable=False, fallback_filename=None,
+                         cache_size=0, cache_max_file_size=256 * 1024,
+                         cache_revalidate_interval=1.0):
         """Add a route to a directory of static files.
 
         Static routes provide a way to serve files directly. This
@@ -565,7 +567,9 @@ class App:
 
         Note:
             For ASGI apps, file reads are made non-blocking by scheduling
-            them on the default executor.
+            them on a dedicated executor, unless the ASGI server supports
+            sending files directly (see also:
+            :class:`~falcon.routing.StaticRouteAsync`).
 
         Static routes are matched in LIFO order. Therefore, if the same
         prefix is used for two routes, the second one will override the
@@ -596,11 +600,25 @@ class App:
             fallback_filename (str): Fallback filename used when the requested file
                 is not found. Can be a relative path inside the prefix folder or any valid
                 absolute path.
+            cache_size (int): The maximum number of bytes of file contents to
+                cache in memory (default ``0``, meaning the cache is disabled).
+                When enabled, the least recently served files are evicted as
+                needed to stay within this limit. Precompressed siblings of
+                cached files (i.e., ``.br`` and ``.gz`` files) are cached as
+                well, and served to clients that accept the corresponding
+                encoding.
+            cache_max_file_size (int): Files larger than this number of bytes
+                are never cached (default ``262144``, i.e., 256 KiB).
+            cache_revalidate_interval (float): The minimum number of seconds
+                to wait before checking whether a cached file was modified on
+                disk (default ``1.0``).
 
         """
 
         sr = self._STATIC_ROUTE_TYPE(
-            prefix, directory, downloadable=downloadable, fallback_filename=fallback_filename
+            prefix, directory, downloadable=downloadable, fallback_filename=fallback_filename,
+            cache_size=cache_size, cache_max_file_size=cache_max_file_size,
+            cache_revalidate_interval=cache_revalidate_interval,
         )
         self._static_routes.insert(0, (sr, sr, False))
         self._update_sink_and_static_routes()
@@ -32,9 +32,10 @@ import sys as _sys
 if _sys.version_info < (3, 6):
     raise ImportError('falcon.asgi requires Python 3.6+')
 
+from .admission import ConcurrencyLimiter  # NOQA
 from .app import App  # NOQA
-from .structures import SSEvent  # NOQA
+from .structures import SSEReplayBuffer, SSEvent  # NOQA
 from .request import Request  # NOQA
 from .response import Response  # NOQA
 from .stream import BoundedStream  # NOQA
-from .ws import WebSocket, WebSocketOptions  # NOQA
+from .ws import BroadcastGroup, WebSocket, WebSocketOptions  # NOQA
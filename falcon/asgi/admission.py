@@ -0,0 +1,318 @@
+"""Admission control for ASGI apps."""
+
+from collections import deque
+import time
+
+from falcon.errors import HTTPServiceUnavailable
+from falcon.util.sync import get_running_loop
+
+__all__ = ['ConcurrencyLimiter']
+
+
+# NOTE(kgriffs): Weight of each new latency sample in the moving average.
+_LATENCY_SMOOTHING = 0.1
+
+# NOTE(kgriffs): Factor by which the adaptive limit is reduced for each
+#   request that completes while the average latency exceeds the target.
+_LIMIT_BACKOFF = 0.95
+
+
+class ConcurrencyLimiter:
+    """Limits the number of requests that an ASGI app processes concurrently.
+
+    Without admission control, an ASGI app accepts any number of concurrent
+    requests. Under overload, this causes the latency of every request to
+    increase, up to the point where most requests time out anyway. An
+    instance of this class may be passed to :class:`falcon.asgi.App` in
+    order to cap the number of requests that are processed at any given
+    time, while shedding excess load early and cheaply::
+
+        limiter = falcon.asgi.ConcurrencyLimiter(limit=64, queue_timeout=0.5)
+        app = falcon.asgi.App(concurrency_limiter=limiter)
+
+    The limiter is consulted by the app before any middleware methods are
+    invoked. When the limit has been reached, new requests wait in a queue
+    until a slot becomes available. Requests that can not be queued (because
+    the queue is full) or that time out while waiting, are rejected with
+    ``503 Service Unavailable`` and a ``Retry-After`` header, by way of
+    raising an instance of :class:`~falcon.HTTPServiceUnavailable` (which
+    may be customized via :meth:`~falcon.asgi.App.add_error_handler`, as
+    usual).
+
+    A slot is held until the response has been sent in its entirety,
+    including any streamed content.
+
+    Requests may be divided into classes (e.g., by route, or by priority),
+    each of which is limited separately, via the `classify` function::
+
+        def classify(req):
+            if req.path.startswith('/reports'):
+                return 'reports'
+
+            # NOTE: Do not limit health checks.
+            if req.path == '/health':
+                return None
+
+            return 'default'
+
+        limiter = falcon.asgi.ConcurrencyLimiter(
+            limit=100,
+            limits={'reports': 4},
+            classify=classify,
+        )
+
+    When a `target_latency` is specified, the limit of each class is
+    adjusted based on the observed latency of its requests: while the
+    moving average of the latency exceeds the target, the limit is
+    decreased multiplicatively (down to `min_limit`); otherwise, the limit
+    is increased additively whenever all of its slots are in use (up to the
+    configured limit for the class).
+
+    Note:
+        The limiter is not thread-safe; it must only be used with a single
+        event loop.
+
+    Keyword Args:
+        limit (int): The maximum number of requests of each class that may
+            be processed concurrently (default ``100``).
+        limits (dict): A mapping of request classes to limits that override
+            the default `limit` for the respective class (default ``None``).
+        queue_size (int): The maximum number of requests of each class that
+            may wait for a slot (default ``None``, meaning the limit of the
+            class). Set to ``0`` to shed excess requests right away.
+        queue_timeout (float): The maximum number of seconds that a request
+            may wait for a slot (default ``1.0``).
+        retry_after (int): The value of the ``Retry-After`` header, in
+            seconds, of the responses to shed requests (default ``1``).
+        classify (callable): A function that accepts the request, and
+            returns the name of its class, or ``None`` if the request should
+            not be limited at all (default ``None``, meaning that all
+            requests are limited together as the ``'default'`` class).
+        target_latency (float): The target latency of requests, in seconds
+            (default ``None``, meaning that the limits are fixed).
+        min_limit (int): The lowest that an adaptive limit may be reduced
+            to (default ``1``).
+    """
+
+    __slots__ = [
+        '_classify',
+        '_limit',
+        '_limits',
+        '_min_limit',
+        '_pools',
+        '_queue_size',
+        '_queue_timeout',
+        '_retry_after',
+        '_target_latency',
+    ]
+
+    def __init__(
+        self,
+        limit=100,
+        limits=None,
+        queue_size=None,
+        queue_timeout=1.0,
+        retry_after=1,
+        classify=None,
+        target_latency=None,
+        min_limit=1,
+    ):
+        if limit < 1 or (limits and min(limits.values()) < 1):
+            raise ValueError('Limits must be positive integers')
+
+        self._classify = classify or _classify_default
+        self._limit = limit
+        self._limits = limits or {}
+        self._min_limit = min_limit
+        self._pools = {}
+        self._queue_size = queue_size
+        self._queue_timeout = queue_timeout
+        self._retry_after = retry_after
+        self._target_latency = target_latency
+
+    def stats(self):
+        """Get the current statistics for each class of requests.
+
+        Returns:
+            dict: A mapping of request classes to dicts with the following
+            items:
+
+            * ``'limit'``: The current limit of the class.
+            * ``'in_flight'``: The number of requests being processed.
+            * ``'queued'``: The number of requests waiting for a slot.
+            * ``'admitted'``: The total number of requests admitted.
+            * ``'delayed'``: The total number of requests admitted only
+              after waiting in the queue.
+            * ``'shed'``: The total number of requests rejected.
+            * ``'latency'``: The moving average of the latency of the
+              requests, in seconds (or ``None`` if no request has
+              completed yet).
+        """
+
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    async def acquire(self, req):
+        """Wait for a slot to process the given request.
+
+        Args:
+            req: The request to admit.
+
+        Returns:
+            object: An opaque token that must be passed to :meth:`release`
+            once the request has been processed, or ``None`` if the request
+            is not subject to any limit.
+
+        Raises:
+            HTTPServiceUnavailable: The request was shed.
+        """
+
+        name = self._classify(req)
+        if name is None:
+            return None
+
+        pool = self._pools.get(name)
+        if pool is None:
+            limit = self._limits.get(name, self._limit)
+            queue_size = limit if self._queue_size is None else self._queue_size
+            pool = self._pools[name] = _Pool(limit, queue_size)
+
+        if pool.in_flight < int(pool.limit) and not pool.queued:
+            pool.in_flight += 1
+            pool.admitted += 1
+            return (pool, time.monotonic())
+
+        if pool.queued >= pool.queue_size or self._queue_timeout <= 0:
+            raise self._shed(pool)
+
+        if await self._wait(pool):
+            pool.admitted += 1
+            pool.delayed += 1
+            return (pool, time.monotonic())
+
+        raise self._shed(pool)
+
+    def release(self, token):
+        """Release the slot held by a request.
+
+        Args:
+            token: The token that was returned by :meth:`acquire`.
+        """
+
+        pool, started = token
+        pool.in_flight -= 1
+        pool.record_latency(time.monotonic() - started)
+
+        if self._target_latency is not None:
+            self._adapt(pool)
+
+        pool.wake()
+
+    async def _wait(self, pool):
+        loop = get_running_loop()
+        waiter = loop.create_future()
+
+        pool.waiters.append(waiter)
+        pool.queued += 1
+
+        timer = loop.call_later(self._queue_timeout, _expire, waiter)
+        try:
+            return await waiter
+        except BaseException:
+            # NOTE(kgriffs): If the slot was handed to this request right
+            #   before it was cancelled, pass it on to the next one.
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                pool.in_flight -= 1
+                pool.wake()
+
+            raise
+        finally:
+            timer.cancel()
+            pool.queued -= 1
+
+            try:
+                pool.waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def _adapt(self, pool):
+        if pool.latency > self._target_latency:
+            pool.limit = max(self._min_limit, pool.limit * _LIMIT_BACKOFF)
+
+        # NOTE(kgriffs): Only probe for a higher limit when the current one
+        #   is actually being reached.
+        elif pool.in_flight + 1 >= int(pool.limit):
+            pool.limit = min(pool.max_limit, pool.limit + 1 / pool.limit)
+
+    def _shed(self, pool):
+        pool.shed += 1
+        return HTTPServiceUnavailable(
+            description='The server is currently overloaded. Please try again later.',
+            retry_after=self._retry_after,
+        )
+
+
+class _Pool:
+    __slots__ = [
+        'admitted',
+        'delayed',
+        'in_flight',
+        'latency',
+        'limit',
+        'max_limit',
+        'queue_size',
+        'queued',
+        'shed',
+        'waiters',
+    ]
+
+    def __init__(self, limit, queue_size):
+        self.limit = float(limit)
+        self.max_limit = limit
+        self.queue_size = queue_size
+
+        self.admitted = 0
+        self.delayed = 0
+        self.in_flight = 0
+        self.latency = None
+        self.queued = 0
+        self.shed = 0
+        self.waiters = deque()
+
+    def record_latency(self, latency):
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += (latency - self.latency) * _LATENCY_SMOOTHING
+
+    def wake(self):
+        waiters = self.waiters
+        limit = int(self.limit)
+
+        while waiters and self.in_flight < limit:
+            waiter = waiters.popleft()
+
+            # NOTE(kgriffs): Skip requests that timed out or were cancelled,
+            #   but have not resumed yet.
+            if not waiter.done():
+                waiter.set_result(True)
+                self.in_flight += 1
+
+    def stats(self):
+        return {
+            'limit': int(self.limit),
+            'in_flight': self.in_flight,
+            'queued': self.queued,
+            'admitted': self.admitted,
+            'delayed': self.delayed,
+            'shed': self.shed,
+            'latency': self.latency,
+        }
+
+
+def _classify_default(req):
+    return 'default'
+
+
+def _expire(waiter):
+    if not waiter.done():
+        waiter.set_result(False)
@@ -33,6 +33,7 @@ from falcon.http_error import HTTPError
 from falcon.http_status import HTTPStatus
 from falcon.media.multipart import MultipartFormHandler
 import falcon.routing
+from falcon.routing.static import _AsyncFileReader
 from falcon.util.misc import http_status_to_code, is_python_func
 from falcon.util.sync import (
     _should_wrap_non_coroutines,
@@ -70,6 +71,13 @@ _TYPELESS_STATUS_CODES = frozenset([
 
 _FALLBACK_WS_ERROR_CODE = 3011
 
+_SSE_PING = SSEvent()
+_SSE_PING_BYTES = _SSE_PING.serialize()
+
+# NOTE(kgriffs): The maximum number of serialized events to buffer while
+#   waiting for the previous batch to be sent, before pausing the emitter.
+_SSE_MAX_PENDING = 256
+
 
 class App(falcon.app.App):
     """This class is the main entry point into a Falcon-based ASGI app.
@@ -244,6 +252,12 @@ class App(falcon.app.App):
             before (when ``True``) or after (when ``False``) the static routes.
             This has an effect only if no route was matched. (default ``True``)
 
+        concurrency_limiter (ConcurrencyLimiter): An instance of
+            :class:`~falcon.asgi.ConcurrencyLimiter` to use in order to limit
+            the number of requests that are processed concurrently, and to
+            shed excess load (default ``None``).
+            (See also: :ref:`Admission Control <admission_control>`)
+
     Attributes:
         req_options: A set of behavioral options related to incoming
             requests. (See also: :py:class:`~.RequestOptions`)
@@ -270,12 +284,17 @@ class App(falcon.app.App):
     _default_responder_path_not_found = falcon.responders.path_not_found_async
 
     __slots__ = (
+        '_concurrency_limiter',
         'ws_options',
     )
 
-    def __init__(self, *args, request_type=Request, response_type=Response, **kwargs):
+    def __init__(
+        self, *args, request_type=Request, response_type=Response, concurrency_limiter=None,
+        **kwargs
+    ):
         super().__init__(*args, request_type=request_type, response_type=response_type, **kwargs)
 
+        self._concurrency_limiter = concurrency_limiter
         self.ws_options = WebSocketOptions()
 
         self.add_error_handler(WebSocketDisconnected, self._ws_disconnected_error_handler)
@@ -383,6 +402,28 @@ class App(falcon.app.App):
         req = self._request_type(scope, receive, first_event=first_event, options=self.req_options)
         resp = self._response_type(options=self.resp_options)
 
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            await self._handle_http(scope, receive, send, req, resp)
+            return
+
+        # NOTE(kgriffs): Admission control is performed before invoking any
+        #   middleware, so that shedding load is as cheap as possible. The
+        #   rejection is nevertheless rendered via the usual error handling
+        #   machinery, so that it can be customized by the app.
+        try:
+            token = await limiter.acquire(req)
+        except HTTPError as ex:
+            await self._handle_http(scope, receive, send, req, resp, shed_error=ex)
+            return
+
+        try:
+            await self._handle_http(scope, receive, send, req, resp)
+        finally:
+            if token is not None:
+                limiter.release(token)
+
+    async def _handle_http(self, scope, receive, send, req, resp, shed_error=None):  # noqa: C901
         if self.req_options.auto_parse_form_urlencoded:
             raise UnsupportedError(
                 'The deprecated WSGI RequestOptions.auto_parse_form_urlencoded option '
@@ -399,6 +440,9 @@ class App(falcon.app.App):
         req_succeeded = False
 
         try:
+            if shed_error is not None:
+                raise shed_error
+
             if req.method in self._META_METHODS:
                 raise HTTPBadRequest()
 
@@ -558,29 +602,40 @@ class App(falcon.app.App):
                 MEDIA_JSON, MEDIA_JSON, raise_not_found=False
             )
 
-            # TODO(kgriffs): Do we need to do anything special to handle when
-            #   a connection is closed?
-            async for event in sse_emitter:
-                if not event:
-                    event = SSEvent()
+            batch_window = self.resp_options.sse_batch_window
+            heartbeat = self.resp_options.sse_heartbeat
 
-                # NOTE(kgriffs): According to the ASGI spec, once the client
-                #   disconnects, send() acts as a no-op. We have to check
-                #   the connection state using watch_disconnect() above.
-                await send({
-                    'type': EventType.HTTP_RESPONSE_BODY,
-                    'body': event.serialize(handler),
-                    'more_body': True
-                })
-
-                if watcher.done():
-                    break
-
-            watcher.cancel()
             try:
-                await watcher
-            except asyncio.CancelledError:
-                pass
+                if batch_window or heartbeat:
+                    await _emit_sse_buffered(
+                        sse_emitter, handler, send, watcher, batch_window, heartbeat
+                    )
+                else:
+                    # TODO(kgriffs): Do we need to do anything special to handle when
+                    #   a connection is closed?
+                    async for event in sse_emitter:
+                        if not event:
+                            event = _SSE_PING
+
+                        # NOTE(kgriffs): According to the ASGI spec, once the client
+                        #   disconnects, send() acts as a no-op. We have to check
+                        #   the connection state using watch_disconnect() above.
+                        await send({
+                            'type': EventType.HTTP_RESPONSE_BODY,
+                            'body': event.serialize(handler),
+                            'more_body': True
+                        })
+
+                        if watcher.done():
+                            break
+            finally:
+                # NOTE(kgriffs): Clean up the watcher even if the emitter
+                #   raised an error.
+                watcher.cancel()
+                try:
+                    await watcher
+                except asyncio.CancelledError:
+                    pass
 
             await send({'type': EventType.HTTP_RESPONSE_BODY})
             return
@@ -620,6 +675,14 @@ class App(falcon.app.App):
         })
 
         if stream:
+            # PERF(kgriffs): Let the ASGI server send static files directly
+            #   when it supports doing so.
+            if type(stream) is _AsyncFileReader:
+                extensions = scope.get('extensions')
+                if extensions and await stream.send_with_extension(send, extensions):
+                    self._schedule_callbacks(resp)
+                    return
+
             # Detect whether this is one of the following:
             #
             #   (a) async file-like object (e.g., aiofiles)
@@ -628,8 +691,10 @@ class App(falcon.app.App):
             #
 
             if hasattr(stream, 'read'):
+                block_size = resp.stream_block_size or self._STREAM_BLOCK_SIZE
+
                 while True:
-                    data = await stream.read(self._STREAM_BLOCK_SIZE)
+                    data = await stream.read(block_size)
                     if data == b'':
                         break
                     else:
@@ -642,22 +707,29 @@ class App(falcon.app.App):
                             'more_body': True
                         })
             else:
+                min_flush_size = self.resp_options.stream_min_flush_size
+
                 # NOTE(kgriffs): Works for both async generators and iterators
                 try:
-                    async for data in stream:
-                        # NOTE(kgriffs): We can not rely on StopIteration
-                        #   because of Pep 479 that is implemented starting
-                        #   with Python 3.7. AFAICT this is only an issue
-                        #   when using an async iterator instead of an async
-                        #   generator.
-                        if data is None:
-                            break
+                    if min_flush_size:
+                        await _send_stream_coalesced(
+                            stream, send, min_flush_size, self.resp_options.stream_max_latency
+                        )
+                    else:
+                        async for data in stream:
+                            # NOTE(kgriffs): We can not rely on StopIteration
+                            #   because of Pep 479 that is implemented starting
+                            #   with Python 3.7. AFAICT this is only an issue
+                            #   when using an async iterator instead of an async
+                            #   generator.
+                            if data is None:
+                                break
 
-                        await send({
-                            'type': EventType.HTTP_RESPONSE_BODY,
-                            'body': data,
-                            'more_body': True
-                        })
+                            await send({
+                                'type': EventType.HTTP_RESPONSE_BODY,
+                                'body': data,
+                                'more_body': True
+                            })
                 except TypeError as ex:
                     if isasyncgenfunction(stream):
                         raise TypeError(
@@ -1051,3 +1123,218 @@ class App(falcon.app.App):
                     exc_info=True
                 )
                 raise
+
+
+async def _emit_sse_buffered(emitter, handler, send, watcher, batch_window, heartbeat):
+    """Send Server-Sent Events, coalescing writes and/or emitting heartbeats.
+
+    The emitter is run in a separate task that serializes events into a
+    shared buffer, which is then flushed by this coroutine, either after
+    waiting `batch_window` seconds for more events, or as soon as possible
+    when batching is disabled. When no events are emitted for `heartbeat`
+    seconds, a ping comment is sent instead.
+    """
+
+    loop = get_running_loop()
+
+    pending = []
+    wakeup = asyncio.Event()
+    drained = asyncio.Event()
+    producer_done = False
+
+    async def produce():
+        nonlocal producer_done
+
+        try:
+            async for event in emitter:
+                pending.append(event.serialize(handler) if event else _SSE_PING_BYTES)
+                wakeup.set()
+
+                if len(pending) >= _SSE_MAX_PENDING:
+                    drained.clear()
+                    await drained.wait()
+        finally:
+            producer_done = True
+            wakeup.set()
+
+    producer = falcon.create_task(produce())
+
+    # NOTE(kgriffs): Wake up as soon as the client disconnects, rather than
+    #   waiting for the next event or heartbeat.
+    watcher.add_done_callback(lambda _: wakeup.set())
+
+    try:
+        while not watcher.done():
+            if not pending and not producer_done:
+                wakeup.clear()
+
+                timeout_handle = loop.call_later(heartbeat, wakeup.set) if heartbeat else None
+                try:
+                    await wakeup.wait()
+                finally:
+                    if timeout_handle is not None:
+                        timeout_handle.cancel()
+
+                if watcher.done():
+                    break
+
+            if pending:
+                if batch_window and not producer_done:
+                    # NOTE(kgriffs): Give the emitter a chance to produce
+                    #   more events so that they can be sent in one go.
+                    await asyncio.sleep(batch_window)
+
+                    if watcher.done():
+                        break
+
+                body = b''.join(pending)
+                pending.clear()
+                drained.set()
+
+            elif producer_done:
+                break
+
+            else:
+                body = _SSE_PING_BYTES
+
+            # NOTE(kgriffs): According to the ASGI spec, once the client
+            #   disconnects, send() acts as a no-op, so we rely on the
+            #   watcher to detect disconnects (see also: __call__).
+            await send({
+                'type': EventType.HTTP_RESPONSE_BODY,
+                'body': body,
+                'more_body': True
+            })
+
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+        try:
+            # NOTE(kgriffs): Propagate any error raised by the emitter.
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def _send_stream_coalesced(stream, send, min_flush_size, max_latency):
+    """Stream a response body, coalescing small chunks into larger body events.
+
+    Chunks are buffered until at least `min_flush_size` bytes are available.
+    If `max_latency` is set, the stream is iterated in a separate task so
+    that buffered chunks can also be flushed once the oldest one has been
+    held for `max_latency` seconds, even if the stream stalls in the meantime.
+    """
+
+    if max_latency:
+        await _send_stream_coalesced_timed(stream, send, min_flush_size, max_latency)
+        return
+
+    chunks = []
+    size = 0
+
+    async for data in stream:
+        # NOTE(kgriffs): See also the notes in App.__call__().
+        if data is None:
+            break
+
+        chunks.append(data)
+        size += len(data)
+
+        if size >= min_flush_size:
+            await send({
+                'type': EventType.HTTP_RESPONSE_BODY,
+                'body': b''.join(chunks),
+                'more_body': True
+            })
+
+            chunks.clear()
+            size = 0
+
+    if chunks:
+        await send({
+            'type': EventType.HTTP_RESPONSE_BODY,
+            'body': b''.join(chunks),
+            'more_body': True
+        })
+
+
+async def _send_stream_coalesced_timed(stream, send, min_flush_size, max_latency):
+    loop = get_running_loop()
+
+    chunks = []
+    size = 0
+    deadline = None
+    done = False
+
+    wakeup = asyncio.Event()
+    drained = asyncio.Event()
+
+    async def produce():
+        nonlocal size, deadline, done
+
+        try:
+            async for data in stream:
+                if data is None:
+                    break
+
+                if not chunks:
+                    deadline = loop.time() + max_latency
+                    wakeup.set()
+
+                chunks.append(data)
+                size += len(data)
+
+                if size >= min_flush_size:
+                    wakeup.set()
+
+                    # NOTE(kgriffs): Apply backpressure to the stream while
+                    #   the buffered chunks are being sent.
+                    drained.clear()
+                    await drained.wait()
+        finally:
+            done = True
+            wakeup.set()
+
+    producer = falcon.create_task(produce())
+
+    try:
+        while True:
+            if chunks and (done or size >= min_flush_size or loop.time() >= deadline):
+                body = b''.join(chunks)
+                chunks.clear()
+                size = 0
+                drained.set()
+
+                await send({
+                    'type': EventType.HTTP_RESPONSE_BODY,
+                    'body': body,
+                    'more_body': True
+                })
+
+                continue
+
+            if done:
+                break
+
+            wakeup.clear()
+
+            timeout_handle = None
+            if chunks:
+                timeout_handle = loop.call_later(deadline - loop.time(), wakeup.set)
+
+            try:
+                await wakeup.wait()
+            finally:
+                if timeout_handle is not None:
+                    timeout_handle.cancel()
+
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+        try:
+            # NOTE(kgriffs): Propagate any error raised by the stream.
+            await producer
+        except asyncio.CancelledError:
+            pass
@@ -15,26 +15,69 @@
 """ASGI multipart form media handler components."""
 
 import cgi
+import collections
 
 from falcon.asgi.reader import BufferedReader
-from falcon.errors import DelimiterError
 from falcon.media import multipart
 
-_ALLOWED_CONTENT_HEADERS = multipart._ALLOWED_CONTENT_HEADERS
 _CRLF = multipart._CRLF
 _CRLF_CRLF = multipart._CRLF_CRLF
+_UNSUPPORTED_CTE_MSG = multipart._UNSUPPORTED_CTE_MSG
+
+_parse_headers = multipart._parse_headers
 
 MultipartParseError = multipart.MultipartParseError
 
+# NOTE(vytas): Parser states.
+_PROLOGUE = 0
+_SEPARATOR = 1
+_HEADERS = 2
+_BODY = 3
+
+# NOTE(vytas): Parser events.
+_PART = 0
+_DATA = 1
+_END = 2
+_ERROR = 3
+
 
 class BodyPart(multipart.BodyPart):
 
+    _stream = None
+
+    def __init__(self, source, headers, parse_options):
+        # NOTE(vytas): The stream is only wrapped in a BufferedReader when
+        #   actually referenced by the app; get_data() consumes the part
+        #   data chunks directly as they are produced by the form parser.
+        self._source = source
+        self._headers = headers
+        self._parse_options = parse_options
+
+    @property
+    def stream(self):
+        if self._stream is None:
+            self._stream = BufferedReader(self._source)
+        return self._stream
+
     async def get_data(self):
         if self._data is None:
-            max_size = self._parse_options.max_body_part_buffer_size + 1
-            self._data = await self.stream.read(max_size)
-            if len(self._data) >= max_size:
-                raise MultipartParseError(description='body part is too large')
+            max_size = self._parse_options.max_body_part_buffer_size
+
+            if self._stream is not None:
+                self._data = await self._stream.read(max_size + 1)
+                if len(self._data) > max_size:
+                    raise MultipartParseError(description='body part is too large')
+                return self._data
+
+            chunks = []
+            size = 0
+            async for chunk in self._source:
+                size += len(chunk)
+                if size > max_size:
+                    raise MultipartParseError(description='body part is too large')
+                chunks.append(chunk)
+
+            self._data = chunks[0] if len(chunks) == 1 else b''.join(chunks)
 
         return self._data
 
@@ -70,90 +113,235 @@ class BodyPart(multipart.BodyPart):
     text = property(get_text)
 
 
+class _MultipartParser:
+    """Push-style multipart form parser.
+
+    Chunks of the request body are fed to the parser as they are received
+    from the ASGI server, and parsed synchronously into a queue of events,
+    without any intermediate awaiting or re-buffering of the input stream.
+
+    The following events are appended to :attr:`events` as
+    ``(event, value)`` tuples:
+
+    * ``_PART``: a new body part starts; the value is a dict of its headers.
+    * ``_DATA``: a chunk of the current body part's content.
+    * ``_END``: the closing boundary delimiter was encountered.
+    * ``_ERROR``: the form is malformed; the value is an instance of
+      :class:`MultipartParseError`. No further events are produced.
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_dash_boundary',
+        '_delimiter',
+        '_max_headers_size',
+        '_max_part_count',
+        '_part_count',
+        '_state',
+        'done',
+        'events',
+    )
+
+    def __init__(self, boundary, parse_options):
+        self._buffer = b''
+        # NOTE(vytas): RFC 7578, section 4.1.
+        #   As with other multipart types, the parts are delimited with a
+        #   boundary delimiter, constructed using CRLF, "--", and the value
+        #   of the "boundary" parameter.
+        #   However, the first delimiter may directly follow an empty
+        #   prologue, hence it is not prepended with CRLF.
+        self._dash_boundary = b'--' + boundary
+        self._delimiter = _CRLF + self._dash_boundary
+        self._max_headers_size = parse_options.max_body_part_headers_size
+        self._max_part_count = parse_options.max_body_part_count
+        self._part_count = 0
+        self._state = _PROLOGUE
+
+        self.done = False
+        self.events = collections.deque()
+
+    def feed(self, chunk):
+        if self.done or not chunk:
+            return
+
+        buffer = self._buffer + chunk if self._buffer else chunk
+        try:
+            self._buffer = self._parse(buffer)
+        except MultipartParseError as err:
+            self._fail(err)
+
+    def close(self):
+        if self.done:
+            return
+
+        if self._state == _HEADERS:
+            description = 'incomplete body part headers'
+        else:
+            # NOTE(vytas): Similar to the delimited stream in the WSGI case,
+            #   yield what is left of a truncated body part before reporting
+            #   the error.
+            if self._state == _BODY and self._buffer:
+                self.events.append((_DATA, self._buffer))
+            description = 'unexpected form structure'
+
+        self._fail(MultipartParseError(description=description))
+
+    def _fail(self, error):
+        self._buffer = b''
+        self.done = True
+        self.events.append((_ERROR, error))
+
+    def _parse(self, buffer):
+        pos = 0
+        parsers = (
+            self._parse_prologue,
+            self._parse_separator,
+            self._parse_part_headers,
+            self._parse_body,
+        )
+
+        # NOTE(vytas): Each state parser returns the new position in the
+        #   buffer, and whether it needs more data in order to proceed.
+        while not self.done:
+            pos, incomplete = parsers[self._state](buffer, pos)
+            if incomplete:
+                return buffer[pos:]
+
+        return b''
+
+    def _parse_prologue(self, buffer, pos):
+        dash_boundary = self._dash_boundary
+        index = buffer.find(dash_boundary, pos)
+
+        if index < 0:
+            return max(pos, len(buffer) - len(dash_boundary) + 1), True
+
+        self._state = _SEPARATOR
+        return index + len(dash_boundary), False
+
+    def _parse_separator(self, buffer, pos):
+        separator = buffer[pos:pos + 4]
+        if separator[:2] == _CRLF:
+            self._state = _HEADERS
+            return pos + 2, False
+
+        if len(separator) < 4:
+            return pos, True
+
+        if separator != b'--' + _CRLF:
+            raise MultipartParseError(description='unexpected form structure')
+
+        # NOTE(vytas): boundary delimiter + '--\r\n' signals the end of a
+        #   multipart form.
+        self.done = True
+        self.events.append((_END, None))
+        return pos + 4, False
+
+    def _parse_part_headers(self, buffer, pos):
+        max_headers_size = self._max_headers_size
+        index = buffer.find(_CRLF_CRLF, pos)
+
+        if index < 0 or index - pos > max_headers_size:
+            if index >= 0 or len(buffer) - pos > max_headers_size + 3:
+                raise MultipartParseError(description='incomplete body part headers')
+            return pos, True
+
+        headers = _parse_headers(buffer[pos:index])
+        if headers is None:
+            raise MultipartParseError(description=_UNSUPPORTED_CTE_MSG)
+
+        self._part_count += 1
+        if 0 < self._max_part_count < self._part_count:
+            raise MultipartParseError(
+                description='maximum number of form body parts exceeded'
+            )
+
+        self.events.append((_PART, headers))
+        self._state = _BODY
+        return index + 4, False
+
+    def _parse_body(self, buffer, pos):
+        delimiter = self._delimiter
+        index = buffer.find(delimiter, pos)
+
+        if index < 0:
+            # NOTE(vytas): Retain just enough data to detect a delimiter
+            #   straddling the next chunk.
+            end = len(buffer) - len(delimiter) + 1
+            if end > pos:
+                self.events.append((_DATA, buffer[pos:end]))
+                pos = end
+            return pos, True
+
+        if index > pos:
+            self.events.append((_DATA, buffer[pos:index]))
+
+        self._state = _SEPARATOR
+        return index + len(delimiter), False
+
+
 class MultipartForm:
 
     def __init__(self, stream, boundary, content_length, parse_options):
-        self._stream = stream if isinstance(stream, BufferedReader) else BufferedReader(stream)
+        self._stream = stream
+        self._source = None
         self._boundary = boundary
-        # NOTE(vytas): Here self._dash_boundary is not prepended with CRLF
-        #   (yet) for parsing the prologue. The CRLF will be prepended later to
-        #   construct the inter-part delimiter as per RFC 7578, section 4.1
-        #   (see the note below).
-        self._dash_boundary = b'--' + boundary
+        self._parser = _MultipartParser(boundary, parse_options)
         self._parse_options = parse_options
+        self._part_index = 0
 
     def __aiter__(self):
         return self._iterate_parts()
 
+    async def _receive(self):
+        # NOTE(vytas): Both the request stream and BufferedReader yield body
+        #   chunks as they arrive when iterated over asynchronously; in the
+        #   former case, these map directly to ASGI http.request events.
+        if self._source is None:
+            self._source = self._stream.__aiter__()
+
+        try:
+            chunk = await self._source.__anext__()
+        except StopAsyncIteration:
+            self._parser.close()
+        else:
+            self._parser.feed(chunk)
+
+    async def _iterate_part_data(self, index):
+        events = self._parser.events
+
+        while self._part_index == index:
+            if not events:
+                if self._parser.done:
+                    break
+                await self._receive()
+                continue
+
+            event, value = events[0]
+            if event != _DATA:
+                break
+
+            events.popleft()
+            yield value
+
     async def _iterate_parts(self):
-        prologue = True
-        delimiter = self._dash_boundary
-        stream = self._stream
-        max_headers_size = self._parse_options.max_body_part_headers_size
-        remaining_parts = self._parse_options.max_body_part_count
+        events = self._parser.events
 
         while True:
-            # NOTE(vytas): Either exhaust the unused stream part, or skip
-            #   the prologue.
-            try:
-                await stream.pipe_until(delimiter, consume_delimiter=True)
-
-                if prologue:
-                    # NOTE(vytas): RFC 7578, section 4.1.
-                    #   As with other multipart types, the parts are delimited
-                    #   with a boundary delimiter, constructed using CRLF,
-                    #   "--", and the value of the "boundary" parameter.
-                    delimiter = _CRLF + delimiter
-                    prologue = False
-
-                separator = await stream.read_until(
-                    _CRLF, 2, consume_delimiter=True)
-                if separator == b'--':
-                    # NOTE(vytas): boundary delimiter + '--\r\n' signals the
-                    # end of a multipart form.
-                    break
-                elif separator:
-                    raise MultipartParseError(description='unexpected form structure')
+            if not events:
+                await self._receive()
+                continue
 
-            except DelimiterError as err:
-                raise MultipartParseError(description='unexpected form structure') from err
+            event, value = events.popleft()
 
-            headers = {}
-            try:
-                headers_block = await stream.read_until(
-                    _CRLF_CRLF, max_headers_size, consume_delimiter=True)
-            except DelimiterError as err:
-                raise MultipartParseError(description='incomplete body part headers') from err
-
-            for line in headers_block.split(_CRLF):
-                name, sep, value = line.partition(b': ')
-                if sep:
-                    name = name.lower()
-
-                    # NOTE(vytas): RFC 7578, section 4.5.
-                    #   This use is deprecated for use in contexts that support
-                    #   binary data such as HTTP. Senders SHOULD NOT generate
-                    #   any parts with a Content-Transfer-Encoding header
-                    #   field.
-                    #
-                    #   Currently, no deployed implementations that send such
-                    #   bodies have been discovered.
-                    if name == b'content-transfer-encoding' and value != b'binary':
-                        raise MultipartParseError(
-                            description=('the deprecated Content-Transfer-Encoding '
-                                         'header field is unsupported')
-                        )
-                    # NOTE(vytas): RFC 7578, section 4.8.
-                    #   Other header fields MUST NOT be included and MUST be
-                    #   ignored.
-                    elif name in _ALLOWED_CONTENT_HEADERS:
-                        headers[name] = value
-
-            remaining_parts -= 1
-            if remaining_parts < 0 < self._parse_options.max_body_part_count:
-                raise MultipartParseError(
-                    description='maximum number of form body parts exceeded'
-                )
-
-            yield BodyPart(stream.delimit(delimiter), headers,
-                           self._parse_options)
+            if event == _PART:
+                self._part_index += 1
+                yield BodyPart(self._iterate_part_data(self._part_index),
+                               value, self._parse_options)
+            elif event == _END:
+                break
+            elif event == _ERROR:
+                raise value
+
+            # NOTE(vytas): Data of any body parts left unconsumed by the app
+            #   is simply discarded.
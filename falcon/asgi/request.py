@@ -23,7 +23,7 @@ import falcon.media
 import falcon.request
 from falcon.util.uri import parse_host, parse_query_string
 from . import _request_helpers as asgi_helpers
-from .stream import BoundedStream
+from .stream import _DecodedStream, BoundedStream
 
 
 __all__ = ['Request']
@@ -533,6 +533,11 @@ class Request(falcon.request.Request):
                 content_length=self.content_length
             )
 
+            decoder = helpers._create_body_decoder(
+                self.get_header('Content-Encoding'), self.options)
+            if decoder is not None:
+                self._stream = _DecodedStream(self._stream, decoder)
+
         return self._stream
 
     # NOTE(kgriffs): This is provided as an alias in order to ease migration
@@ -756,14 +761,20 @@ class Request(falcon.request.Request):
             self.options.default_media_type
         )
 
+        stream = self.stream
+
+        # NOTE(kgriffs): The length of a decompressed body is not known
+        #   up front.
+        content_length = None if type(stream) is _DecodedStream else self.content_length
+
         try:
             if deserialize_sync:
-                self._media = deserialize_sync(await self.stream.read())
+                self._media = deserialize_sync(await stream.read())
             else:
                 self._media = await handler.deserialize_async(
-                    self.stream,
+                    stream,
                     self.content_type,
-                    self.content_length
+                    content_length
                 )
 
         except errors.MediaNotFoundError as err:
@@ -107,6 +107,17 @@ class Response(falcon.response.Response):
                 If the stream length is known in advance, you may wish to
                 also set the Content-Length header on the response.
 
+            Note:
+                Many tiny chunks yielded by an async iterable may be
+                coalesced into larger body events by setting
+                :attr:`~falcon.ResponseOptions.stream_min_flush_size`.
+
+        stream_block_size (int): The number of bytes to request per
+            ``read()`` when :py:attr:`~.stream` is a file-like object
+            (default ``None``, meaning that the app's default block size of
+            8 KiB is used). Larger blocks reduce the number of reads and
+            body events for large files, at the expense of memory.
+
         sse (coroutine): A Server-Sent Event (SSE) emitter, implemented as
             an async iterator or generator that yields a series of
             of :py:class:`falcon.asgi.SSEvent` instances. Each event will be
@@ -195,6 +206,8 @@ class Response(falcon.response.Response):
     _sse = None
     _registered_callbacks = None
 
+    stream_block_size = None
+
     @property
     def sse(self):
         return self._sse
@@ -263,19 +276,24 @@ class Response(falcon.response.Response):
                     if not self.content_type:
                         self.content_type = self.options.default_media_type
 
-                    handler, serialize_sync, _ = self.options.media_handlers._resolve(
-                        self.content_type,
-                        self.options.default_media_type
-                    )
-
-                    if serialize_sync:
-                        self._media_rendered = serialize_sync(self._media)
-                    else:
-                        self._media_rendered = await handler.serialize_async(
-                            self._media,
-                            self.content_type
+                    self._media_rendered = self._get_cached_media()
+
+                    if self._media_rendered is _UNSET:
+                        handler, serialize_sync, _ = self.options.media_handlers._resolve(
+                            self.content_type,
+                            self.options.default_media_type
                         )
 
+                        if serialize_sync:
+                            self._media_rendered = serialize_sync(self._media)
+                        else:
+                            self._media_rendered = await handler.serialize_async(
+                                self._media,
+                                self.content_type
+                            )
+
+                        self._cache_rendered_media()
+
                 data = self._media_rendered
         else:
             try:
@@ -459,3 +459,125 @@ class BoundedStream:
             #   few more CPU cycles.
             if not ('more_body' in event and event['more_body']):
                 self._bytes_remaining = 0
+
+
+class _DecodedStream:
+    """Wrap a BoundedStream in order to decompress the request body.
+
+    Args:
+        stream (BoundedStream): The stream to read the compressed body from.
+        decoder: The decoder to use for decompressing the body (see also:
+            :class:`falcon.request_helpers._BodyDecoder`).
+    """
+
+    __slots__ = ['_buffer', '_chunks', '_decoder', '_eof', '_stream']
+
+    def __init__(self, stream, decoder):
+        self._stream = stream
+        self._decoder = decoder
+        self._buffer = b''
+        self._chunks = None
+        self._eof = False
+
+    def __aiter__(self):
+        return self._iter_content()
+
+    def isatty(self):
+        """Return ``False`` always."""
+        return False
+
+    def readable(self):
+        """Return ``True`` always."""
+        return True
+
+    def seekable(self):
+        """Return ``False`` always."""
+        return False
+
+    def writable(self):
+        """Return ``False`` always."""
+        return False
+
+    @property
+    def closed(self):
+        return self._stream.closed
+
+    @property
+    def eof(self):
+        return self._eof and not self._buffer
+
+    def close(self):
+        """Clear any buffered data and close this stream."""
+
+        self._buffer = b''
+        self._eof = True
+        self._stream.close()
+
+    async def exhaust(self):
+        """Consume and discard any remaining data without decompressing it."""
+
+        self._buffer = b''
+        self._eof = True
+        await self._stream.exhaust()
+
+    async def readall(self):
+        """Read, decompress, and return all remaining data in the request body.
+
+        Returns:
+            bytes: The decompressed request body data, or ``b''`` if the body
+            is empty or has already been consumed.
+        """
+
+        chunks = [self._buffer]
+        self._buffer = b''
+
+        while not self._eof:
+            chunks.append(await self._read_chunk())
+
+        return b''.join(chunks)
+
+    async def read(self, size=None):
+        """Read and decompress some or all of the remaining bytes in the request body.
+
+        Args:
+            size (int): The maximum number of decompressed bytes to read. If
+                not specified, all remaining data is read and returned.
+
+        Returns:
+            bytes: The decompressed request body data, or ``b''`` if the body
+            is empty or has already been consumed.
+        """
+
+        if size is None or size == -1:
+            return await self.readall()
+
+        while len(self._buffer) < size and not self._eof:
+            self._buffer += await self._read_chunk()
+
+        data = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return data
+
+    async def _iter_content(self):
+        if self._buffer:
+            data = self._buffer
+            self._buffer = b''
+            yield data
+
+        while not self._eof:
+            data = await self._read_chunk()
+            if data:
+                yield data
+
+    async def _read_chunk(self):
+        if self._chunks is None:
+            self._chunks = self._stream.__aiter__()
+
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._eof = True
+            self._decoder.finish()
+            return b''
+
+        return self._decoder.decode(chunk)
@@ -1,8 +1,11 @@
+from collections import deque
+from itertools import islice
+
 from falcon.constants import MEDIA_JSON
 from falcon.media.json import _DEFAULT_JSON_HANDLER
 
 
-__all__ = ['SSEvent']
+__all__ = ['SSEReplayBuffer', 'SSEvent']
 
 
 class SSEvent:
@@ -54,6 +57,13 @@ class SSEvent:
             not specify any of these fields when initializing the
             `SSEvent` instance.)
 
+    Note:
+        The serialized representation of an event is cached upon its first
+        serialization, so that an event that is yielded to many clients
+        (for instance, when broadcasting a notification to every
+        subscriber) is only serialized once. Therefore, an event's attributes
+        should not be modified once it has been yielded.
+
 
     .. _Server-Sent Events:
         https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events
@@ -68,6 +78,7 @@ class SSEvent:
         'event_id',
         'retry',
         'comment',
+        '_serialized',
     ]
 
     def __init__(
@@ -112,6 +123,8 @@ class SSEvent:
 
         self.comment = comment
 
+        self._serialized = None
+
     def serialize(self, handler=None):
         """Serialize this event to string.
 
@@ -123,6 +136,18 @@ class SSEvent:
         Returns:
             bytes: string representation of this event.
         """
+
+        # PERF(kgriffs): Since the handler is normally the same for all
+        #   responses, simply check its identity.
+        serialized = self._serialized
+        if serialized is not None and serialized[0] is handler:
+            return serialized[1]
+
+        result = self._serialize(handler)
+        self._serialized = (handler, result)
+        return result
+
+    def _serialize(self, handler):
         if self.comment is not None:
             block = f': {self.comment}\n'
         else:
@@ -159,3 +184,110 @@ class SSEvent:
             return b': ping\n\n'
 
         return (block + '\n').encode()
+
+
+class SSEReplayBuffer:
+    """A bounded buffer of recent events for resuming event streams.
+
+    When a user agent reconnects to an event stream, it sends the ID of the
+    last event it received in the ``Last-Event-ID`` header. By recording
+    recently emitted events in a replay buffer, the app can send the
+    events that the user agent missed while it was disconnected, before
+    resuming the live stream::
+
+        history = falcon.asgi.SSEReplayBuffer(maxlen=1000)
+
+        class Notifications:
+            async def on_get(self, req, resp):
+                async def emitter():
+                    missed = history.replay(req.get_header('Last-Event-ID'))
+                    if missed is None:
+                        # NOTE: The last event seen by the client is too old,
+                        #   so tell the client to start from scratch.
+                        yield SSEvent(event='reset')
+                    else:
+                        for event in missed:
+                            yield event
+
+                    async for event in subscribe():
+                        yield event
+
+                resp.sse = emitter()
+
+        async def publish(event):
+            history.append(event)
+            # ...
+
+    Since the serialized representation of an event is cached (see also:
+    :class:`~.SSEvent`), replayed events are not serialized anew.
+
+    Keyword Args:
+        maxlen (int): The maximum number of events to retain (default
+            ``1024``). When the buffer is full, the oldest events are
+            discarded as new ones are appended.
+    """
+
+    __slots__ = ['_events', '_ids', '_maxlen', '_seq']
+
+    def __init__(self, maxlen=1024):
+        if maxlen < 1:
+            raise ValueError('maxlen must be a positive integer')
+
+        self._events = deque()
+        self._ids = {}
+        self._maxlen = maxlen
+
+        # NOTE(kgriffs): Sequence number of the next event to be appended.
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._events)
+
+    def append(self, event):
+        """Record an event.
+
+        Args:
+            event (SSEvent): The event to record. The event must have an
+                `event_id`, and IDs should be unique within the buffer. If an
+                ID is reused, replaying will resume from its latest
+                occurrence.
+        """
+
+        event_id = event.event_id
+        if event_id is None:
+            raise ValueError('Only events with an event_id may be recorded')
+
+        events = self._events
+        if len(events) >= self._maxlen:
+            oldest_seq, oldest = events.popleft()
+            if self._ids.get(oldest.event_id) == oldest_seq:
+                del self._ids[oldest.event_id]
+
+        events.append((self._seq, event))
+        self._ids[event_id] = self._seq
+        self._seq += 1
+
+    def replay(self, last_event_id):
+        """Get the events that were recorded after the given event ID.
+
+        Args:
+            last_event_id (str): The ID of the last event received by the
+                user agent, normally taken from the ``Last-Event-ID``
+                request header. If ``None``, no events are replayed.
+
+        Returns:
+            list: A list of events in the order they were recorded (which
+            is empty if the user agent is up to date), or ``None`` if
+            `last_event_id` is no longer (or was never) in the buffer.
+        """
+
+        if last_event_id is None:
+            return []
+
+        seq = self._ids.get(last_event_id)
+        if seq is None:
+            return None
+
+        events = self._events
+        first_seq = events[0][0]
+        return [event for __, event in islice(events, seq - first_seq + 1, None)]
@@ -8,6 +8,7 @@ from typing import (
     Deque,
     Dict,
     Iterable,
+    List,
     Mapping,
     Optional,
     Union,
@@ -22,7 +23,7 @@ from falcon.constants import WebSocketPayloadType
 _WebSocketState = Enum('_WebSocketState', 'HANDSHAKE ACCEPTED CLOSED')
 
 
-__all__ = ['WebSocket']
+__all__ = ['BroadcastGroup', 'WebSocket']
 
 
 class WebSocket:
@@ -342,6 +343,45 @@ class WebSocket:
             'bytes': bytes(payload),
         })
 
+    async def send_many(
+        self,
+        media: Iterable[object],
+        payload_type: WebSocketPayloadType = WebSocketPayloadType.TEXT
+    ) -> None:
+        """Send a batch of serializable objects to the client.
+
+        This method is equivalent to awaiting :meth:`~.send_media` for each
+        object in turn, but the connection state is only validated once, and
+        all objects are serialized up front, so that the batch is handed over
+        to the ASGI server in a tight loop.
+
+        Arguments:
+            media (Iterable[object]): The objects to send, one message per
+                object.
+
+        Keyword Arguments:
+            payload_type (falcon.WebSocketPayloadType): The payload type to
+                use for the messages (default ``falcon.WebSocketPayloadType.TEXT``).
+                See also: :meth:`~.send_media`.
+        """
+
+        self._require_accepted()
+
+        if payload_type is WebSocketPayloadType.TEXT:
+            serialize = self._mh_text_serialize
+            key = 'text'
+        else:
+            serialize = self._mh_bin_serialize
+            key = 'bytes'
+
+        events = [
+            {'type': EventType.WS_SEND, key: serialize(item)}
+            for item in media
+        ]
+
+        for event in events:
+            await self._send(event)
+
     async def receive_text(self) -> str:
         """Receive a message from the client with a Unicode string payload.
 
@@ -401,6 +441,50 @@ class WebSocket:
 
         event = await self._receive()
 
+        return self._deserialize_media(event)
+
+    async def receive_many(
+        self,
+        max_n: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> List[object]:
+        """Receive a batch of deserialized objects from the client.
+
+        Awaiting this coroutine will block until at least one message is
+        available, and then drain any other messages that are already
+        enqueued by the framework at once (see also:
+        :attr:`WebSocketOptions.max_receive_queue`), without any further
+        waiting. Each message is deserialized in the same way as by
+        :meth:`~.receive_media`.
+
+        If the client disconnects after sending a number of messages, the
+        messages received prior to the disconnect are returned first, and
+        the next call raises :class:`~falcon.WebSocketDisconnected`.
+
+        Keyword Arguments:
+            max_n (int): The maximum number of messages to return
+                (default ``None``, meaning no limit).
+            timeout (float): The maximum number of seconds to wait for the
+                first message (default ``None``, meaning to wait
+                indefinitely). If no message is received within the timeout,
+                an empty list is returned.
+
+        Returns:
+            list: The deserialized objects, in the order received.
+        """
+
+        self._require_accepted()
+
+        if max_n is not None and max_n < 1:
+            raise ValueError('max_n must be a positive integer')
+
+        events = await self._buffered_receiver.receive_many(max_n, timeout)
+
+        # NOTE(kgriffs): A disconnect event can only be returned on its own,
+        #   in which case _handle_event() raises WebSocketDisconnected.
+        return [self._deserialize_media(self._handle_event(event)) for event in events]
+
+    def _deserialize_media(self, event: dict) -> object:
         # NOTE(kgriffs): Most likely case is going to be JSON via text
         #   payload, so try that first.
         text = event.get('text')
@@ -448,8 +532,9 @@ class WebSocket:
             raise
 
     async def _receive(self) -> dict:
-        event = await self._asgi_receive()
+        return self._handle_event(await self._asgi_receive())
 
+    def _handle_event(self, event: dict) -> dict:
         event_type = event['type']
 
         if event_type != EventType.WS_RECEIVE:
@@ -557,6 +642,346 @@ class WebSocketOptions:
         self.max_receive_queue: int = 4
 
 
+class BroadcastGroup:
+    """A group of WebSocket connections to broadcast messages to.
+
+    Each broadcast message is serialized only once, and the resulting
+    event is then shared by all members of the group. Every member has its
+    own bounded queue of pending messages, which is drained by a dedicated
+    task, so that a single slow client does not hold up the rest of the
+    group::
+
+        group = falcon.asgi.BroadcastGroup(app.ws_options.media_handlers)
+
+        class Feed:
+            async def on_websocket(self, req, ws):
+                await ws.accept()
+                group.add(ws)
+
+                try:
+                    while True:
+                        await ws.receive_text()
+                except falcon.WebSocketDisconnected:
+                    await group.remove(ws)
+
+        # ...and elsewhere in the app:
+        group.broadcast({'ticker': 'FLCN', 'price': 42.0})
+
+    When a member's queue is full, the `slow_consumer` policy determines
+    what happens to the message for that member:
+
+    * ``'drop'``: the new message is dropped.
+    * ``'drop_oldest'``: the oldest pending message is dropped in favor of
+      the new one.
+    * ``'disconnect'``: any pending messages are discarded, and the
+      connection is closed using `close_code`.
+
+    Members that disconnect are automatically removed from the group.
+
+    Keyword Args:
+        media_handlers (dict): A dict-like object mapping WebSocket payload
+            types to media handlers, used to serialize broadcast media (see
+            also: :attr:`WebSocketOptions.media_handlers`). Defaults to the
+            same handlers as used by :class:`WebSocketOptions`.
+        max_queue (int): The maximum number of pending messages per member
+            (default ``64``).
+        slow_consumer (str): The policy to apply when a member's queue is
+            full (default ``'drop'``).
+        close_code (int): The close code to use when disconnecting slow
+            consumers (default ``1008``, "Policy Violation").
+    """
+
+    __slots__ = (
+        '_close_code',
+        '_dropped',
+        '_max_queue',
+        '_mh_bin_serialize',
+        '_mh_text_serialize',
+        '_members',
+        '_sent',
+        '_slow_consumer',
+        '_slow_consumers_disconnected',
+    )
+
+    _SLOW_CONSUMER_POLICIES = frozenset(('drop', 'drop_oldest', 'disconnect'))
+
+    def __init__(
+        self,
+        media_handlers: Optional[Mapping[
+            WebSocketPayloadType,
+            Union[media.BinaryBaseHandlerWS, media.TextBaseHandlerWS]
+        ]] = None,
+        max_queue: int = 64,
+        slow_consumer: str = 'drop',
+        close_code: int = WSCloseCode.POLICY_VIOLATION,
+    ):
+        if max_queue < 1:
+            raise ValueError('max_queue must be a positive integer')
+        if slow_consumer not in self._SLOW_CONSUMER_POLICIES:
+            raise ValueError(
+                'slow_consumer must be one of: {}'.format(
+                    ', '.join(sorted(self._SLOW_CONSUMER_POLICIES)))
+            )
+
+        if media_handlers is None:
+            media_handlers = WebSocketOptions().media_handlers
+
+        self._mh_text_serialize = media_handlers[WebSocketPayloadType.TEXT].serialize
+        self._mh_bin_serialize = media_handlers[WebSocketPayloadType.BINARY].serialize
+
+        self._close_code = close_code
+        self._max_queue = max_queue
+        self._slow_consumer = slow_consumer
+
+        self._members: Dict[WebSocket, _BroadcastMember] = {}
+
+        self._dropped = 0
+        self._sent = 0
+        self._slow_consumers_disconnected = 0
+
+    def __contains__(self, ws: WebSocket) -> bool:
+        return ws in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def add(self, ws: WebSocket) -> None:
+        """Add an accepted WebSocket connection to the group.
+
+        Adding a connection that is already a member of the group is a no-op.
+
+        Arguments:
+            ws (falcon.asgi.WebSocket): The connection to add.
+        """
+
+        if not ws.ready:
+            raise errors.OperationNotAllowed(
+                'Only accepted WebSocket connections may be added to a broadcast group'
+            )
+
+        if ws not in self._members:
+            member = _BroadcastMember(ws)
+            member.task = falcon.create_task(self._run(member))
+            self._members[ws] = member
+
+    async def remove(self, ws: WebSocket) -> None:
+        """Remove a WebSocket connection from the group.
+
+        Any messages pending for the connection are discarded. Removing a
+        connection that is not a member of the group is a no-op.
+
+        Arguments:
+            ws (falcon.asgi.WebSocket): The connection to remove.
+        """
+
+        member = self._members.pop(ws, None)
+        if member is not None:
+            await member.stop()
+
+    async def close(self) -> None:
+        """Remove all connections from the group.
+
+        The connections themselves are not closed.
+        """
+
+        members = list(self._members.values())
+        self._members.clear()
+
+        for member in members:
+            await member.stop()
+
+    def broadcast(
+        self,
+        media: object,
+        payload_type: WebSocketPayloadType = WebSocketPayloadType.TEXT
+    ) -> int:
+        """Serialize an object once, and enqueue it for all members.
+
+        The payload type determines the media handler that will be used to
+        serialize the given object (see also: :meth:`WebSocket.send_media`).
+
+        Arguments:
+            media (object): The object to broadcast.
+
+        Keyword Arguments:
+            payload_type (falcon.WebSocketPayloadType): The payload type to
+                use for the message (default ``falcon.WebSocketPayloadType.TEXT``).
+
+        Returns:
+            int: The number of members the message was enqueued for.
+        """
+
+        if payload_type is WebSocketPayloadType.TEXT:
+            return self._broadcast({
+                'type': EventType.WS_SEND,
+                'text': self._mh_text_serialize(media),
+            })
+
+        return self._broadcast({
+            'type': EventType.WS_SEND,
+            'bytes': self._mh_bin_serialize(media),
+        })
+
+    def broadcast_text(self, payload: str) -> int:
+        """Enqueue a message with a Unicode string payload for all members.
+
+        Arguments:
+            payload (str): The string to broadcast.
+
+        Returns:
+            int: The number of members the message was enqueued for.
+        """
+
+        if not isinstance(payload, str):
+            raise TypeError('payload must be a string')
+
+        return self._broadcast({
+            'type': EventType.WS_SEND,
+            'text': payload,
+        })
+
+    def broadcast_data(self, payload: Union[bytes, bytearray, memoryview]) -> int:
+        """Enqueue a message with a binary data payload for all members.
+
+        Arguments:
+            payload (Union[bytes, bytearray, memoryview]): The binary data to
+                broadcast.
+
+        Returns:
+            int: The number of members the message was enqueued for.
+        """
+
+        if not isinstance(payload, (bytes, bytearray, memoryview)):
+            raise TypeError('payload must be a byte string')
+
+        return self._broadcast({
+            'type': EventType.WS_SEND,
+            'bytes': bytes(payload),
+        })
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the group's queue statistics.
+
+        Returns:
+            dict: A dictionary with the following keys:
+
+            * ``members``: the number of members in the group.
+            * ``queued``: the total number of messages pending delivery.
+            * ``max_queue_depth``: the number of messages pending delivery
+              for the most lagging member.
+            * ``sent``: the total number of messages delivered to members.
+            * ``dropped``: the total number of messages dropped due to full
+              member queues.
+            * ``disconnected``: the number of slow consumers disconnected as
+              per the ``'disconnect'`` policy.
+        """
+
+        depths = [len(member.queue) for member in self._members.values()]
+
+        return {
+            'members': len(depths),
+            'queued': sum(depths),
+            'max_queue_depth': max(depths, default=0),
+            'sent': self._sent,
+            'dropped': self._dropped,
+            'disconnected': self._slow_consumers_disconnected,
+        }
+
+    def _broadcast(self, event: dict) -> int:
+        max_queue = self._max_queue
+        slow_consumer = self._slow_consumer
+        count = 0
+
+        for member in self._members.values():
+            if member.closing:
+                continue
+
+            queue = member.queue
+            if len(queue) >= max_queue:
+                if slow_consumer == 'drop':
+                    self._dropped += 1
+                    continue
+
+                if slow_consumer == 'drop_oldest':
+                    self._dropped += 1
+                    queue.popleft()
+                else:
+                    self._dropped += len(queue)
+                    self._slow_consumers_disconnected += 1
+                    queue.clear()
+                    member.closing = True
+                    member.notify()
+                    continue
+
+            queue.append(event)
+            member.notify()
+            count += 1
+
+        return count
+
+    async def _run(self, member: '_BroadcastMember') -> None:
+        ws = member.ws
+        queue = member.queue
+        loop = falcon.get_running_loop()
+
+        try:
+            while True:
+                while queue:
+                    await ws._send(queue.popleft())
+                    self._sent += 1
+
+                if member.closing:
+                    await ws.close(self._close_code)
+                    break
+
+                member.waiter = loop.create_future()
+                try:
+                    await member.waiter
+                finally:
+                    member.waiter = None
+
+        except errors.WebSocketDisconnected:
+            pass
+
+        finally:
+            if self._members.get(ws) is member:
+                del self._members[ws]
+
+
+class _BroadcastMember:
+    """Per-connection state of a BroadcastGroup member."""
+
+    __slots__ = ('closing', 'queue', 'task', 'waiter', 'ws')
+
+    def __init__(self, ws: WebSocket):
+        self.closing = False
+        self.queue: Deque[dict] = collections.deque()
+        self.task = None
+        self.waiter = None
+        self.ws = ws
+
+    def notify(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def stop(self):
+        self.queue.clear()
+
+        if self.task is not None and not self.task.done():
+            if self.closing:
+                # NOTE(kgriffs): Let the task finish closing the connection
+                #   with the slow consumer close code.
+                self.notify()
+                await self.task
+                return
+
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+
 class _BufferedReceiver:
     """Buffer incoming WebSocket messages.
 
@@ -569,9 +994,11 @@ class _BufferedReceiver:
         '_loop',
         '_max_queue',
         '_messages',
-        '_pop_message_waiter',
+        '_messages_available',
+        '_pump_done',
         '_pump_task',
-        '_put_message_waiter',
+        '_queue_not_full',
+        '_receiving',
         'client_disconnected',
         'client_disconnected_code',
     ]
@@ -583,10 +1010,18 @@ class _BufferedReceiver:
         self._loop = falcon.get_running_loop()
 
         self._messages: Deque[dict] = collections.deque()
-        self._pop_message_waiter = None
-        self._put_message_waiter = None
 
+        # PERF(kgriffs): Rather than allocating a new future for every
+        #   message and waiting on it together with the pump task via
+        #   asyncio.wait(), which is rather expensive, we reuse a single
+        #   event for each direction. The pump signals its own completion
+        #   by setting _pump_done and then waking up the receiver.
+        self._messages_available = asyncio.Event()
+        self._queue_not_full = asyncio.Event()
+
+        self._pump_done = False
         self._pump_task = None
+        self._receiving = False
 
         self.client_disconnected = False
         self.client_disconnected_code = None
@@ -613,74 +1048,128 @@ class _BufferedReceiver:
         #
         #   receive() may not be called again while another coroutine
         #   is already waiting for the next message.
-        assert not self._pop_message_waiter
-
-        # NOTE(kgriffs): Wait for a message if none are available. This pattern
-        #   was borrowed from the websockets.protocol module.
-        while not self._messages:
-            # -------------------------------------------------------------------------------------
-            # NOTE(kgriffs): The pattern below was borrowed from the websockets.protocol
-            #   module under the BSD 3-Clause "New" or "Revised" License.
-            #
-            #   Ref: https://github.com/aaugustin/websockets/blob/master/src/websockets/protocol.py
-            #
-            # -------------------------------------------------------------------------------------
+        assert not self._receiving
 
-            # PERF(kgriffs): Using a bare future like this seems to be
-            #   slightly more efficient vs. something like asyncio.Event
-            pop_message_waiter = self._loop.create_future()
-            self._pop_message_waiter = pop_message_waiter
+        messages = self._messages
 
-            try:
-                await asyncio.wait(
-                    [pop_message_waiter, self._pump_task],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-            finally:
-                self._pop_message_waiter = None
-
-            if not pop_message_waiter.done():
-                # NOTE(kgriffs): asyncio.wait(...) exited because
-                #   self._pump_task completed before receiving a
-                #   new message.
-                pop_message_waiter.cancel()
+        # NOTE(kgriffs): Wait for a message if none are available.
+        if not messages:
+            if not await self._wait_for_messages(None):
                 return {
                     'type': EventType.WS_DISCONNECT,
                 }
 
-        message = self._messages.popleft()
+        message = messages.popleft()
 
         # Notify _pump()
-        if self._put_message_waiter is not None:
-            self._put_message_waiter.set_result(None)
-            self._put_message_waiter = None
+        self._queue_not_full.set()
 
         return message
 
-    async def _pump(self):
-        while not self.client_disconnected:
-            received_event = await self._asgi_receive()
-            if received_event['type'] == EventType.WS_DISCONNECT:
-                self.client_disconnected = True
-                self.client_disconnected_code = received_event.get('code', WSCloseCode.NORMAL)
-
-            # -------------------------------------------------------------------------------------
-            # NOTE(kgriffs): The pattern below was borrowed from the websockets.protocol
-            #   module under the BSD 3-Clause "New" or "Revised" License.
-            #
-            #   Ref: https://github.com/aaugustin/websockets/blob/master/src/websockets/protocol.py
-            #
-            # -------------------------------------------------------------------------------------
-            while len(self._messages) >= self._max_queue:
-                self._put_message_waiter = self._loop.create_future()
-                try:
-                    await self._put_message_waiter
-                finally:
-                    self._put_message_waiter = None
+    async def receive_many(self, max_n: Optional[int], timeout: Optional[float]) -> List[dict]:
+        # NOTE(kgriffs): See also the notes in receive().
+        assert not self._receiving
 
-            self._messages.append(received_event)
+        messages = self._messages
 
-            # Notify receive()
-            if self._pop_message_waiter is not None:
-                self._pop_message_waiter.set_result(None)
-                self._pop_message_waiter = None
+        if not messages:
+            if not await self._wait_for_messages(timeout):
+                if self._pump_done:
+                    return [{
+                        'type': EventType.WS_DISCONNECT,
+                    }]
+
+                # NOTE(kgriffs): Timed out while waiting for a message.
+                return []
+
+        count = len(messages)
+        if max_n is not None and max_n < count:
+            count = max_n
+
+        events = []
+        for _ in range(count):
+            # NOTE(kgriffs): Leave a disconnect event in the queue for the
+            #   next call, so that the messages received prior to it are
+            #   not lost.
+            if messages[0]['type'] != EventType.WS_RECEIVE:
+                if not events:
+                    events.append(messages.popleft())
+                break
+
+            events.append(messages.popleft())
+
+        # Notify _pump()
+        self._queue_not_full.set()
+
+        return events
+
+    async def _wait_for_messages(self, timeout: Optional[float]) -> bool:
+        """Wait until at least one message is available in the queue.
+
+        Returns:
+            bool: ``True`` if a message is available, or ``False`` if the pump
+            has stopped or the timeout expired before receiving a message.
+        """
+
+        messages = self._messages
+        messages_available = self._messages_available
+
+        timeout_handle = None
+        if timeout is not None:
+            # NOTE(kgriffs): Simply wake up the receiver once the timeout
+            #   expires; this is much cheaper than asyncio.wait_for(), which
+            #   wraps the awaitable in a new task.
+            timeout_handle = self._loop.call_later(timeout, messages_available.set)
+
+        self._receiving = True
+        try:
+            while not messages and not self._pump_done:
+                messages_available.clear()
+                await messages_available.wait()
+
+                if timeout_handle is not None and not messages:
+                    # NOTE(kgriffs): Either the timeout expired or the pump
+                    #   stopped; both cases are handled by the caller.
+                    break
+        finally:
+            self._receiving = False
+
+            if timeout_handle is not None:
+                timeout_handle.cancel()
+
+        return bool(messages)
+
+    async def _pump(self):
+        messages = self._messages
+        messages_available = self._messages_available
+        queue_not_full = self._queue_not_full
+
+        try:
+            while not self.client_disconnected:
+                received_event = await self._asgi_receive()
+                if received_event['type'] == EventType.WS_DISCONNECT:
+                    self.client_disconnected = True
+                    self.client_disconnected_code = received_event.get(
+                        'code', WSCloseCode.NORMAL)
+
+                while len(messages) >= self._max_queue:
+                    queue_not_full.clear()
+                    await queue_not_full.wait()
+
+                messages.append(received_event)
+
+                # Notify receive()
+                messages_available.set()
+
+        finally:
+            # NOTE(kgriffs): Wake up a pending receive() call regardless of
+            #   how the pump exited (client disconnect, cancellation via
+            #   stop(), or an error raised by the ASGI server), so that it
+            #   does not wait forever for a message that will never come.
+            #
+            #   The wakeup is deferred so that a coroutine awaiting stop(),
+            #   such as WebSocket.close(), gets to run first. Otherwise, the
+            #   receiver would report the connection as closed by the client
+            #   before the server had a chance to send its close event.
+            self._pump_done = True
+            self._loop.call_soon(messages_available.set)
@@ -23,6 +23,10 @@ class EventType:
     HTTP_RESPONSE_BODY = 'http.response.body'
     HTTP_DISCONNECT = 'http.disconnect'
 
+    # NOTE(kgriffs): Extensions
+    HTTP_RESPONSE_ZEROCOPYSEND = 'http.response.zerocopysend'
+    HTTP_RESPONSE_PATHSEND = 'http.response.pathsend'
+
     LIFESPAN_STARTUP = 'lifespan.startup'
     LIFESPAN_STARTUP_COMPLETE = 'lifespan.startup.complete'
     LIFESPAN_STARTUP_FAILED = 'lifespan.startup.failed'
@@ -54,6 +58,7 @@ class WSCloseCode:
     """
 
     NORMAL = 1000
+    POLICY_VIOLATION = 1008
     SERVER_ERROR = 1011
     FORBIDDEN = 3403
     PATH_NOT_FOUND = 3404
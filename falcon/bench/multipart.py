@@ -0,0 +1,143 @@
+"""Multipart form parsing benchmark.
+
+Usage::
+
+    $ python -m falcon.bench.multipart
+    $ python -m falcon.bench.multipart --size 100KiB --trials 5
+
+For each part size, a form is parsed using both the pure-Python and the
+cythonized (if available) variants of :class:`falcon.util.BufferedReader`,
+and the resulting throughput is reported. In addition, the pure-Python and
+cythonized variants of the body part header parser are compared over a few
+representative header blocks.
+"""
+
+import argparse
+import io
+import sys
+import timeit
+
+from falcon.constants import MEDIA_MULTIPART
+from falcon.media import multipart
+from falcon.util import _CyBufferedReader, _PyBufferedReader
+
+
+BOUNDARY = 'BOUNDARY-fbeff51e0f5630958701f4941aec5595'
+
+SIZES = {
+    '1KiB': 1024,
+    '100KiB': 100 * 1024,
+    '100MiB': 100 * 1024 * 1024,
+}
+
+HEADER_BLOCKS = {
+    'field': b'Content-Disposition: form-data; name="description"',
+    'file': (
+        b'Content-Disposition: form-data; name="file"; filename="data.bin"\r\n'
+        b'Content-Type: application/octet-stream'
+    ),
+    'verbose': (
+        b'Content-Disposition: form-data; name="image"; filename="photo.jpg"\r\n'
+        b'Content-Type: image/jpeg\r\n'
+        b'Content-Transfer-Encoding: binary\r\n'
+        b'X-Custom-Header: ignored\r\n'
+        b'Content-Length: 1048576'
+    ),
+}
+
+_HEADER_ITERATIONS = 100000
+
+# NOTE(vytas): Target roughly the same amount of data per trial for each size.
+_TARGET_BYTES_PER_TRIAL = 256 * 1024 * 1024
+_MAX_PARTS_PER_FORM = 64
+
+
+def create_form(part_size, part_count):
+    part = (
+        b'--' + BOUNDARY.encode() + b'\r\n'
+        b'Content-Disposition: form-data; name="file"; filename="data.bin"\r\n'
+        b'Content-Type: application/octet-stream\r\n\r\n' +
+        b'0123456789abcde\n' * (part_size // 16) +
+        b'\x00' * (part_size % 16) +
+        b'\r\n'
+    )
+
+    return part * part_count + b'--' + BOUNDARY.encode() + b'--\r\n'
+
+
+def parse_form(reader_type, form):
+    handler = multipart.MultipartFormHandler()
+    handler.parse_options.max_body_part_count = 0
+
+    stream = reader_type(io.BytesIO(form).read, len(form))
+    content_type = MEDIA_MULTIPART + '; boundary=' + BOUNDARY
+
+    count = 0
+    for part in handler.deserialize(stream, content_type, len(form)):
+        part.stream.pipe()
+        count += 1
+
+    return count
+
+
+def run_headers(trials):
+    parsers = [('python', multipart._py_parse_headers)]
+    if multipart._cy_parse_headers is not None:
+        parsers.append(('cython', multipart._cy_parse_headers))
+
+    for block_name, headers_block in HEADER_BLOCKS.items():
+        expected = multipart._py_parse_headers(headers_block)
+
+        for parser_name, parse_headers in parsers:
+            assert parse_headers(headers_block) == expected
+
+            timer = timeit.Timer(lambda: parse_headers(headers_block))
+            best = min(timer.repeat(repeat=trials, number=_HEADER_ITERATIONS))
+
+            print('{:<8s} {:<7s} {:>12.1f} blocks/sec {:>9.3f} usec/block'.format(
+                block_name, parser_name, _HEADER_ITERATIONS / best,
+                best / _HEADER_ITERATIONS * 1e6))
+
+
+def run(sizes, trials):
+    readers = [('python', _PyBufferedReader)]
+    if _CyBufferedReader is not None:
+        readers.append(('cython', _CyBufferedReader))
+
+    print('Header parsing:\n')
+    run_headers(trials)
+
+    header_parser = 'cython' if multipart._cy_parse_headers else 'python'
+    print('\nForm parsing (header parser: {}):\n'.format(header_parser))
+
+    for size_name in sizes:
+        part_size = SIZES[size_name]
+        part_count = max(1, min(_MAX_PARTS_PER_FORM, _TARGET_BYTES_PER_TRIAL // part_size))
+        form = create_form(part_size, part_count)
+        iterations = max(1, _TARGET_BYTES_PER_TRIAL // len(form))
+
+        for reader_name, reader_type in readers:
+            assert parse_form(reader_type, form) == part_count
+
+            timer = timeit.Timer(lambda: parse_form(reader_type, form))
+            best = min(timer.repeat(repeat=trials, number=iterations))
+
+            total_parts = part_count * iterations
+            mib_per_sec = len(form) * iterations / best / (1024 * 1024)
+
+            print('{:<8s} {:<7s} {:>12.1f} parts/sec {:>10.1f} MiB/sec'.format(
+                size_name, reader_name, total_parts / best, mib_per_sec))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Falcon multipart benchmark')
+    parser.add_argument('-s', '--size', type=str, action='append',
+                        choices=list(SIZES), dest='sizes')
+    parser.add_argument('-t', '--trials', type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.sizes or list(SIZES), args.trials)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
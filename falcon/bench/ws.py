@@ -0,0 +1,113 @@
+"""WebSocket receive benchmark.
+
+Usage::
+
+    $ python -m falcon.bench.ws
+    $ python -m falcon.bench.ws --mode pingpong --messages 50000 --trials 5
+
+Messages are sent to a simple ASGI app by way of
+:meth:`falcon.testing.ASGIConductor.simulate_ws`, and the number of messages
+received by the app per second is reported for each of the following modes:
+
+* ``stream``: the client sends messages as fast as it can, and the app reads
+  them one at a time via :meth:`falcon.asgi.WebSocket.receive_text`.
+* ``batch``: same as above, except that the app reads messages in batches
+  via :meth:`falcon.asgi.WebSocket.receive_many` (and deserializes each
+  message as JSON).
+* ``pingpong``: the client waits for a reply to each message before sending
+  the next one, so that the app's receive queue is nearly always empty.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+import falcon.asgi
+import falcon.testing
+
+
+MODES = ('stream', 'batch', 'pingpong')
+
+
+class Sink:
+    def __init__(self, mode, count):
+        self._mode = mode
+        self._count = count
+
+    async def on_websocket(self, req, ws):
+        await ws.accept()
+
+        received = 0
+
+        if self._mode == 'batch':
+            while received < self._count:
+                received += len(await ws.receive_many())
+
+        elif self._mode == 'pingpong':
+            while received < self._count:
+                await ws.send_text(await ws.receive_text())
+                received += 1
+
+        else:
+            while received < self._count:
+                await ws.receive_text()
+                received += 1
+
+        await ws.send_text('done')
+
+
+async def run_trial(mode, count):
+    app = falcon.asgi.App()
+    app.add_route('/', Sink(mode, count))
+
+    async with falcon.testing.ASGIConductor(app) as conductor:
+        async with conductor.simulate_ws() as ws:
+            start = time.perf_counter()
+
+            if mode == 'pingpong':
+                for _ in range(count):
+                    await ws.send_text('ping')
+                    await ws.receive_text()
+            else:
+                for _ in range(count):
+                    await ws.send_text('"message"')
+
+                    # NOTE(kgriffs): Yield to the app after each message, as
+                    #   a real network would, so that the app's receive queue
+                    #   does not simply fill up before the app gets a chance
+                    #   to run.
+                    await asyncio.sleep(0)
+
+            assert (await ws.receive_text()) == 'done'
+            return time.perf_counter() - start
+
+
+def run(modes, count, trials):
+    loop = asyncio.new_event_loop()
+
+    try:
+        for mode in modes:
+            best = min(
+                loop.run_until_complete(run_trial(mode, count))
+                for _ in range(trials)
+            )
+
+            print('{:<10s} {:>12.1f} messages/sec'.format(mode, count / best))
+    finally:
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Falcon WebSocket benchmark')
+    parser.add_argument('-m', '--mode', type=str, action='append',
+                        choices=MODES, dest='modes')
+    parser.add_argument('-n', '--messages', type=int, default=20000)
+    parser.add_argument('-t', '--trials', type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.modes or MODES, args.messages, args.trials)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
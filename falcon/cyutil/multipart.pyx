@@ -0,0 +1,74 @@
+"""Multipart form parsing helpers (cythonized variant)."""
+
+# NOTE(vytas): We can not import these from falcon.media.multipart, since that
+#   module imports this one.
+cdef frozenset _ALLOWED_CONTENT_HEADERS = frozenset([
+    b'content-type',
+    b'content-disposition',
+    b'content-transfer-encoding',
+])
+
+cdef bytes _CONTENT_TRANSFER_ENCODING = b'content-transfer-encoding'
+
+cdef enum:
+    _CR = 0x0D
+    _LF = 0x0A
+    _COLON = 0x3A
+    _SPACE = 0x20
+
+
+def parse_headers(bytes headers_block not None):
+    """Parse the headers block of a body part in a single pass.
+
+    This is a Cython counterpart of
+    ``falcon.media.multipart._py_parse_headers()``; instead of splitting the
+    block into lines, and then partitioning each line, header name and value
+    boundaries are located by scanning the block only once.
+
+    Args:
+        headers_block (bytes): Header lines delimited by CRLF, excluding the
+            empty line terminating the block.
+
+    Returns:
+        dict: A mapping of lowercased allowed header names to the
+        corresponding values, or ``None`` if the body part uses an
+        unsupported Content-Transfer-Encoding.
+    """
+
+    cdef const unsigned char* data = headers_block
+    cdef Py_ssize_t length = len(headers_block)
+    cdef Py_ssize_t index = 0
+    cdef Py_ssize_t line_start = 0
+    cdef Py_ssize_t separator = -1
+    cdef dict headers = {}
+    cdef bytes name
+    cdef bytes value
+
+    while index <= length:
+        if index == length or (
+                data[index] == _CR and index + 1 < length and
+                data[index + 1] == _LF):
+
+            if separator >= 0:
+                name = headers_block[line_start:separator].lower()
+                value = headers_block[separator + 2:index]
+
+                # NOTE(vytas): See also the pure-Python counterpart for the
+                #   relevant RFC 7578 references.
+                if name == _CONTENT_TRANSFER_ENCODING and value != b'binary':
+                    return None
+                elif name in _ALLOWED_CONTENT_HEADERS:
+                    headers[name] = value
+
+            index += 2
+            line_start = index
+            separator = -1
+            continue
+
+        if (separator < 0 and data[index] == _COLON and
+                index + 1 < length and data[index + 1] == _SPACE):
+            separator = index
+
+        index += 1
+
+    return headers
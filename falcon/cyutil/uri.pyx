@@ -147,7 +147,7 @@ cdef cy_handle_csv(dict result, bint keep_blank, unicode key, bytes value):
 
 
 cdef cy_parse_query_string(unsigned char* data, Py_ssize_t length,
-                           bint keep_blank, bint csv):
+                           bint keep_blank, bint csv, dict result):
     cdef Py_ssize_t pos
     cdef unsigned char current
 
@@ -159,7 +159,6 @@ cdef cy_parse_query_string(unsigned char* data, Py_ssize_t length,
     cdef unicode key
     cdef unicode value
     cdef old_value
-    cdef dict result = {}
 
     for pos in range(length):
         # PERF(vytas): Quick check if we need to do anything special with the
@@ -254,10 +253,63 @@ def parse_query_string(unicode query_string not None, bint keep_blank=False,
                        bint csv=True):
     cdef bytes byte_string = query_string.encode('utf-8')
     cdef unsigned char* data = byte_string
-    return cy_parse_query_string(data, len(byte_string), keep_blank, csv)
+    return cy_parse_query_string(data, len(byte_string), keep_blank, csv, {})
 
 
 def decode(unicode encoded_uri not None, bint unquote_plus=True):
     cdef bytes byte_string = encoded_uri.encode('utf-8')
     cdef unsigned char* data = byte_string
     return cy_decode(data, 0, len(byte_string), 0, unquote_plus)
+
+
+def parse_form_fields(bytes data not None, dict params not None,
+                      bint keep_blank, bint csv, Py_ssize_t max_fields,
+                      Py_ssize_t max_key_size, Py_ssize_t max_value_size):
+    cdef unsigned char* buffer = data
+    cdef Py_ssize_t length = len(data)
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t count = 1
+    cdef Py_ssize_t start = 0
+    cdef Py_ssize_t partition = -1
+    cdef bint check_sizes = max_key_size > 0 or max_value_size > 0
+
+    if 0 <= max_fields < count:
+        raise ValueError('maximum number of form fields exceeded')
+
+    # PERF(vytas): Validate the data and limits in a single pass, before
+    #   parsing (without decoding the data to str first, as opposed to the
+    #   pure-Python version).
+    for pos in range(length + 1):
+        if pos < length:
+            if buffer[pos] >= 0x80:
+                raise UnicodeDecodeError(
+                    'ascii', data, pos, pos + 1, 'ordinal not in range(128)')
+
+            if buffer[pos] == b'=':
+                if partition < 0:
+                    partition = pos
+                continue
+
+            if buffer[pos] != b'&':
+                continue
+
+            count += 1
+            if 0 <= max_fields < count:
+                raise ValueError('maximum number of form fields exceeded')
+
+        if check_sizes:
+            if partition < 0:
+                partition = pos
+            if max_key_size and partition - start > max_key_size:
+                raise ValueError('form field name is too long')
+            if max_value_size and pos - partition - 1 > max_value_size:
+                raise ValueError('form field value is too long')
+
+        start = pos + 1
+        partition = -1
+
+    # NOTE(vytas): Parsing directly into params yields the same result as
+    #   merging, since the parameters are accumulated in the same way as if
+    #   the key was repeated within the same query string.
+    cy_parse_query_string(buffer, length, keep_blank, csv, params)
+    return count
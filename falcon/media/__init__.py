@@ -1,7 +1,10 @@
 from .base import BaseHandler, BinaryBaseHandlerWS, TextBaseHandlerWS
+from .cache import RenderCache
+from .cbor import CBORHandler, CBORStreamHandler
+from .compressed import CompressedHandlerWS
 from .handlers import Handlers, MissingDependencyHandler
 from .json import JSONHandler, JSONHandlerWS
-from .msgpack import MessagePackHandler, MessagePackHandlerWS
+from .msgpack import MessagePackHandler, MessagePackHandlerWS, MessagePackStreamHandler
 from .multipart import MultipartFormHandler
 from .urlencoded import URLEncodedFormHandler
 
@@ -9,13 +12,18 @@ from .urlencoded import URLEncodedFormHandler
 __all__ = [
     'BaseHandler',
     'BinaryBaseHandlerWS',
+    'CBORHandler',
+    'CBORStreamHandler',
+    'CompressedHandlerWS',
     'TextBaseHandlerWS',
     'Handlers',
     'JSONHandler',
     'JSONHandlerWS',
     'MessagePackHandler',
     'MessagePackHandlerWS',
+    'MessagePackStreamHandler',
     'MissingDependencyHandler',
     'MultipartFormHandler',
+    'RenderCache',
     'URLEncodedFormHandler',
 ]
@@ -0,0 +1,138 @@
+"""Cache for serialized response media."""
+
+from collections import OrderedDict
+import hashlib
+import threading
+
+
+__all__ = ['RenderCache']
+
+
+class RenderCache:
+    """Bounded LRU cache of serialized response media.
+
+    Responders that repeatedly return the same Python object (for example,
+    configuration or catalog documents) can tag the media with a cache key
+    and an optional version via :meth:`falcon.Response.set_media`. When an
+    instance of this class is assigned to
+    :attr:`~falcon.ResponseOptions.media_render_cache`, the serialized bytes
+    for each tagged (key, version, Content-Type) combination are stored the
+    first time they are rendered, and subsequent renders skip the media
+    handler entirely.
+
+    The cache is safe to share between threads, and may be used with both
+    WSGI and ASGI apps::
+
+        app = falcon.App()
+        app.resp_options.media_render_cache = falcon.media.RenderCache()
+
+        class CatalogResource:
+            def on_get(self, req, resp):
+                catalog = self._store.get_catalog()
+                resp.set_media(catalog, cache_key='catalog',
+                               version=catalog['revision'])
+
+    Note:
+        Since the cache key and version are trusted to identify the media
+        content, the application is responsible for changing the version (or
+        calling :meth:`~.clear`) whenever the underlying object is modified.
+
+    Keyword Arguments:
+        max_entries (int): Maximum number of rendered representations to keep
+            in the cache (default ``1024``). When the cache is full, the least
+            recently used entry is evicted.
+        etag (bool): Set to ``False`` to disable setting the ETag header for
+            cached media (default ``True``). When enabled, an entity-tag is
+            derived from the serialized bytes when they are first stored, and
+            the response's ETag header is set to this value unless the
+            responder has already set it.
+
+    Attributes:
+        hits (int): Number of lookups that were served from the cache.
+        misses (int): Number of lookups that required rendering the media.
+    """
+
+    __slots__ = (
+        '_entries',
+        '_etag',
+        '_lock',
+        '_max_entries',
+        'hits',
+        'misses',
+    )
+
+    def __init__(self, max_entries=1024, etag=True):
+        if max_entries < 1:
+            raise ValueError('max_entries must be a positive integer')
+
+        self._entries = OrderedDict()
+        self._etag = etag
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, content_type):
+        """Look up a rendered representation of the tagged media.
+
+        Args:
+            key (tuple): The ``(cache_key, version)`` pair for the media.
+            content_type (str): The Content-Type of the response.
+
+        Returns:
+            tuple: A ``(data, etag)`` pair, where `data` is the serialized
+            media as a byte string, and `etag` is the formatted value for
+            the ETag header (or ``None`` when ETags are disabled). If the
+            media was not found in the cache, ``None`` is returned instead.
+        """
+
+        entry_key = (key, content_type)
+
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+
+        return entry
+
+    def set(self, key, content_type, data):
+        """Store a rendered representation of the tagged media.
+
+        Args:
+            key (tuple): The ``(cache_key, version)`` pair for the media.
+            content_type (str): The Content-Type of the response.
+            data (bytes): The serialized media.
+
+        Returns:
+            tuple: The ``(data, etag)`` pair that was stored.
+        """
+
+        etag = None
+        if self._etag:
+            etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+
+        entry = (data, etag)
+        entry_key = (key, content_type)
+
+        with self._lock:
+            self._entries[entry_key] = entry
+            self._entries.move_to_end(entry_key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,277 @@
+import io
+
+from falcon import errors
+from falcon.media.base import BaseHandler
+from falcon.media.streaming import _MAX_BUFFER_SIZE, StreamingBaseHandler
+
+
+class CBORHandler(BaseHandler):
+    """Handler built using the :py:mod:`cbor2` module.
+
+    This handler uses ``cbor2.loads()`` and ``cbor2.dumps()``.
+
+    This handler will raise a :class:`falcon.MediaNotFoundError` when attempting
+    to parse an empty body; it will raise a :class:`falcon.MediaMalformedError`
+    if an error happens while parsing the body.
+
+    Note:
+        This handler requires the extra ``cbor2`` package, which must be
+        installed in addition to ``falcon`` from PyPI:
+
+        .. code::
+
+            $ pip install cbor2
+    """
+
+    def __init__(self):
+        import cbor2
+
+        self._dumps = cbor2.dumps
+        self._loads = cbor2.loads
+        self._decode_errors = (ValueError, cbor2.CBORDecodeError)
+
+        # NOTE(kgriffs): To be safe, only enable the optimized protocol when
+        #   not subclassed.
+        if type(self) is CBORHandler:
+            self._serialize_sync = self._dumps
+            self._deserialize_sync = self._deserialize
+
+    def _deserialize(self, data):
+        if not data:
+            raise errors.MediaNotFoundError('CBOR')
+        try:
+            return self._loads(data)
+        except self._decode_errors as err:
+            raise errors.MediaMalformedError('CBOR') from err
+
+    def deserialize(self, stream, content_type, content_length):
+        return self._deserialize(stream.read())
+
+    async def deserialize_async(self, stream, content_type, content_length):
+        return self._deserialize(await stream.read())
+
+    def serialize(self, media, content_type) -> bytes:
+        return self._dumps(media)
+
+    async def serialize_async(self, media, content_type) -> bytes:
+        return self._dumps(media)
+
+
+class CBORStreamHandler(StreamingBaseHandler):
+    """Streaming handler for concatenated CBOR data items.
+
+    This handler offers the same streaming interface as
+    :class:`~.MessagePackStreamHandler`. The request body is decoded
+    incrementally, and deserialized to an iterator over the decoded data
+    items (or an asynchronous iterator in the case of ASGI apps).
+
+    When serializing, the media is expected to be an iterable of objects,
+    which are encoded using ``cbor2.dumps()`` and concatenated.
+
+    Note:
+        This handler requires the extra ``cbor2`` package, which must be
+        installed in addition to ``falcon`` from PyPI:
+
+        .. code::
+
+            $ pip install cbor2
+
+    Keyword Args:
+        chunk_size (int): The number of bytes to read from the request
+            stream at a time (default ``64 KiB``).
+        max_buffer_size (int): The maximum number of bytes to buffer while
+            waiting for an incomplete data item, which effectively caps the
+            size of a single item (default ``100 MiB``). A body containing a
+            larger item is rejected as malformed.
+    """
+
+    _media_name = 'CBOR'
+
+    def __init__(self, chunk_size=64 * 1024, max_buffer_size=_MAX_BUFFER_SIZE):
+        import cbor2
+
+        super().__init__(chunk_size=chunk_size)
+
+        self._cbor2 = cbor2
+        self._max_buffer_size = max_buffer_size
+        self._pack = cbor2.dumps
+        self._unpack_errors = (ValueError, cbor2.CBORDecodeError)
+
+    def _create_unpacker(self):
+        return _CBORUnpacker(self._cbor2, self._max_buffer_size)
+
+
+class _CBORUnpacker:
+    """Incremental CBOR decoder mimicking the interface of msgpack.Unpacker.
+
+    Complete data items are decoded straight from the buffer. However, cbor2
+    can not resume decoding an incomplete data item, so rather than decoding
+    such an item over and over again as more chunks arrive, the unpacker
+    scans the headers of its (possibly nested) data items, and only decodes
+    it once its end has been located.
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_cbor2',
+        '_consumed',
+        '_max_buffer_size',
+        '_pending',
+        '_scanned',
+    )
+
+    def __init__(self, cbor2, max_buffer_size):
+        self._buffer = bytearray()
+        self._cbor2 = cbor2
+        self._consumed = 0
+        self._max_buffer_size = max_buffer_size
+
+        # NOTE(kgriffs): The number of data items that remain to be scanned
+        #   for each container that encloses the current position, or -1 in
+        #   the case of indefinite-length containers.
+        self._pending = []
+
+        # NOTE(kgriffs): Offset in the buffer up to which the data has been
+        #   scanned, so that every byte is only examined once.
+        self._scanned = 0
+
+    def feed(self, data):
+        self._buffer += data
+
+    def tell(self):
+        return self._consumed
+
+    def __iter__(self):
+        buffer = self._buffer
+        position = 0
+
+        try:
+            while position < len(buffer):
+                if self._scanned == position and not self._pending:
+                    # NOTE(kgriffs): Decode as many complete items as possible
+                    #   from a single snapshot of the buffer.
+                    fp = io.BytesIO(buffer[position:])
+                    decoder = self._cbor2.CBORDecoder(fp)
+                    offset = position
+
+                    while True:
+                        # NOTE(kgriffs): Older versions of cbor2 (< 6.0)
+                        #   return a break marker object for a stray "break"
+                        #   stop code rather than raising an error.
+                        start = offset + fp.tell()
+                        if start < len(buffer) and buffer[start] == 0xff:
+                            raise self._cbor2.CBORDecodeError(
+                                'break code encountered where a data item was expected')
+
+                        try:
+                            item = decoder.decode()
+                        except self._cbor2.CBORDecodeEOF:
+                            break
+
+                        position = self._scanned = offset + fp.tell()
+                        yield item
+
+                    if position == len(buffer):
+                        break
+
+                end = self._scan(position)
+                if end < 0:
+                    if self._max_buffer_size and (
+                            len(buffer) - position > self._max_buffer_size):
+                        raise ValueError('CBOR data item exceeds max_buffer_size')
+
+                    break
+
+                item = self._cbor2.loads(buffer[position:end])
+                position = end
+                yield item
+        finally:
+            # NOTE(kgriffs): Only discard the consumed bytes once we are done,
+            #   rather than copying the remainder of the buffer for every item.
+            if position:
+                del buffer[:position]
+                self._scanned -= position
+                self._consumed += position
+
+    def _scan(self, start):  # noqa: C901
+        """Scan the buffer up to the end of the data item at `start`.
+
+        Returns:
+            int: The offset at which the item ends, or ``-1`` if the item is
+            not complete yet.
+        """
+
+        buffer = self._buffer
+        size = len(buffer)
+        pending = self._pending
+        offset = self._scanned
+
+        # NOTE(kgriffs): The item was already scanned in its entirety, but
+        #   ends with a string that has not been fully received yet.
+        if offset > start and not pending:
+            return offset if offset <= size else -1
+
+        while offset < size:
+            initial = buffer[offset]
+            major = initial >> 5
+            info = initial & 0x1f
+
+            if info < 24:
+                length = 1
+                argument = info
+            elif info < 28:
+                length = 1 + (1 << (info - 24))
+                if offset + length > size:
+                    break
+
+                argument = int.from_bytes(buffer[offset + 1:offset + length], 'big')
+            elif info == 31 and major in (2, 3, 4, 5, 7):
+                length = 1
+                argument = -1
+            else:
+                raise ValueError('invalid CBOR initial byte 0x{:02x}'.format(initial))
+
+            if major == 7 and argument < 0:
+                # NOTE(kgriffs): The "break" stop code terminates the enclosing
+                #   indefinite-length container.
+                if not pending or pending[-1] >= 0:
+                    raise ValueError('unexpected CBOR break stop code')
+
+                pending.pop()
+            elif major in (2, 3) and argument >= 0:
+                # NOTE(kgriffs): Skip over the string, even if it has not been
+                #   fully received yet.
+                length += argument
+            elif major in (2, 3, 4, 5) and argument < 0:
+                pending.append(-1)
+                offset += length
+                continue
+            elif major in (4, 5) and argument:
+                pending.append(argument if major == 4 else argument * 2)
+                offset += length
+                continue
+            elif major == 6:
+                # NOTE(kgriffs): A tag is followed by exactly one data item.
+                pending.append(1)
+                offset += length
+                continue
+
+            offset += length
+
+            # NOTE(kgriffs): A data item is complete; account for it in any
+            #   enclosing containers, which may thereby be completed in turn.
+            while pending:
+                if pending[-1] < 0:
+                    break
+
+                pending[-1] -= 1
+                if pending[-1]:
+                    break
+
+                pending.pop()
+            else:
+                self._scanned = offset
+                return offset if offset <= size else -1
+
+        self._scanned = offset
+        return -1
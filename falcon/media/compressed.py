@@ -0,0 +1,183 @@
+import zlib
+
+from falcon.media.base import BinaryBaseHandlerWS, TextBaseHandlerWS
+from falcon.media.json import JSONHandlerWS
+from falcon.request_helpers import _ZstdStreamDecompressor
+
+
+class CompressedHandlerWS(BinaryBaseHandlerWS):
+    """WebSocket media handler that compresses BINARY payloads.
+
+    This handler wraps another WebSocket media handler, compressing the
+    serialized payload produced by the wrapped handler, and vice versa. It can
+    serve as an application-level fallback when the ASGI server does not
+    support the ``permessage-deflate`` extension, or when the extension was
+    not negotiated with the client (WebSocket extensions are negotiated by
+    the ASGI server, since it is responsible for framing messages).
+
+    Since WebSocket messages tend to be short, compression ratios can be
+    improved drastically by priming the codec with a shared dictionary of
+    strings that are likely to occur in messages (e.g., common JSON keys).
+    The same dictionary must be used by the client to (de)compress messages::
+
+        import falcon
+        from falcon import media
+
+        dictionary = b'{"ticker": "", "price": , "volume": }'
+
+        app = falcon.asgi.App()
+        app.ws_options.media_handlers[falcon.WebSocketPayloadType.BINARY] = (
+            media.CompressedHandlerWS(dictionary=dictionary)
+        )
+
+        class Feed:
+            async def on_websocket(self, req, ws):
+                await ws.accept()
+                await ws.send_media(
+                    {'ticker': 'FLCN', 'price': 42.0, 'volume': 1000},
+                    falcon.WebSocketPayloadType.BINARY,
+                )
+
+    Two codecs are supported:
+
+    * ``'zlib'``: raw DEFLATE (RFC 1951) data, i.e., without any zlib header
+      or checksum, as implemented by the standard :py:mod:`zlib` module.
+    * ``'zstd'``: Zstandard (RFC 8878) frames.
+
+    Note:
+        The ``'zstd'`` codec requires the extra ``zstandard`` package, which
+        must be installed in addition to ``falcon`` from PyPI:
+
+        .. code::
+
+            $ pip install zstandard
+
+    Keyword Arguments:
+        handler: The WebSocket media handler to wrap (default
+            :class:`~falcon.media.JSONHandlerWS`). TEXT handlers are
+            supported as well; in that case, the serialized string is encoded
+            to UTF-8 before compression.
+        codec (str): The compression codec to use, either ``'zlib'``
+            (default) or ``'zstd'``.
+        dictionary (bytes): An optional shared dictionary to prime the codec
+            with.
+        level (int): The compression level to use (default ``-1`` for the
+            codec's default level).
+        max_size (int): The maximum size of a decompressed payload (default
+            ``0``, meaning no limit). If this limit is exceeded,
+            ``ValueError`` is raised upon deserialization.
+    """
+
+    __slots__ = [
+        '_compress',
+        '_decompress',
+        '_deserialize',
+        '_is_text',
+        '_max_size',
+        '_serialize',
+    ]
+
+    def __init__(self, handler=None, codec='zlib', dictionary=None, level=-1, max_size=0):
+        if handler is None:
+            handler = JSONHandlerWS()
+
+        self._is_text = isinstance(handler, TextBaseHandlerWS)
+        self._serialize = handler.serialize
+        self._deserialize = handler.deserialize
+        self._max_size = max_size
+
+        if codec == 'zlib':
+            self._init_zlib(dictionary, level)
+        elif codec == 'zstd':
+            self._init_zstd(dictionary, level)
+        else:
+            raise ValueError("codec must be either 'zlib' or 'zstd'")
+
+    def serialize(self, media: object) -> bytes:
+        data = self._serialize(media)
+        if self._is_text:
+            data = data.encode()
+
+        return self._compress(data)
+
+    def deserialize(self, payload: bytes) -> object:
+        data = self._decompress(payload)
+        if self._is_text:
+            data = data.decode()
+
+        return self._deserialize(data)
+
+    def _init_zlib(self, dictionary, level):
+        # PERF(kgriffs): Priming the (de)compressor with a dictionary has a
+        #   non-trivial cost, so we prime a template object once, and then
+        #   simply copy it for every message.
+        if dictionary:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=dictionary)
+        else:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        max_size = self._max_size
+
+        def compress(data):
+            cobj = compressor.copy()
+            return cobj.compress(data) + cobj.flush()
+
+        def decompress(payload):
+            dobj = decompressor.copy()
+
+            try:
+                data = dobj.decompress(payload, max_size)
+            except zlib.error as ex:
+                raise ValueError(str(ex))
+
+            if dobj.unconsumed_tail:
+                raise ValueError(
+                    'Decompressed payload exceeds {} bytes'.format(max_size))
+
+            if not dobj.eof:
+                raise ValueError('Incomplete compressed payload')
+
+            return data
+
+        self._compress = compress
+        self._decompress = decompress
+
+    def _init_zstd(self, dictionary, level):
+        import zstandard
+
+        if level == -1:
+            level = 3
+
+        dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        compressor = zstandard.ZstdCompressor(level=level, dict_data=dict_data)
+        decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+
+        max_size = self._max_size
+
+        def decompress(payload):
+            size = 0
+
+            def check_size(data):
+                nonlocal size
+
+                size += len(data)
+                if max_size and size > max_size:
+                    raise ValueError(
+                        'Decompressed payload exceeds {} bytes'.format(max_size))
+
+            # NOTE(kgriffs): Unlike ZstdDecompressor.decompress(), this
+            #   supports frames that do not record the content size in the
+            #   frame header, and it allows us to check the size of the
+            #   output as we go.
+            dobj = _ZstdStreamDecompressor(decompressor, check_size)
+            data = dobj.decompress(payload)
+
+            if not dobj.eof:
+                raise ValueError('Incomplete compressed payload')
+
+            return data
+
+        self._compress = compressor.compress
+        self._decompress = decompress
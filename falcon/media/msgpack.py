@@ -4,6 +4,7 @@ from typing import Union
 
 from falcon import errors
 from falcon.media.base import BaseHandler, BinaryBaseHandlerWS
+from falcon.media.streaming import _MAX_BUFFER_SIZE, StreamingBaseHandler
 
 
 class MessagePackHandler(BaseHandler):
@@ -63,6 +64,71 @@ class MessagePackHandler(BaseHandler):
         return self._pack(media)
 
 
+class MessagePackStreamHandler(StreamingBaseHandler):
+    """Streaming handler for concatenated MessagePack records.
+
+    Rather than buffering the whole request body, this handler feeds the
+    body to a ``msgpack.Unpacker()`` in chunks, and deserializes the media
+    to an iterator over the decoded records (or an asynchronous iterator
+    in the case of ASGI apps). Records are decoded lazily as the iterator is
+    consumed, so that only the current chunk, and any incomplete record,
+    is kept in memory at any given time::
+
+        handlers = {'application/x-msgpack-seq': MessagePackStreamHandler()}
+        app.req_options.media_handlers.update(handlers)
+
+        class TelemetryResource:
+            def on_post(self, req, resp):
+                for record in req.get_media():
+                    self._store.add(record)
+
+    The handler raises a :class:`falcon.MediaNotFoundError` when attempting
+    to parse an empty body, and a :class:`falcon.MediaMalformedError` while
+    iterating over the records if the body can not be parsed, or if it ends
+    with an incomplete record.
+
+    When serializing, the media is expected to be an iterable of objects,
+    which are packed using ``msgpack.Packer().pack()`` and concatenated.
+
+    Note:
+        This handler requires the extra ``msgpack`` package (version 1.0
+        or higher), which must be installed in addition to ``falcon`` from
+        PyPI:
+
+        .. code::
+
+            $ pip install msgpack
+
+    Keyword Args:
+        chunk_size (int): The number of bytes to read from the request
+            stream at a time (default ``64 KiB``).
+        max_buffer_size (int): The maximum number of bytes to buffer while
+            waiting for an incomplete record, which effectively caps the size
+            of a single record (default ``100 MiB``). A body containing a
+            larger record is rejected as malformed. Note that, as per the
+            ``msgpack`` library, ``0`` does not disable the limit, but rather
+            raises it to the maximum of ``2**32 - 1`` bytes.
+    """
+
+    _media_name = 'MessagePack'
+
+    def __init__(self, chunk_size=64 * 1024, max_buffer_size=_MAX_BUFFER_SIZE):
+        import msgpack
+
+        super().__init__(chunk_size=chunk_size)
+
+        packer = msgpack.Packer(autoreset=True, use_bin_type=True)
+        self._pack = packer.pack
+        self._max_buffer_size = max_buffer_size
+        self._msgpack = msgpack
+        self._unpack_errors = (ValueError, msgpack.UnpackException)
+
+    def _create_unpacker(self):
+        return self._msgpack.Unpacker(
+            raw=False, max_buffer_size=self._max_buffer_size
+        )
+
+
 class MessagePackHandlerWS(BinaryBaseHandlerWS):
     """WebSocket media handler for de(serializing) MessagePack to/from BINARY payloads.
 
@@ -15,7 +15,11 @@
 """Multipart form media handler."""
 
 import cgi
+import mmap
+import os
 import re
+import sys
+import tempfile
 from urllib.parse import unquote_to_bytes
 
 from falcon import errors
@@ -25,6 +29,11 @@ from falcon.util import BufferedReader
 from falcon.util import misc
 from falcon.util.deprecation import deprecated_args
 
+try:
+    from falcon.cyutil.multipart import parse_headers as _cy_parse_headers
+except ImportError:
+    _cy_parse_headers = None
+
 
 # TODO(vytas):
 #   * Better support for form-wide charset setting
@@ -42,6 +51,9 @@ _FILENAME_STAR_RFC5987 = re.compile(r"([\w-]+)'[\w]*'(.+)")
 _CRLF = b'\r\n'
 _CRLF_CRLF = _CRLF + _CRLF
 
+_UNSUPPORTED_CTE_MSG = (
+    'the deprecated Content-Transfer-Encoding header field is unsupported')
+
 
 class MultipartParseError(errors.MediaMalformedError):
     """Represents a multipart form parsing error.
@@ -73,6 +85,47 @@ class MultipartParseError(errors.MediaMalformedError):
         )
 
 
+def _py_parse_headers(headers_block):
+    """Parse the headers block of a body part.
+
+    Args:
+        headers_block (bytes): Header lines delimited by CRLF, excluding the
+            empty line terminating the block.
+
+    Returns:
+        dict: A mapping of lowercased allowed header names to the
+        corresponding values, or ``None`` if the body part uses an
+        unsupported Content-Transfer-Encoding.
+    """
+    headers = {}
+
+    for line in headers_block.split(_CRLF):
+        name, sep, value = line.partition(b': ')
+        if sep:
+            name = name.lower()
+
+            # NOTE(vytas): RFC 7578, section 4.5.
+            #   This use is deprecated for use in contexts that support
+            #   binary data such as HTTP. Senders SHOULD NOT generate
+            #   any parts with a Content-Transfer-Encoding header
+            #   field.
+            #
+            #   Currently, no deployed implementations that send such
+            #   bodies have been discovered.
+            if name == b'content-transfer-encoding' and value != b'binary':
+                return None
+            # NOTE(vytas): RFC 7578, section 4.8.
+            #   Other header fields MUST NOT be included and MUST be
+            #   ignored.
+            elif name in _ALLOWED_CONTENT_HEADERS:
+                headers[name] = value
+
+    return headers
+
+
+_parse_headers = _cy_parse_headers or _py_parse_headers
+
+
 # TODO(vytas): Consider supporting -charset- stuff.
 #   Does anyone use that (?)
 class BodyPart:
@@ -171,6 +224,25 @@ class BodyPart:
                         async for data_chunk in part.stream:
                             pass
 
+            If spooling is enabled via
+            :attr:`MultipartParseOptions.spool_threshold`, this attribute
+            refers to the same seekable file object as :attr:`file`, which
+            is positioned at the start of the part content.
+
+        file: A :class:`tempfile.SpooledTemporaryFile` holding the body part
+            content if spooling is enabled via
+            :attr:`MultipartParseOptions.spool_threshold`, and ``None``
+            otherwise. Content exceeding the threshold is transparently
+            written to a temporary file on disk, which is removed when this
+            object is closed.
+
+            Note:
+                The file is closed as soon as the form iterator advances to
+                the next part (or finishes), so the part content must be
+                consumed, copied, or memory-mapped while iterating.
+
+            See also: :meth:`~.get_mmap`.
+
         media (object): Property that acts as a convenience alias for
             :meth:`~.get_media`.
 
@@ -218,11 +290,74 @@ class BodyPart:
     _media = None
     _name = None
 
+    file = None
+
     def __init__(self, stream, headers, parse_options):
         self.stream = stream
         self._headers = headers
         self._parse_options = parse_options
 
+    @classmethod
+    def _spool(cls, stream, headers, parse_options):
+        spool_threshold = parse_options.spool_threshold
+        spooled = tempfile.SpooledTemporaryFile(
+            max_size=spool_threshold,
+            dir=parse_options.spool_directory,
+        )
+
+        try:
+            # NOTE(kgriffs): SpooledTemporaryFile treats a max_size of 0 as
+            #   no limit at all, rather than as a hint to write everything
+            #   out to disk.
+            if spool_threshold <= 0:
+                spooled.rollover()
+
+            stream.pipe(spooled)
+        except Exception:
+            spooled.close()
+            raise
+
+        spooled.seek(0)
+
+        part = cls(spooled, headers, parse_options)
+        part.file = spooled
+        return part
+
+    def get_mmap(self):
+        """Return a read-only memory map of the spooled body part content.
+
+        This method is only available when spooling is enabled via
+        :attr:`MultipartParseOptions.spool_threshold`. The returned
+        :class:`mmap.mmap` object supports the buffer protocol, so it can be
+        handed to libraries accepting bytes-like objects without copying the
+        content into memory.
+
+        Note:
+            If the content has not been written to disk yet because it does
+            not exceed the spool threshold, it is rolled over to a temporary
+            file first.
+
+        Returns:
+            mmap.mmap: A read-only memory map of the part content, or an empty
+            ``bytes`` object if the part is empty (since empty files can not
+            be memory-mapped).
+        """
+        if self.file is None:
+            raise MultipartParseError(
+                description='memory-mapping requires spooling to be enabled')
+
+        # NOTE(kgriffs): The file may be shared with a caller that is still
+        #   reading from it via the stream attribute, so we take care not to
+        #   move its position (rollover() preserves it as well).
+        self.file.rollover()
+        fileno = self.file.fileno()
+        size = os.fstat(fileno).st_size
+
+        if not size:
+            return b''
+
+        return mmap.mmap(fileno, size, access=mmap.ACCESS_READ)
+
     def get_data(self):
         """Return the body part content bytes.
 
@@ -378,7 +513,7 @@ class BodyPart:
                 self._media = handler.deserialize(
                     self.stream, self.content_type, None)
             finally:
-                if handler.exhaust_stream:
+                if handler.exhaust_stream and self.file is None:
                     self.stream.exhaust()
 
         return self._media
@@ -396,6 +531,13 @@ class MultipartForm:
         # This approach makes testing both the Cythonized and pure-Python
         #   streams easier within the same test/benchmark suite.
         if not hasattr(stream, 'read_until'):
+            # NOTE(kgriffs): The length may be unknown, e.g., when the body
+            #   is being decompressed on the fly. Use the largest value that
+            #   still fits into a Py_ssize_t, as required by the Cythonized
+            #   version of BufferedReader.
+            if content_length is None:
+                content_length = sys.maxsize
+
             if isinstance(stream, BoundedStream):
                 stream = BufferedReader(stream.stream.read, content_length)
             else:
@@ -411,11 +553,35 @@ class MultipartForm:
         self._parse_options = parse_options
 
     def __iter__(self):
+        parts = self._iterate_parts()
+        if self._parse_options.spool_threshold is None:
+            return parts
+
+        return self._close_spooled(parts)
+
+    def _close_spooled(self, parts):
+        # NOTE(kgriffs): Make sure spooled files do not linger around when
+        #   parts are skipped, or when the iteration is cut short.
+        spooled = None
+
+        try:
+            for part in parts:
+                if spooled is not None:
+                    spooled.close()
+
+                spooled = part.file
+                yield part
+        finally:
+            if spooled is not None:
+                spooled.close()
+
+    def _iterate_parts(self):
         prologue = True
         delimiter = self._dash_boundary
         stream = self._stream
         max_headers_size = self._parse_options.max_body_part_headers_size
         remaining_parts = self._parse_options.max_body_part_count
+        spool = self._parse_options.spool_threshold is not None
 
         while True:
             # NOTE(vytas): Either exhaust the unused stream part, or skip
@@ -442,36 +608,15 @@ class MultipartForm:
             except errors.DelimiterError as err:
                 raise MultipartParseError(description='unexpected form structure') from err
 
-            headers = {}
             try:
                 headers_block = stream.read_until(
                     _CRLF_CRLF, max_headers_size, consume_delimiter=True)
             except errors.DelimiterError as err:
                 raise MultipartParseError(description='incomplete body part headers') from err
 
-            for line in headers_block.split(_CRLF):
-                name, sep, value = line.partition(b': ')
-                if sep:
-                    name = name.lower()
-
-                    # NOTE(vytas): RFC 7578, section 4.5.
-                    #   This use is deprecated for use in contexts that support
-                    #   binary data such as HTTP. Senders SHOULD NOT generate
-                    #   any parts with a Content-Transfer-Encoding header
-                    #   field.
-                    #
-                    #   Currently, no deployed implementations that send such
-                    #   bodies have been discovered.
-                    if name == b'content-transfer-encoding' and value != b'binary':
-                        raise MultipartParseError(
-                            description=('the deprecated Content-Transfer-Encoding '
-                                         'header field is unsupported')
-                        )
-                    # NOTE(vytas): RFC 7578, section 4.8.
-                    #   Other header fields MUST NOT be included and MUST be
-                    #   ignored.
-                    elif name in _ALLOWED_CONTENT_HEADERS:
-                        headers[name] = value
+            headers = _parse_headers(headers_block)
+            if headers is None:
+                raise MultipartParseError(description=_UNSUPPORTED_CTE_MSG)
 
             remaining_parts -= 1
             if remaining_parts < 0 < self._parse_options.max_body_part_count:
@@ -479,8 +624,12 @@ class MultipartForm:
                     description='maximum number of form body parts exceeded'
                 )
 
-            yield BodyPart(stream.delimit(delimiter), headers,
-                           self._parse_options)
+            if spool:
+                yield BodyPart._spool(stream.delimit(delimiter), headers,
+                                      self._parse_options)
+            else:
+                yield BodyPart(stream.delimit(delimiter), headers,
+                               self._parse_options)
 
 
 class MultipartFormHandler(BaseHandler):
@@ -576,6 +725,29 @@ class MultipartParseOptions:
             media-types to handle. By default, handlers are provided for the
             ``application/json`` and ``application/x-www-form-urlencoded``
             media types.
+
+        spool_threshold (int): When set, each body part is spooled into a
+            :class:`tempfile.SpooledTemporaryFile` while iterating over the
+            form, and parts larger than this number of bytes are written to
+            a temporary file on disk instead of being kept in memory
+            (default: ``None``, meaning that parts are not spooled, and must
+            be consumed from the input stream while iterating). A value of
+            ``0`` writes every part to disk. Spooled parts expose the
+            temporary file via :attr:`BodyPart.file`, and can be
+            memory-mapped via :meth:`BodyPart.get_mmap`. The temporary file
+            is closed (and removed) once the iteration advances past the
+            part in question.
+
+            Note:
+                Spooling is currently only supported by WSGI apps; this
+                option is ignored by the ASGI multipart form parser.
+
+        spool_directory (str): The directory in which to create temporary
+            files for spooled body parts (default: ``None``, meaning to use
+            the platform's default temporary directory as per
+            :func:`tempfile.gettempdir`). Creating temporary files on the
+            same file system as their final destination makes it possible to
+            move them into place without copying.
     """
 
     _DEFAULT_HANDLERS = None
@@ -586,6 +758,8 @@ class MultipartParseOptions:
         'max_body_part_count',
         'max_body_part_headers_size',
         'media_handlers',
+        'spool_directory',
+        'spool_threshold',
     )
 
     def __init__(self):
@@ -594,3 +768,5 @@ class MultipartParseOptions:
         self.max_body_part_count = 64
         self.max_body_part_headers_size = 8192
         self.media_handlers = self._DEFAULT_HANDLERS
+        self.spool_directory = None
+        self.spool_threshold = None
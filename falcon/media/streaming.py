@@ -0,0 +1,152 @@
+"""Base class for media handlers that stream sequences of records."""
+
+from falcon import errors
+from falcon.media.base import BaseHandler
+
+
+__all__ = ['StreamingBaseHandler']
+
+
+# NOTE(kgriffs): Default cap on the size of a single record, matching the
+#   default max_buffer_size of msgpack.Unpacker().
+_MAX_BUFFER_SIZE = 100 * 1024 * 1024
+
+
+class StreamingBaseHandler(BaseHandler):
+    """Base class for handlers of concatenated (streamed) records.
+
+    Rather than buffering the whole request body and deserializing it in one
+    go, streaming handlers incrementally feed the body to an unpacker in
+    chunks, and return an iterator over the decoded records. For ASGI apps,
+    an asynchronous iterator is returned instead.
+
+    Conversely, :meth:`~.serialize` accepts an iterable of objects, and
+    returns the concatenation of the serialized records.
+
+    Note:
+        Since the deserialized media is an iterator, it can only be
+        consumed once, even though :meth:`falcon.Request.get_media` caches
+        the result of deserialization.
+
+    Child classes must implement :meth:`~._create_unpacker` and
+    :meth:`~._pack`.
+
+    Keyword Args:
+        chunk_size (int): The number of bytes to read from the request
+            stream at a time (default ``64 KiB``).
+    """
+
+    _media_name = None
+    """Name of the serialization format to use in error messages."""
+
+    _unpack_errors = (ValueError,)
+    """Exception types raised by the unpacker upon encountering bad data."""
+
+    def __init__(self, chunk_size=64 * 1024):
+        self._chunk_size = chunk_size
+
+    def _create_unpacker(self):
+        """Create a new incremental unpacker.
+
+        The returned object must expose a ``feed(data)`` method for
+        appending the next chunk, a ``tell()`` method returning the number
+        of bytes consumed so far, and yield any complete records when
+        iterated over.
+        """
+        raise NotImplementedError()
+
+    def _pack(self, obj):
+        """Serialize a single record to a byte string."""
+        raise NotImplementedError()
+
+    def deserialize(self, stream, content_type, content_length):
+        first_chunk = stream.read(self._chunk_size)
+        if not first_chunk:
+            raise errors.MediaNotFoundError(self._media_name)
+
+        return self._iter_records(stream, first_chunk)
+
+    async def deserialize_async(self, stream, content_type, content_length):
+        first_chunk = await stream.read(self._chunk_size)
+        if not first_chunk:
+            raise errors.MediaNotFoundError(self._media_name)
+
+        return _AsyncRecordIterator(self, stream, first_chunk)
+
+    def serialize(self, media, content_type) -> bytes:
+        pack = self._pack
+        return b''.join([pack(obj) for obj in media])
+
+    async def serialize_async(self, media, content_type) -> bytes:
+        return self.serialize(media, content_type)
+
+    def _iter_records(self, stream, chunk):
+        unpacker = self._create_unpacker()
+        unpack_errors = self._unpack_errors
+        total = 0
+
+        while chunk:
+            total += len(chunk)
+
+            try:
+                unpacker.feed(chunk)
+                yield from unpacker
+            except unpack_errors as err:
+                raise errors.MediaMalformedError(self._media_name) from err
+
+            chunk = stream.read(self._chunk_size)
+
+        if unpacker.tell() != total:
+            raise errors.MediaMalformedError(self._media_name)
+
+
+class _AsyncRecordIterator:
+    """Asynchronous counterpart of StreamingBaseHandler._iter_records()."""
+
+    __slots__ = (
+        '_chunk',
+        '_handler',
+        '_records',
+        '_stream',
+        '_total',
+        '_unpacker',
+    )
+
+    def __init__(self, handler, stream, first_chunk):
+        self._handler = handler
+        self._stream = stream
+        self._chunk = first_chunk
+        self._unpacker = handler._create_unpacker()
+        self._records = iter(())
+        self._total = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        handler = self._handler
+
+        while True:
+            try:
+                return next(self._records)
+            except StopIteration:
+                pass
+            except handler._unpack_errors as err:
+                raise errors.MediaMalformedError(handler._media_name) from err
+
+            chunk = self._chunk
+            if not chunk:
+                if self._unpacker.tell() != self._total:
+                    raise errors.MediaMalformedError(handler._media_name)
+
+                raise StopAsyncIteration
+
+            self._total += len(chunk)
+
+            try:
+                self._unpacker.feed(chunk)
+            except handler._unpack_errors as err:
+                raise errors.MediaMalformedError(handler._media_name) from err
+
+            self._records = iter(self._unpacker)
+            self._chunk = await self._stream.read(handler._chunk_size)
@@ -2,7 +2,7 @@ from urllib.parse import urlencode
 
 from falcon import errors
 from falcon.media.base import BaseHandler
-from falcon.util.uri import parse_query_string
+from falcon.util.uri import _FORM_CHUNK_SIZE, _URLEncodedFormParser
 
 
 class URLEncodedFormHandler(BaseHandler):
@@ -21,22 +21,44 @@ class URLEncodedFormHandler(BaseHandler):
     ``tuple``'s. If any values in the media object are sequences, each
     sequence element is converted to a separate parameter.
 
+    The request body is parsed incrementally as it is read from the stream,
+    so that the whole body never has to be buffered in memory. In order to
+    protect the app from overly large forms, the number of fields, as well as
+    the size of each field name and value, can be limited by the
+    corresponding keyword arguments below. Forms exceeding these limits are
+    rejected with :class:`falcon.MediaMalformedError` as soon as the offending
+    field is encountered.
+
     Keyword Arguments:
         keep_blank (bool): Whether to keep empty-string values from the form
             when deserializing.
         csv (bool): Whether to split comma-separated form values into list
             when deserializing.
+        max_pairs (int): The maximum number of ``&``-separated fields in the
+            form (default ``0``, meaning no limit).
+        max_key_size (int): The maximum length of a field name, in bytes,
+            before percent-decoding (default ``0``, meaning no limit).
+        max_value_size (int): The maximum length of a field value, in bytes,
+            before percent-decoding (default ``0``, meaning no limit).
     """
 
-    def __init__(self, keep_blank=True, csv=False):
+    def __init__(self, keep_blank=True, csv=False, max_pairs=0, max_key_size=0,
+                 max_value_size=0):
         self._keep_blank = keep_blank
         self._csv = csv
+        self._max_pairs = max_pairs
+        self._max_key_size = max_key_size
+        self._max_value_size = max_value_size
 
         # NOTE(kgriffs): To be safe, only enable the optimized protocol when
         #   not subclassed.
         if type(self) is URLEncodedFormHandler:
             self._serialize_sync = self.serialize
-            self._deserialize_sync = self._deserialize
+
+            # NOTE(vytas): The optimized protocol entails reading the whole
+            #   body at once, so only use it when no limits are configured.
+            if not (max_pairs or max_key_size or max_value_size):
+                self._deserialize_sync = self._deserialize
 
     # NOTE(kgriffs): Make content_type a kwarg to support the
     #   Request.render_body() shortcut optimization.
@@ -45,20 +67,44 @@ class URLEncodedFormHandler(BaseHandler):
         # behaviour.
         return urlencode(media, doseq=True).encode()
 
-    def _deserialize(self, body):
+    def _create_parser(self):
+        return _URLEncodedFormParser(
+            keep_blank=self._keep_blank,
+            csv=self._csv,
+            max_pairs=self._max_pairs,
+            max_key_size=self._max_key_size,
+            max_value_size=self._max_value_size,
+        )
+
+    def _parse_chunk(self, parser, chunk):
+        # NOTE(vytas): An empty chunk signifies EOF, in which case the
+        #   parsed form is returned.
         try:
-            # NOTE(kgriffs): According to http://goo.gl/6rlcux the
-            # body should be US-ASCII. Enforcing this also helps
-            # catch malicious input.
-            body = body.decode('ascii')
-            return parse_query_string(
-                body, keep_blank=self._keep_blank, csv=self._csv
-            )
+            if chunk:
+                parser.feed(chunk)
+                return None
+
+            return parser.close()
         except Exception as err:
             raise errors.MediaMalformedError('URL-encoded') from err
 
+    def _deserialize(self, body):
+        parser = self._create_parser()
+        self._parse_chunk(parser, body)
+        return self._parse_chunk(parser, b'')
+
     def deserialize(self, stream, content_type, content_length):
-        return self._deserialize(stream.read())
+        parser = self._create_parser()
+        while True:
+            chunk = stream.read(_FORM_CHUNK_SIZE)
+            result = self._parse_chunk(parser, chunk)
+            if not chunk:
+                return result
 
     async def deserialize_async(self, stream, content_type, content_length):
-        return self._deserialize(await stream.read())
+        parser = self._create_parser()
+        while True:
+            chunk = await stream.read(_FORM_CHUNK_SIZE)
+            result = self._parse_chunk(parser, chunk)
+            if not chunk:
+                return result
@@ -2,14 +2,21 @@ from functools import wraps
 from inspect import iscoroutinefunction
 
 import falcon
+from falcon.util.sync import sync_to_async
 
 try:
     import jsonschema
 except ImportError:  # pragma: nocover
-    pass
+    jsonschema = None
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: nocover
+    fastjsonschema = None
 
-def validate(req_schema=None, resp_schema=None, is_async=False):
+
+def validate(req_schema=None, resp_schema=None, is_async=False,
+             compiled=False, offload_threshold=None):
     """Validate ``req.media`` using JSON Schema.
 
     This decorator provides standard JSON Schema validation via the
@@ -17,6 +24,11 @@ def validate(req_schema=None, resp_schema=None, is_async=False):
     the *format* keyword is enabled for the default checkers implemented
     by ``jsonschema.FormatChecker``.
 
+    The schemas are checked, and the corresponding validator instances are
+    created, only once when the decorator is applied. The same validator is
+    then reused for every request, rather than re-checking the schema and
+    constructing a new validator and format checker each time.
+
     Note:
         The `jsonschema`` package must be installed separately in order to use
         this decorator, as Falcon does not install it by default.
@@ -45,6 +57,21 @@ def validate(req_schema=None, resp_schema=None, is_async=False):
             when using a cythonized coroutine function, since Cython does not
             flag them in a way that can be detected in advance, even when the
             function is declared using ``async def``.
+        compiled (bool): Set to ``True`` to compile the schemas into native
+            Python validation functions using the ``fastjsonschema`` package,
+            when it is available (default ``False``). Compiled validators are
+            typically much faster than ``jsonschema``, at the cost of
+            somewhat different error messages, and a different set of
+            supported *format* checkers. If ``fastjsonschema`` is not
+            installed, this option is ignored, and ``jsonschema`` is used
+            instead.
+        offload_threshold (int): For ASGI apps only, the minimum request
+            ``Content-Length``, in bytes, above which the request media is
+            validated in the default executor for the running loop instead of
+            directly on the event loop thread (default ``None``, meaning that
+            validation is never offloaded). Validating large documents is a
+            CPU-bound operation that may otherwise stall the loop for a
+            considerable amount of time.
 
     Example:
 
@@ -92,38 +119,79 @@ def validate(req_schema=None, resp_schema=None, is_async=False):
     """
 
     def decorator(func):
+        req_validator = _compile_schema(req_schema, compiled)
+        resp_validator = _compile_schema(resp_schema, compiled)
+
         if iscoroutinefunction(func) or is_async:
-            return _validate_async(func, req_schema, resp_schema)
+            return _validate_async(func, req_validator, resp_validator, offload_threshold)
 
-        return _validate(func, req_schema, resp_schema)
+        return _validate(func, req_validator, resp_validator)
 
     return decorator
 
 
-def _validate(func, req_schema=None, resp_schema=None):
+def _compile_schema(schema, compiled=False):
+    """Create a function that validates instances against the given schema.
+
+    The returned function returns ``None`` when the instance is valid, or
+    otherwise a message describing the validation error.
+    """
+
+    if schema is None:
+        return None
+
+    if compiled and fastjsonschema is not None:
+        compiled_validate = fastjsonschema.compile(schema)
+
+        def check_compiled(instance):
+            try:
+                compiled_validate(instance)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return e.message
+
+            return None
+
+        return check_compiled
+
+    if jsonschema is None:
+        # NOTE(kgriffs): Preserve the behavior of not requiring the
+        #   dependency until the decorated responder is actually called.
+        def check_missing_dep(instance):
+            raise RuntimeError(
+                'The jsonschema package must be installed in order to use '
+                'the falcon.media.validators.jsonschema.validate decorator.'
+            )
+
+        return check_missing_dep
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(schema, format_checker=jsonschema.FormatChecker())
+
+    def check(instance):
+        # NOTE(kgriffs): Report the "best" error, as jsonschema.validate()
+        #   does, rather than simply the first one encountered.
+        error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+        return None if error is None else error.message
+
+    return check
+
+
+def _validate(func, req_validator=None, resp_validator=None):
     @wraps(func)
     def wrapper(self, req, resp, *args, **kwargs):
-        if req_schema is not None:
-            try:
-                jsonschema.validate(
-                    req.media, req_schema,
-                    format_checker=jsonschema.FormatChecker()
-                )
-            except jsonschema.ValidationError as e:
+        if req_validator is not None:
+            error_message = req_validator(req.media)
+            if error_message is not None:
                 raise falcon.HTTPBadRequest(
                     title='Request data failed validation',
-                    description=e.message
+                    description=error_message
                 )
 
         result = func(self, req, resp, *args, **kwargs)
 
-        if resp_schema is not None:
-            try:
-                jsonschema.validate(
-                    resp.media, resp_schema,
-                    format_checker=jsonschema.FormatChecker()
-                )
-            except jsonschema.ValidationError:
+        if resp_validator is not None:
+            if resp_validator(resp.media) is not None:
                 raise falcon.HTTPInternalServerError(
                     title='Response data failed validation'
                     # Do not return 'e.message' in the response to
@@ -136,32 +204,30 @@ def _validate(func, req_schema=None, resp_schema=None):
     return wrapper
 
 
-def _validate_async(func, req_schema=None, resp_schema=None):
+def _validate_async(func, req_validator=None, resp_validator=None, offload_threshold=None):
     @wraps(func)
     async def wrapper(self, req, resp, *args, **kwargs):
-        if req_schema is not None:
+        if req_validator is not None:
             m = await req.get_media()
 
-            try:
-                jsonschema.validate(
-                    m, req_schema,
-                    format_checker=jsonschema.FormatChecker()
-                )
-            except jsonschema.ValidationError as e:
+            if (
+                offload_threshold is not None and
+                (req.content_length or 0) >= offload_threshold
+            ):
+                error_message = await sync_to_async(req_validator, m)
+            else:
+                error_message = req_validator(m)
+
+            if error_message is not None:
                 raise falcon.HTTPBadRequest(
                     title='Request data failed validation',
-                    description=e.message
+                    description=error_message
                 )
 
         result = await func(self, req, resp, *args, **kwargs)
 
-        if resp_schema is not None:
-            try:
-                jsonschema.validate(
-                    resp.media, resp_schema,
-                    format_checker=jsonschema.FormatChecker()
-                )
-            except jsonschema.ValidationError:
+        if resp_validator is not None:
+            if resp_validator(resp.media) is not None:
                 raise falcon.HTTPInternalServerError(
                     title='Response data failed validation'
                     # Do not return 'e.message' in the response to
@@ -1,7 +1,64 @@
-from typing import Iterable, Optional, Union
+from array import array
+import asyncio
+from collections import OrderedDict
+import hashlib
+import inspect
+import json
+import math
+import mmap
+import os
+import tempfile
+import threading
+import time
+from typing import Iterable, Mapping, Optional, Pattern, Union
+import zlib
 
+from .errors import HTTPTooManyRequests
 from .request import Request
 from .response import Response
+from .status_codes import HTTP_304
+from .util.misc import (
+    _lru_cache_safe,
+    _negotiate_content_coding,
+    code_to_http_status,
+    http_status_to_code,
+)
+from .util.structures import ETag
+from .util.sync import get_running_loop
+
+
+# NOTE(kgriffs): Block size to use when reading from a file-like
+#   Response.stream in order to compress it.
+_STREAM_BLOCK_SIZE = 8 * 1024
+
+_DEFAULT_COMPRESSION_LEVELS = {
+    'br': 4,
+    'gzip': 6,
+    'zstd': 3,
+}
+
+_COMPRESSIBLE_MEDIA_TYPES = frozenset([
+    'application/javascript',
+    'application/json',
+    'application/x-ndjson',
+    'application/xml',
+    'application/yaml',
+    'image/svg+xml',
+])
+
+# NOTE(kgriffs): Responses with these status codes never have content that
+#   could be compressed (or, in the case of 206, must not be transformed).
+_UNCOMPRESSIBLE_STATUS_CODES = frozenset([204, 206, 304])
+
+# NOTE(kgriffs): Status codes that are cacheable by default, as per
+#   RFC 7231, Section 6.1 (plus 308, as per RFC 7538).
+_CACHEABLE_STATUS_CODES = frozenset([200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501])
+
+# NOTE(kgriffs): Response directives that preclude storing the response in a
+#   shared cache, as per RFC 7234, Section 3.
+_UNCACHEABLE_DIRECTIVES = frozenset(['no-cache', 'no-store', 'private'])
+
+_GET_HEAD_METHODS = frozenset(['GET', 'HEAD'])
 
 
 class CORSMiddleware(object):
@@ -10,14 +67,30 @@ class CORSMiddleware(object):
     This middleware provides a simple out-of-the box CORS policy, including handling
     of preflighted requests from the browser.
 
+    The CORS headers for each distinct origin are computed only once, and then
+    reused for subsequent requests from the same origin. When the allowed
+    methods are specified via `allow_methods`, preflighted requests are
+    answered directly from ``process_request()``, without routing the
+    request to the resource at all::
+
+        app = falcon.App(middleware=falcon.CORSMiddleware(
+            allow_origins=[
+                'https://example.com',
+                re.compile(r'https://[a-z0-9-]+\\.example\\.com'),
+            ],
+            allow_methods=['GET', 'POST', 'DELETE'],
+        ))
+
     See also:
 
     * https://developer.mozilla.org/en-US/docs/Web/HTTP/CORS
     * https://www.w3.org/TR/cors/#resource-processing-model
 
     Keyword Arguments:
-        allow_origins (Union[str, Iterable[str]]): List of origins to allow (case
-            sensitive). The string ``'*'`` acts as a wildcard, matching every origin.
+        allow_origins (Union[str, Iterable[Union[str, Pattern]]]): List of origins
+            to allow (case sensitive). The string ``'*'`` acts as a wildcard, matching
+            every origin. Compiled regular expressions may also be included in the
+            list, in which case any origin that the pattern fully matches is allowed.
             (default ``'*'``).
         expose_headers (Optional[Union[str, Iterable[str]]]): List of additional response
             headers to expose via the ``Access-Control-Expose-Headers`` header.
@@ -32,25 +105,44 @@ class CORSMiddleware(object):
             The string ``'*'`` acts as a wildcard, matching every allowed origin, while
             ``None`` disallows all origins. This parameter takes effect only
             if the origin is allowed by the ``allow_origins`` argument. (Default ``None``).
+        allow_methods (Optional[Union[str, Iterable[str]]]): List of methods to allow
+            via the ``Access-Control-Allow-Methods`` header in response to preflighted
+            requests. When specified, preflighted requests from allowed origins are
+            answered by the middleware itself; otherwise, they are routed as usual, and
+            the methods supported by the resource are allowed. (default ``None``).
+        allow_headers (Optional[Union[str, Iterable[str]]]): List of request headers to
+            allow via the ``Access-Control-Allow-Headers`` header in response to
+            preflighted requests (default ``None``, meaning that the headers requested
+            via ``Access-Control-Request-Headers`` are allowed).
 
     """
     def __init__(
         self,
-        allow_origins: Union[str, Iterable[str]] = '*',
+        allow_origins: Union[str, Iterable[Union[str, Pattern]]] = '*',
         expose_headers: Optional[Union[str, Iterable[str]]] = None,
         allow_credentials: Optional[Union[str, Iterable[str]]] = None,
+        allow_methods: Optional[Union[str, Iterable[str]]] = None,
+        allow_headers: Optional[Union[str, Iterable[str]]] = None,
     ):
+        self._allow_origin_patterns = ()
+
         if allow_origins == '*':
             self.allow_origins = allow_origins
         else:
             if isinstance(allow_origins, str):
                 allow_origins = [allow_origins]
-            self.allow_origins = frozenset(allow_origins)
+            allow_origins = list(allow_origins)
+            self.allow_origins = frozenset(
+                origin for origin in allow_origins if isinstance(origin, str)
+            )
             if '*' in self.allow_origins:
                 raise ValueError(
                     'The wildcard string "*" may only be passed to allow_origins as a '
                     'string literal, not inside an iterable.'
                 )
+            self._allow_origin_patterns = tuple(
+                origin for origin in allow_origins if not isinstance(origin, str)
+            )
 
         if expose_headers is not None and not isinstance(expose_headers, str):
             expose_headers = ', '.join(expose_headers)
@@ -69,6 +161,69 @@ class CORSMiddleware(object):
                 )
         self.allow_credentials = allow_credentials
 
+        if allow_headers is not None and not isinstance(allow_headers, str):
+            allow_headers = ', '.join(allow_headers)
+        self._allow_headers = allow_headers
+
+        # PERF(kgriffs): Pre-render the preflight headers that do not depend
+        #   on the request, so that they can simply be copied to the response.
+        self._preflight_headers = None
+        if allow_methods is not None:
+            if not isinstance(allow_methods, str):
+                allow_methods = ', '.join(allow_methods)
+
+            preflight_headers = [
+                ('access-control-allow-methods', allow_methods),
+                ('access-control-max-age', '86400'),  # 24 hours
+            ]
+            if allow_headers is not None:
+                preflight_headers.append(('access-control-allow-headers', allow_headers))
+
+            self._preflight_headers = tuple(preflight_headers)
+
+        # PERF(kgriffs): Browsers send the same few origins over and over
+        #   again, so we memoize both the access check and the headers
+        #   rendered for each origin.
+        self._get_origin_headers = _lru_cache_safe(maxsize=1024)(self._render_origin_headers)
+
+        # NOTE(kgriffs): Only hook into request processing when preflighted
+        #   requests are to be answered by the middleware, so that the
+        #   default policy does not add any overhead to every request.
+        if self._preflight_headers is not None:
+            self.process_request = self._process_preflight
+            self.process_request_async = self._process_preflight_async
+
+    def _process_preflight(self, req: Request, resp: Response):
+        """Answer CORS preflight requests.
+
+        Preflighted requests from allowed origins are answered directly,
+        and the request is not routed to any resource.
+        """
+
+        if req.method != 'OPTIONS':
+            return
+
+        origin = req.get_header('Origin')
+        if origin is None or not req.get_header('Access-Control-Request-Method'):
+            return
+
+        origin_headers = self._get_origin_headers(origin)
+        if origin_headers is None:
+            return
+
+        headers = resp._headers
+        headers.update(origin_headers)
+        headers.update(self._preflight_headers)
+
+        if self._allow_headers is None:
+            headers['access-control-allow-headers'] = req.get_header(
+                'Access-Control-Request-Headers', default='*')
+
+        resp.complete = True
+
+    async def _process_preflight_async(self, req: Request, resp: Response):
+        self._process_preflight(req, resp)
+
     def process_response(self, req: Request, resp: Response, resource, req_succeeded):
         """Implement the CORS policy for all routes.
 
@@ -84,20 +239,18 @@ class CORSMiddleware(object):
         if origin is None:
             return
 
-        if self.allow_origins != '*' and origin not in self.allow_origins:
+        origin_headers = self._get_origin_headers(origin)
+        if origin_headers is None:
             return
 
-        if resp.get_header('Access-Control-Allow-Origin') is None:
-            set_origin = '*' if self.allow_origins == '*' else origin
-            if self.allow_credentials == '*' or origin in self.allow_credentials:
-                set_origin = origin
-                resp.set_header('Access-Control-Allow-Credentials', 'true')
-            resp.set_header('Access-Control-Allow-Origin', set_origin)
+        if 'access-control-allow-origin' not in resp._headers:
+            resp._headers.update(origin_headers)
 
         if self.expose_headers:
             resp.set_header('Access-Control-Expose-Headers', self.expose_headers)
 
-        if (req_succeeded and
+        if (self._preflight_headers is None and
+                req_succeeded and
                 req.method == 'OPTIONS' and
                 req.get_header('Access-Control-Request-Method')):
 
@@ -107,7 +260,9 @@ class CORSMiddleware(object):
             allow = resp.get_header('Allow')
             resp.delete_header('Allow')
 
-            allow_headers = req.get_header('Access-Control-Request-Headers', default='*')
+            allow_headers = self._allow_headers
+            if allow_headers is None:
+                allow_headers = req.get_header('Access-Control-Request-Headers', default='*')
 
             resp.set_header('Access-Control-Allow-Methods', allow)
             resp.set_header('Access-Control-Allow-Headers', allow_headers)
@@ -115,3 +270,1634 @@ class CORSMiddleware(object):
 
     async def process_response_async(self, *args):
         self.process_response(*args)
+
+    def _render_origin_headers(self, origin):
+        if self.allow_origins != '*' and origin not in self.allow_origins:
+            for pattern in self._allow_origin_patterns:
+                if pattern.fullmatch(origin):
+                    break
+            else:
+                return None
+
+        if self.allow_credentials == '*' or origin in self.allow_credentials:
+            return (
+                ('access-control-allow-origin', origin),
+                ('access-control-allow-credentials', 'true'),
+            )
+
+        set_origin = '*' if self.allow_origins == '*' else origin
+        return (('access-control-allow-origin', set_origin),)
+
+
+class CompressionMiddleware:
+    """Response compression middleware.
+
+    This middleware compresses response bodies using the best content coding
+    that is supported by both the server and the user agent, as negotiated
+    via the ``Accept-Encoding`` request header. The following content codings
+    are supported:
+
+    * ``gzip``, which is always available.
+    * ``br`` (Brotli), if the ``brotli`` package is installed.
+    * ``zstd`` (Zstandard), if the ``zstandard`` package is installed.
+
+    Bodies set via :attr:`~falcon.Response.text`,
+    :attr:`~falcon.Response.data`, or :attr:`~falcon.Response.media` are
+    compressed as a whole, while :attr:`~falcon.Response.stream` is wrapped in
+    a streaming compressor, so that the response is never buffered in its
+    entirety. In both cases, ``Vary: Accept-Encoding`` is added to
+    compressible responses, regardless of whether the particular response
+    was compressed.
+
+    Responses to ``HEAD`` requests are negotiated in the same way, so that
+    they carry the same ``Vary`` and ``Content-Encoding`` headers as the
+    corresponding ``GET`` response. However, since the body is never sent,
+    it is not compressed, and ``Content-Length`` is omitted in that case.
+
+    In order to also compress responses that are modified by other
+    middleware components, this component should normally be listed first,
+    so that its ``process_response()`` method is invoked last::
+
+        app = falcon.App(middleware=[
+            falcon.CompressionMiddleware(),
+            AuthMiddleware(),
+        ])
+
+    A response is not compressed if any of the following is true:
+
+    * The response already specifies a ``Content-Encoding``.
+    * The response includes ``Cache-Control: no-transform``.
+    * The response status indicates that there is no content to compress
+      (e.g., 204 or 304), or the response is a partial one (206).
+    * The media type of the response is not deemed compressible.
+    * The length of the body is known to be less than `min_size`.
+
+    Keyword Arguments:
+        min_size (int): The minimum size, in bytes, of a body to compress
+            (default ``1024``). Smaller bodies are not worth the overhead of
+            compressing them.
+        encodings (Iterable[str]): The content codings to support, in order
+            of preference (default ``('br', 'zstd', 'gzip')``, omitting any
+            that are not available). When the user agent assigns the same
+            quality value to several codings, the first one in this list
+            wins.
+        levels (Mapping[str, int]): Compression levels to use for the
+            individual content codings, overriding the default level of the
+            respective coding (``4`` for ``br``, ``3`` for ``zstd``, and
+            ``6`` for ``gzip``).
+        media_types (Iterable[str]): The media types to compress (default
+            ``None``, meaning any ``text/*`` type, any type with a ``+json``
+            or ``+xml`` suffix, or one of a few common types such as
+            ``application/json`` and ``application/javascript``). A trailing
+            ``'/*'`` may be used to match any subtype.
+        executor_threshold (int): In ASGI apps, bodies (and stream chunks)
+            of at least this many bytes are compressed using the event loop's
+            default executor, so as not to block the event loop while doing
+            so (default ``262144``, i.e., 256 KiB). Set to ``None`` to always
+            compress bodies on the event loop.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        encodings: Optional[Iterable[str]] = None,
+        levels: Optional[Mapping[str, int]] = None,
+        media_types: Optional[Iterable[str]] = None,
+        executor_threshold: Optional[int] = 256 * 1024,
+    ):
+        self._min_size = min_size
+        self._executor_threshold = executor_threshold
+
+        compression_levels = dict(_DEFAULT_COMPRESSION_LEVELS)
+        if levels:
+            compression_levels.update(levels)
+
+        if encodings is None:
+            self._compressors = {}
+            for encoding in ('br', 'zstd', 'gzip'):
+                try:
+                    self._compressors[encoding] = _create_compressor_factory(
+                        encoding, compression_levels[encoding])
+                except ImportError:
+                    pass
+
+            self._encodings = tuple(self._compressors)
+        else:
+            self._encodings = tuple(encodings)
+            if not self._encodings:
+                raise ValueError('At least one encoding must be specified')
+
+            self._compressors = {
+                encoding: _create_compressor_factory(encoding, compression_levels.get(encoding))
+                for encoding in self._encodings
+            }
+
+        if media_types is None:
+            self._is_compressible = _is_compressible_default
+        else:
+            self._is_compressible = _create_media_type_matcher(media_types)
+
+        # PERF(kgriffs): Only a handful of distinct Accept-Encoding values are
+        #   normally seen in practice, so we memoize the negotiation.
+        self._negotiate = _lru_cache_safe(maxsize=64)(self._negotiate_encoding)
+
+    def process_response(self, req: Request, resp: Response, resource, req_succeeded):
+        """Compress the response body, if applicable."""
+
+        if not self._is_eligible(req, resp):
+            return
+
+        stream = resp.stream
+
+        if req.method == 'HEAD':
+            if stream is None:
+                body = resp.render_body()
+                length = len(body) if body else 0
+            else:
+                length = _get_content_length(resp)
+
+            encoding = self._select_encoding(req, resp, length)
+            if encoding is not None:
+                _set_head_encoding(resp, encoding)
+
+            return
+
+        if stream is None:
+            body = resp.render_body()
+            encoding = self._select_encoding(req, resp, len(body) if body else 0)
+            if encoding is None:
+                return
+
+            compressor = self._compressors[encoding]()
+            _set_compressed_body(resp, encoding, compressor.compress(body) + compressor.flush())
+
+        else:
+            encoding = self._select_encoding(req, resp, _get_content_length(resp))
+            if encoding is None:
+                return
+
+            _set_compressed_stream(
+                resp, encoding, _compress_stream(stream, self._compressors[encoding]()))
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Compress the response body, if applicable."""
+
+        if not self._is_eligible(req, resp) or resp.sse is not None:
+            return
+
+        stream = resp.stream
+
+        if req.method == 'HEAD':
+            if stream is None:
+                body = await resp.render_body()
+                length = len(body) if body else 0
+            else:
+                length = _get_content_length(resp)
+
+            encoding = self._select_encoding(req, resp, length)
+            if encoding is not None:
+                _set_head_encoding(resp, encoding)
+
+            return
+
+        if stream is None:
+            body = await resp.render_body()
+            encoding = self._select_encoding(req, resp, len(body) if body else 0)
+            if encoding is None:
+                return
+
+            compressor = self._compressors[encoding]()
+            threshold = self._executor_threshold
+
+            if threshold is not None and len(body) >= threshold:
+                data = await get_running_loop().run_in_executor(
+                    None, _compress_all, compressor, body)
+            else:
+                data = compressor.compress(body) + compressor.flush()
+
+            _set_compressed_body(resp, encoding, data)
+
+        else:
+            encoding = self._select_encoding(req, resp, _get_content_length(resp))
+            if encoding is None:
+                return
+
+            _set_compressed_stream(
+                resp, encoding,
+                _AsyncCompressedStream(
+                    stream, self._compressors[encoding](), self._executor_threshold
+                )
+            )
+
+    def _is_eligible(self, req, resp):
+        if resp.get_header('Content-Encoding') is not None:
+            return False
+
+        status = http_status_to_code(resp.status)
+        if status < 200 or status in _UNCOMPRESSIBLE_STATUS_CODES:
+            return False
+
+        cache_control = resp.get_header('Cache-Control')
+        return cache_control is None or 'no-transform' not in cache_control.lower()
+
+    def _select_encoding(self, req, resp, length):
+        if length is not None and (not length or length < self._min_size):
+            return None
+
+        content_type = resp.content_type
+        if not content_type or not self._is_compressible(content_type):
+            return None
+
+        vary = resp.get_header('Vary')
+        if vary is None:
+            resp.set_header('Vary', 'Accept-Encoding')
+        elif 'accept-encoding' not in vary.lower() and vary.strip() != '*':
+            resp.set_header('Vary', vary + ', Accept-Encoding')
+
+        accept_encoding = req.get_header('Accept-Encoding')
+        if not accept_encoding:
+            return None
+
+        return self._negotiate(accept_encoding)
+
+    def _negotiate_encoding(self, accept_encoding):
+        # NOTE(kgriffs): Ties are resolved in favor of the server's
+        #   preferred encoding, which comes first.
+        return _negotiate_content_coding(accept_encoding, self._encodings)
+
+
+class CachingMiddleware:
+    """Response caching middleware.
+
+    This middleware stores fully rendered responses (i.e., the status,
+    headers, and body) in a cache backend, and serves subsequent ``GET``
+    and ``HEAD`` requests for the same resource directly from the cache,
+    short-circuiting request processing by way of
+    :attr:`~falcon.Response.complete`.
+
+    Cache entries are keyed on the request's host, path, and query string,
+    as well as on the values of any request headers that are listed in the
+    ``Vary`` header of the cached response. Responses to ``HEAD`` requests
+    are served using the entry stored for the corresponding ``GET``
+    request.
+
+    Whether, and for how long, a response is cached is controlled by the
+    ``Cache-Control`` header set by the responder. A response is stored
+    only if all of the following are true:
+
+    * The request method is ``GET``, and the request does not include an
+      ``Authorization`` header or ``Cache-Control: no-store``.
+    * The response status is cacheable by default (e.g., 200, 301, or 404).
+    * The response specifies a freshness lifetime via the ``s-maxage`` or
+      ``max-age`` directive, or else `default_ttl` is set.
+    * The response does not specify ``no-cache``, ``no-store``, or
+      ``private``; does not set any cookies; does not include
+      ``Vary: *``; and does not use :attr:`~falcon.Response.stream`.
+
+    Requests that include ``Cache-Control: no-cache`` (or ``no-store``)
+    bypass the cache, although the new response may still replace the
+    cached one.
+
+    In order to serve responses as they were finally rendered by other
+    middleware components (e.g., :class:`~falcon.CompressionMiddleware`),
+    and to short-circuit processing as early as possible, this component
+    should normally be listed first::
+
+        app = falcon.App(middleware=[
+            falcon.CachingMiddleware(),
+            falcon.CompressionMiddleware(),
+        ])
+
+    The cache backend may be any object that implements the following
+    methods (both of which must be thread-safe, and should not block for
+    any significant amount of time, since they are also invoked directly
+    on the event loop in ASGI apps):
+
+    * ``get(key)``, returning the ``bytes`` previously stored under the
+      given ``str`` key, or ``None`` if the key is not found or has
+      expired.
+    * ``set(key, value, ttl)``, storing ``value`` (``bytes``) under
+      ``key`` for ``ttl`` seconds.
+
+    Keyword Arguments:
+        backend (object): The cache backend to use (default ``None``, in
+            which case a new :class:`~falcon.middleware.MemoryCacheBackend`
+            is used). See also:
+            :class:`~falcon.middleware.SharedMemoryCacheBackend`.
+        default_ttl (int): The number of seconds to cache responses that
+            do not specify a freshness lifetime (default ``None``, meaning
+            that such responses are not cached).
+        max_body_size (int): The maximum size, in bytes, of a response body
+            to cache (default ``1048576``, i.e., 1 MiB).
+
+    Attributes:
+        hits (int): The number of requests that were served from the cache.
+        misses (int): The number of requests that were eligible to be
+            served from the cache, but no cached response was found.
+        hit_ratio (float): The ratio of `hits` to the total number of
+            eligible requests, or ``0.0`` if there were none yet.
+
+            Note:
+                The above counters are not synchronized between threads
+                (nor between processes), and so should only be regarded as
+                approximate.
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        default_ttl: Optional[int] = None,
+        max_body_size: int = 1024 * 1024,
+    ):
+        self._backend = MemoryCacheBackend() if backend is None else backend
+        self._default_ttl = default_ttl
+        self._max_body_size = max_body_size
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def process_request(self, req: Request, resp: Response):
+        """Serve the response from the cache, if possible."""
+
+        if req.method not in _GET_HEAD_METHODS or req.get_header('Authorization'):
+            return
+
+        directives = _parse_cache_control(req.get_header('Cache-Control'))
+        if 'no-cache' in directives or 'no-store' in directives:
+            return
+
+        key = _get_cache_key(req)
+        entry = self._load(req, key)
+
+        if entry is None:
+            self.misses += 1
+            return
+
+        self.hits += 1
+        _set_cached_response(resp, *entry)
+
+    async def process_request_async(self, req, resp):
+        """Serve the response from the cache, if possible."""
+
+        self.process_request(req, resp)
+
+    def process_response(self, req: Request, resp: Response, resource, req_succeeded):
+        """Store the response in the cache, if applicable."""
+
+        ttl = self._get_ttl(req, resp)
+        if ttl is not None:
+            self._store(req, resp, resp.render_body(), ttl)
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Store the response in the cache, if applicable."""
+
+        if resp.sse is not None:
+            return
+
+        ttl = self._get_ttl(req, resp)
+        if ttl is not None:
+            self._store(req, resp, await resp.render_body(), ttl)
+
+    def _get_ttl(self, req, resp):
+        # NOTE(kgriffs): resp.complete is also set when the response was
+        #   served from the cache in the first place.
+        if req.method != 'GET' or resp.complete or resp.stream is not None:
+            return None
+
+        if resp._cookies or req.get_header('Authorization'):
+            return None
+
+        if http_status_to_code(resp.status) not in _CACHEABLE_STATUS_CODES:
+            return None
+
+        if 'no-store' in _parse_cache_control(req.get_header('Cache-Control')):
+            return None
+
+        directives = _parse_cache_control(resp.get_header('Cache-Control'))
+        if not _UNCACHEABLE_DIRECTIVES.isdisjoint(directives):
+            return None
+
+        ttl = directives.get('s-maxage', directives.get('max-age'))
+        if ttl is None:
+            return self._default_ttl
+
+        try:
+            ttl = int(ttl)
+        except ValueError:
+            return None
+
+        return ttl if ttl > 0 else None
+
+    def _load(self, req, key):
+        value = self._backend.get(key)
+        if value is None:
+            return None
+
+        meta, body = _decode_cache_entry(value)
+
+        # NOTE(kgriffs): In the case that the response varies based on one
+        #   or more request headers, the primary entry merely lists the
+        #   names of those headers, and the response itself is stored under
+        #   a secondary key that also incorporates their values.
+        if meta[1] is None:
+            value = self._backend.get(_get_variant_key(req, key, meta[2]))
+            if value is None:
+                return None
+
+            meta, body = _decode_cache_entry(value)
+
+        return meta, body
+
+    def _store(self, req, resp, body, ttl):
+        body = body or b''
+        if len(body) > self._max_body_size:
+            return
+
+        extra_headers = resp._extra_headers or []
+        if any(name.lower() == 'set-cookie' for name, __ in extra_headers):
+            return
+
+        vary = _parse_vary(resp.get_header('Vary'))
+        if vary is None:
+            return
+
+        now = time.time()
+        key = _get_cache_key(req)
+
+        # NOTE(kgriffs): Content-Length will be set by the framework to
+        #   match the cached body, or omitted when it is served as-is.
+        headers = [item for item in resp._headers.items() if item[0] != 'content-length']
+        value = _encode_cache_entry(
+            [now, code_to_http_status(resp.status), headers, extra_headers], body)
+
+        if vary:
+            self._backend.set(key, _encode_cache_entry([now, None, vary], b''), ttl)
+            key = _get_variant_key(req, key, vary)
+
+        self._backend.set(key, value, ttl)
+
+
+class MemoryCacheBackend:
+    """In-process cache backend for :class:`~falcon.CachingMiddleware`.
+
+    Entries are evicted in least-recently-used order as needed in order to
+    keep the total size of the cached values within `max_size`, while
+    expired entries are discarded upon the next attempt to access them.
+
+    Note:
+        Each process maintains its own cache, so a multi-process app
+        server will cache (and render) each response once per worker. See
+        also :class:`~falcon.middleware.SharedMemoryCacheBackend`.
+
+    Keyword Arguments:
+        max_size (int): The maximum total size, in bytes, of the cached
+            values (default ``67108864``, i.e., 64 MiB).
+    """
+
+    __slots__ = ['_entries', '_lock', '_max_size', '_size']
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._size = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the value stored under the given key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bytes: The cached value, or ``None`` if the key was not found or
+            has expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                self._discard(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float):
+        """Store a value under the given key.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The value to store.
+            ttl (float): The number of seconds after which the entry
+                expires.
+        """
+
+        size = len(value)
+
+        with self._lock:
+            self._discard(key)
+
+            if size > self._max_size:
+                return
+
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._size += size
+
+            while self._size > self._max_size:
+                __, (__, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def delete(self, key: str):
+        """Remove the value stored under the given key, if any."""
+
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class SharedMemoryCacheBackend:
+    """Cache backend for :class:`~falcon.CachingMiddleware` that is shared between processes.
+
+    Each entry is stored as a separate file in the given directory, so
+    that any number of worker processes on the same host can share a
+    single cache. In order for the cache to actually reside in shared
+    memory, the directory should be located on a memory-backed file system
+    such as ``/dev/shm`` (on Linux)::
+
+        backend = falcon.middleware.SharedMemoryCacheBackend('/dev/shm/myapp-cache')
+        app = falcon.App(middleware=[falcon.CachingMiddleware(backend=backend)])
+
+    Files are written atomically, and the expiration time of each entry is
+    tracked via the modification time of its file. Expired entries are
+    removed upon the next attempt to access them, as well as periodically
+    after storing new entries.
+
+    Note:
+        The directory should be dedicated to a single app, since the cache
+        keys do not otherwise distinguish between different apps that are
+        served from the same host.
+
+    Args:
+        directory (str): The directory in which to store the entries. The
+            directory is created as needed (with permissions restricted to
+            the current user).
+
+    Keyword Arguments:
+        prune_interval (int): Remove expired entries from the directory
+            after every `prune_interval` new entries that are stored by the
+            current process (default ``1024``).
+    """
+
+    __slots__ = ['_directory', '_lock', '_prune_interval', '_stored']
+
+    def __init__(self, directory: str, prune_interval: int = 1024):
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._prune_interval = prune_interval
+        self._stored = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the value stored under the given key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bytes: The cached value, or ``None`` if the key was not found or
+            has expired.
+        """
+
+        path = self._get_path(key)
+
+        try:
+            with open(path, 'rb') as cached_file:
+                if os.fstat(cached_file.fileno()).st_mtime <= time.time():
+                    expired = True
+                else:
+                    return cached_file.read()
+        except OSError:
+            return None
+
+        if expired:
+            _remove_file(path)
+
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float):
+        """Store a value under the given key.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The value to store.
+            ttl (float): The number of seconds after which the entry
+                expires.
+        """
+
+        expires = time.time() + ttl
+
+        fd, temp_path = tempfile.mkstemp(dir=self._directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(value)
+
+            os.utime(temp_path, (expires, expires))
+            os.replace(temp_path, self._get_path(key))
+        except BaseException:
+            _remove_file(temp_path)
+            raise
+
+        with self._lock:
+            self._stored += 1
+            prune = self._stored % self._prune_interval == 0
+
+        if prune:
+            self.prune()
+
+    def delete(self, key: str):
+        """Remove the value stored under the given key, if any."""
+
+        _remove_file(self._get_path(key))
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        self._remove_entries(None)
+
+    def prune(self):
+        """Remove all expired entries from the cache."""
+
+        self._remove_entries(time.time())
+
+    def _get_path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8', 'surrogatepass')).hexdigest()
+        return os.path.join(self._directory, digest)
+
+    def _remove_entries(self, now):
+        for entry in os.scandir(self._directory):
+            # NOTE(kgriffs): Skip files that are still being written by
+            #   other processes.
+            if entry.name.startswith('.tmp-'):
+                continue
+
+            try:
+                if now is None or entry.stat().st_mtime <= now:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+
+class ETagMiddleware:
+    """Automatic entity-tag middleware.
+
+    This middleware sets the ``ETag`` header of successful (200) responses to
+    ``GET`` and ``HEAD`` requests, based on a hash of the rendered body, and
+    turns the response into a ``304 Not Modified`` one (sans body) when the
+    new entity-tag matches one of those listed in the request's
+    ``If-None-Match`` header. Responses for which the ``ETag`` header was
+    already set (e.g., by the responder, or by
+    :class:`~falcon.media.RenderCache`) keep their entity-tag, but are still
+    subject to the ``If-None-Match`` precondition.
+
+    Bodies are hashed using the non-cryptographic xxHash algorithm if the
+    ``xxhash`` package is installed, or SHA-1 otherwise. Streamed responses
+    (i.e., those using :attr:`~falcon.Response.stream`) are left alone.
+
+    Note:
+        Since the body must still be rendered in order to hash it, a
+        matching ``If-None-Match`` header only saves bandwidth. In order to
+        also save the work of producing the response, a `validator` may be
+        provided that is able to derive the current entity-tag of the
+        requested resource (e.g., from a version number or a modification
+        timestamp) without rendering it. The validator is invoked after
+        routing, but before the responder; if it returns an entity-tag
+        that matches the precondition, a 304 response is returned right
+        away without invoking the responder::
+
+            def get_etag(req, resource, params):
+                if isinstance(resource, ThingResource):
+                    return str(resource.store.get_version(params['thing_id']))
+
+                return None
+
+            app = falcon.App(middleware=[
+                falcon.ETagMiddleware(validator=get_etag),
+            ])
+
+        Otherwise, the returned entity-tag is set on the response, and it is
+        not overridden by the hash of the body.
+
+    Keyword Arguments:
+        weak (bool): Set to ``True`` to mark generated entity-tags as weak
+            (default ``False``). A weak entity-tag signals to caches that
+            the representation is only semantically equivalent, and so may
+            not be used to satisfy byte range requests, for instance.
+        validator (callable): A pre-render validator, i.e., a function (or
+            in the case of an ASGI app, possibly a coroutine function) that
+            accepts the request, the resource, and the dict of URI template
+            field values as arguments, and returns either the current
+            entity-tag of the requested resource, or ``None`` if it is not
+            known. The entity-tag may be returned either as an opaque-tag
+            (i.e., a ``str`` without quotes), or as an instance of
+            :class:`falcon.ETag`.
+    """
+
+    def __init__(self, weak: bool = False, validator=None):
+        self._prefix = 'W/"' if weak else '"'
+        self._validator = validator
+        self._hash = _create_body_hasher()
+
+    def process_resource(self, req: Request, resp: Response, resource, params):
+        """Respond with 304 Not Modified if the validator's entity-tag matches."""
+
+        if self._validator is not None and req.method in _GET_HEAD_METHODS:
+            _apply_validator(req, resp, self._validator(req, resource, params))
+
+    async def process_resource_async(self, req, resp, resource, params):
+        """Respond with 304 Not Modified if the validator's entity-tag matches."""
+
+        if self._validator is not None and req.method in _GET_HEAD_METHODS:
+            etag = self._validator(req, resource, params)
+            if inspect.isawaitable(etag):
+                etag = await etag
+
+            _apply_validator(req, resp, etag)
+
+    def process_response(self, req: Request, resp: Response, resource, req_succeeded):
+        """Set the ETag header, and check the If-None-Match precondition."""
+
+        if not self._is_eligible(req, resp):
+            return
+
+        etag = resp.get_header('ETag')
+        if etag is None:
+            etag = self._set_etag(resp, resp.render_body())
+
+        if etag is not None and _is_none_match_satisfied(req, etag):
+            _set_not_modified(resp)
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Set the ETag header, and check the If-None-Match precondition."""
+
+        if not self._is_eligible(req, resp) or resp.sse is not None:
+            return
+
+        etag = resp.get_header('ETag')
+        if etag is None:
+            etag = self._set_etag(resp, await resp.render_body())
+
+        if etag is not None and _is_none_match_satisfied(req, etag):
+            _set_not_modified(resp)
+
+    def _is_eligible(self, req, resp):
+        return (
+            req.method in _GET_HEAD_METHODS and
+            resp.stream is None and
+            http_status_to_code(resp.status) == 200
+        )
+
+    def _set_etag(self, resp, body):
+        if body is None:
+            return None
+
+        etag = self._prefix + self._hash(body) + '"'
+        resp.set_header('ETag', etag)
+        return etag
+
+
+class CoalescingMiddleware:
+    """Request coalescing middleware for ASGI apps.
+
+    This middleware deduplicates identical requests that are being
+    processed concurrently (a.k.a. "single-flight"). The first request for
+    a given key (the leader) is processed as usual, while any identical
+    requests that arrive before the leader's response is ready (the
+    followers) simply wait for it, and are then served a copy of the
+    leader's rendered response, without invoking the responder again.
+
+    This is mostly useful for protecting expensive resources against
+    stampedes of identical requests, such as those that typically follow
+    the expiration of a popular cache entry.
+
+    By default, only ``GET`` requests are coalesced, keyed on the request's
+    host, path, and query string. Requests that include an
+    ``Authorization`` or ``Cookie`` header are never coalesced by the
+    default key function, since the response may well depend on the
+    identity of the user. A custom `key` function may be provided in order
+    to take such details into account, or to coalesce requests that differ
+    in ways that do not affect the response (e.g., in the order of query
+    parameters).
+
+    The leader's response is only shared if the request succeeded, and the
+    response does not use :attr:`~falcon.asgi.Response.stream` or
+    :attr:`~falcon.asgi.Response.sse`, nor does it set any cookies.
+    Otherwise, as well as when a follower times out, the follower is
+    processed as usual.
+
+    Note:
+        This component is only compatible with ASGI apps. It only
+        coalesces requests that are handled by the same event loop (i.e.,
+        by the same worker process).
+
+    In order to coalesce requests before any other middleware component
+    does any work, and to share the response as finally rendered by the
+    other components, this component should normally be listed first::
+
+        app = falcon.asgi.App(middleware=[
+            falcon.CoalescingMiddleware(timeout=5),
+            falcon.CompressionMiddleware(),
+        ])
+
+    Keyword Arguments:
+        key (callable): A function that accepts the request, and returns a
+            ``str`` key identifying requests that may be served the same
+            response, or ``None`` if the request should not be coalesced
+            (default ``None``, meaning that the default key function
+            described above is used). The key function should be cheap, as
+            it is invoked both before and after processing the request; it
+            must also return the same key each time.
+        timeout (float): The maximum number of seconds that a follower
+            waits for the leader's response (default ``10.0``). Upon
+            timing out, the follower is processed as usual, while the next
+            request for the same key becomes a new leader.
+        stats_size (int): The maximum number of keys to keep statistics for
+            (default ``1024``). When this limit is reached, the statistics
+            for the least recently coalesced key are discarded. Set to
+            ``0`` to disable keeping statistics.
+
+    Attributes:
+        in_flight (int): The number of keys for which a leader is currently
+            being processed.
+        stats (dict): Per-key statistics, as a dict that maps each key to a
+            dict with the following items:
+
+            * ``'executed'``: The number of requests that were processed
+              as leaders.
+            * ``'coalesced'``: The number of requests that were served a
+              copy of the leader's response.
+            * ``'timeouts'``: The number of followers that timed out.
+            * ``'max_concurrency'``: The largest number of requests that
+              were in flight at the same time (i.e., the leader plus any
+              followers waiting for it).
+    """
+
+    def __init__(self, key=None, timeout: float = 10.0, stats_size: int = 1024):
+        self._flights = {}
+        self._key = _get_coalescing_key if key is None else key
+        self._stats_size = stats_size
+        self._timeout = timeout
+
+        self.stats = OrderedDict()
+
+    @property
+    def in_flight(self):
+        return len(self._flights)
+
+    async def process_request_async(self, req, resp):
+        """Wait for the response to an identical request, if one is in flight."""
+
+        key = self._key(req)
+        if key is None:
+            return
+
+        stats = self._get_stats(key)
+        flight = self._flights.get(key)
+
+        if flight is None:
+            self._flights[key] = _Flight(req)
+            if stats is not None:
+                stats['executed'] += 1
+
+            return
+
+        flight.waiting += 1
+        if stats is not None:
+            stats['max_concurrency'] = max(stats['max_concurrency'], flight.waiting + 1)
+
+        try:
+            # NOTE(kgriffs): The shared future is shielded, so that it is not
+            #   cancelled for the other followers when this one times out.
+            snapshot = await asyncio.wait_for(asyncio.shield(flight.future), self._timeout)
+        except asyncio.TimeoutError:
+            if stats is not None:
+                stats['timeouts'] += 1
+
+            # NOTE(kgriffs): Let the next request become a new leader, in
+            #   case this one is stuck.
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+            return
+        finally:
+            flight.waiting -= 1
+
+        if snapshot is not None:
+            if stats is not None:
+                stats['coalesced'] += 1
+
+            _set_response_snapshot(resp, snapshot)
+            resp.complete = True
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Share the response with any requests that are waiting for it."""
+
+        key = self._key(req)
+        if key is None:
+            return
+
+        flight = self._flights.get(key)
+        if flight is None or flight.leader is not req:
+            return
+
+        del self._flights[key]
+
+        snapshot = None
+        try:
+            if (
+                req_succeeded and flight.waiting and
+                resp.stream is None and resp.sse is None and not resp._cookies
+            ):
+                snapshot = await _get_response_snapshot(resp)
+        finally:
+            # NOTE(kgriffs): A result of None lets the followers process
+            #   their requests as usual.
+            if not flight.future.done():
+                flight.future.set_result(snapshot)
+
+    def _get_stats(self, key):
+        if not self._stats_size:
+            return None
+
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = {'executed': 0, 'coalesced': 0, 'timeouts': 0, 'max_concurrency': 1}
+            self.stats[key] = stats
+
+            if len(self.stats) > self._stats_size:
+                self.stats.popitem(last=False)
+        else:
+            self.stats.move_to_end(key)
+
+        return stats
+
+
+class RateLimitMiddleware:
+    """Token bucket rate limiting middleware.
+
+    This middleware limits the rate of requests per client (or per any other
+    key derived from the request) using the token bucket algorithm: each
+    key is allotted a bucket that holds up to `burst` tokens, and is
+    refilled at a constant `rate` of tokens per second. Each request takes
+    one token from the bucket; when the bucket is empty, the request is
+    rejected with ``429 Too Many Requests``, and a ``Retry-After`` header
+    that indicates the number of seconds until a token will be available.
+
+    By default, requests are keyed on :attr:`~falcon.Request.remote_addr`.
+    Since the rate limit should normally be enforced before any other work
+    is done, this component should be listed first::
+
+        app = falcon.App(middleware=[
+            falcon.RateLimitMiddleware(rate=10, burst=20),
+            AuthMiddleware(),
+        ])
+
+    The buckets are kept in a fixed-size table that is indexed by a hash of
+    the key. Therefore, the memory used by the table does not depend on the
+    number of distinct keys, and does not need to be pruned. Keys that
+    happen to hash to the same slot share a bucket, which may cause them to
+    be limited somewhat sooner, but never later, than they would otherwise
+    be (see also the `slots` argument of the backends below).
+
+    Note:
+        The default backend, :class:`~falcon.middleware.MemoryRateLimitBackend`,
+        keeps the buckets in the memory of the current process. When
+        running multiple worker processes, a
+        :class:`~falcon.middleware.SharedMemoryRateLimitBackend` may be used
+        instead in order to enforce the rate limit across all of them.
+
+    Args:
+        rate (float): The number of requests per second that are allowed
+            for each key, on average.
+
+    Keyword Arguments:
+        burst (int): The maximum number of requests that may be made in
+            quick succession, i.e., the capacity of each bucket (default
+            ``None``, meaning `rate` rounded up to the nearest integer).
+        key (callable): A function that accepts the request, and returns a
+            ``str`` identifying the bucket to use for the request, or
+            ``None`` if the request should not be limited (default ``None``,
+            meaning that requests are keyed on the client's address).
+        backend (object): The bucket store to use (default ``None``, in
+            which case a new :class:`~falcon.middleware.MemoryRateLimitBackend`
+            is used). A custom store may be provided in the form of an object
+            that implements an ``acquire(key, rate, burst)`` method, taking
+            a token from the bucket for the given key, and returning either
+            ``0`` when a token was available, or else the number of seconds
+            to wait before the next one will be.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        key=None,
+        backend=None,
+    ):
+        if rate <= 0:
+            raise ValueError('rate must be a positive number')
+
+        if burst is None:
+            burst = max(1, math.ceil(rate))
+        elif burst < 1:
+            raise ValueError('burst must be a positive integer')
+
+        self._backend = MemoryRateLimitBackend() if backend is None else backend
+        self._burst = burst
+        self._key = _get_rate_limit_key if key is None else key
+        self._rate = rate
+
+    def process_request(self, req: Request, resp: Response):
+        """Take a token from the request's bucket, or reject the request."""
+
+        key = self._key(req)
+        if key is None:
+            return
+
+        wait = self._backend.acquire(key, self._rate, self._burst)
+        if wait:
+            raise HTTPTooManyRequests(retry_after=math.ceil(wait))
+
+    async def process_request_async(self, req, resp):
+        """Take a token from the request's bucket, or reject the request."""
+
+        # NOTE(kgriffs): The backend does not await anything while holding a
+        #   bucket's lock, so it is safe to call it directly from the event
+        #   loop. Since the locks are only ever held for a few operations,
+        #   they are normally uncontended.
+        self.process_request(req, resp)
+
+
+class MemoryRateLimitBackend:
+    """In-process token bucket store for :class:`~falcon.RateLimitMiddleware`.
+
+    The buckets are stored in a single, compact array of floats that is
+    divided into a number of shards, each of which is guarded by a separate
+    lock, so that concurrent requests from different clients rarely contend
+    for the same lock in threaded WSGI servers.
+
+    Keyword Arguments:
+        slots (int): The number of buckets to allocate (default ``65536``).
+            Each bucket uses 16 bytes of memory. In order to avoid different
+            keys sharing buckets, this number should be several times
+            larger than the number of keys that are expected to be active
+            at any given time.
+        shards (int): The number of shards, i.e., locks, to divide the
+            buckets into (default ``16``).
+    """
+
+    __slots__ = ['_buckets', '_locks', '_shard_slots']
+
+    def __init__(self, slots: int = 65536, shards: int = 16):
+        self._shard_slots = max(1, slots // shards)
+        self._locks = [threading.Lock() for __ in range(shards)]
+        self._buckets = array('d', bytes(16 * self._shard_slots * shards))
+
+    def acquire(self, key: str, rate: float, burst: int) -> float:
+        """Take a token from the bucket for the given key.
+
+        Args:
+            key (str): The key identifying the bucket.
+            rate (float): The number of tokens added to the bucket per
+                second.
+            burst (int): The capacity of the bucket.
+
+        Returns:
+            float: ``0.0`` if a token was taken from the bucket, or
+            otherwise the number of seconds until one will be available.
+        """
+
+        shard, index = _get_bucket_index(hash(key), len(self._locks), self._shard_slots)
+
+        with self._locks[shard]:
+            return _take_token(self._buckets, index, rate, burst)
+
+
+class SharedMemoryRateLimitBackend:
+    """Cross-process token bucket store for :class:`~falcon.RateLimitMiddleware`.
+
+    This backend uses the same layout as
+    :class:`~falcon.middleware.MemoryRateLimitBackend`, but the array of
+    buckets is memory-mapped from the given file, so that any number of
+    worker processes on the same host can enforce a single rate limit. In
+    addition to the per-shard thread locks, each shard is guarded by a
+    POSIX record lock (see also: :func:`fcntl.lockf`) while a token is being
+    taken from one of its buckets.
+
+    The file is created as needed, and should preferably be located on a
+    memory-backed file system, such as ``/dev/shm`` (on Linux)::
+
+        backend = falcon.middleware.SharedMemoryRateLimitBackend('/dev/shm/myapp-rate-limit')
+        app = falcon.App(middleware=[
+            falcon.RateLimitMiddleware(rate=10, backend=backend),
+        ])
+
+    Note:
+        This backend is only available on POSIX platforms. All processes
+        sharing the same file must use the same `slots` and `shards`.
+
+    Args:
+        path (str): The path of the file to map into memory.
+
+    Keyword Arguments:
+        slots (int): The number of buckets to allocate (default ``65536``).
+        shards (int): The number of shards to divide the buckets into
+            (default ``16``).
+    """
+
+    __slots__ = ['_buckets', '_fcntl', '_fd', '_locks', '_mmap', '_shard_slots']
+
+    def __init__(self, path: str, slots: int = 65536, shards: int = 16):
+        import fcntl
+
+        self._fcntl = fcntl
+        self._shard_slots = max(1, slots // shards)
+        self._locks = [threading.Lock() for __ in range(shards)]
+
+        size = 16 * self._shard_slots * shards
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+
+            self._mmap = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        self._buckets = memoryview(self._mmap).cast('d')
+
+    def acquire(self, key: str, rate: float, burst: int) -> float:
+        """Take a token from the bucket for the given key.
+
+        Args:
+            key (str): The key identifying the bucket.
+            rate (float): The number of tokens added to the bucket per
+                second.
+            burst (int): The capacity of the bucket.
+
+        Returns:
+            float: ``0.0`` if a token was taken from the bucket, or
+            otherwise the number of seconds until one will be available.
+        """
+
+        # NOTE(kgriffs): Unlike hash(), CRC-32 yields the same value in every
+        #   process.
+        key_hash = zlib.crc32(key.encode('utf-8', 'surrogatepass'))
+        shard, index = _get_bucket_index(key_hash, len(self._locks), self._shard_slots)
+
+        shard_size = 16 * self._shard_slots
+        lockf = self._fcntl.lockf
+
+        with self._locks[shard]:
+            lockf(self._fd, self._fcntl.LOCK_EX, shard_size, shard * shard_size)
+            try:
+                return _take_token(self._buckets, index, rate, burst)
+            finally:
+                lockf(self._fd, self._fcntl.LOCK_UN, shard_size, shard * shard_size)
+
+    def close(self):
+        """Unmap and close the file."""
+
+        self._buckets.release()
+        self._mmap.close()
+        os.close(self._fd)
+
+
+class _BrotliCompressor:
+    __slots__ = ['_compressor']
+
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+class _Flight:
+    __slots__ = ['future', 'leader', 'waiting']
+
+    def __init__(self, leader):
+        self.future = get_running_loop().create_future()
+        self.leader = leader
+        self.waiting = 0
+
+
+class _AsyncCompressedStream:
+    """Async iterator that compresses the chunks of an ASGI Response.stream."""
+
+    __slots__ = ['_chunks', '_compressor', '_done', '_executor_threshold', '_stream']
+
+    def __init__(self, stream, compressor, executor_threshold):
+        self._stream = stream
+        self._compressor = compressor
+        self._executor_threshold = executor_threshold
+        self._done = False
+
+        if hasattr(stream, 'read'):
+            self._chunks = None
+        else:
+            self._chunks = stream.__aiter__()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        compressor = self._compressor
+
+        while not self._done:
+            chunk = await self._next_chunk()
+
+            if chunk is None:
+                self._done = True
+                return compressor.flush()
+
+            threshold = self._executor_threshold
+            if threshold is not None and len(chunk) >= threshold:
+                data = await get_running_loop().run_in_executor(
+                    None, compressor.compress, chunk)
+            else:
+                data = compressor.compress(chunk)
+
+            # NOTE(kgriffs): The compressor may buffer its output, in which
+            #   case we just keep going until it has something to show for it.
+            if data:
+                return data
+
+        raise StopAsyncIteration
+
+    async def close(self):
+        if hasattr(self._stream, 'close'):
+            await self._stream.close()
+
+    async def _next_chunk(self):
+        if self._chunks is None:
+            chunk = await self._stream.read(_STREAM_BLOCK_SIZE)
+            return chunk or None
+
+        while True:
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return None
+
+            # NOTE(kgriffs): Mirror the framework's handling of streams,
+            #   wherein a None chunk signals the end of the stream.
+            if chunk is None:
+                return None
+
+            if chunk:
+                return chunk
+
+
+def _create_compressor_factory(encoding, level):
+    if encoding == 'gzip':
+        if level is None:
+            level = _DEFAULT_COMPRESSION_LEVELS['gzip']
+
+        def create_gzip():
+            return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+        return create_gzip
+
+    if encoding == 'br':
+        import brotli
+
+        if level is None:
+            level = _DEFAULT_COMPRESSION_LEVELS['br']
+
+        def create_brotli():
+            return _BrotliCompressor(brotli.Compressor(quality=level))
+
+        return create_brotli
+
+    if encoding == 'zstd':
+        import zstandard
+
+        if level is None:
+            level = _DEFAULT_COMPRESSION_LEVELS['zstd']
+
+        # NOTE(kgriffs): ZstdCompressor instances may not be used
+        #   concurrently, so we create a new one for each response.
+        def create_zstd():
+            return zstandard.ZstdCompressor(level=level).compressobj()
+
+        return create_zstd
+
+    raise ValueError('Unsupported encoding: {!r}'.format(encoding))
+
+
+def _create_media_type_matcher(media_types):
+    exact = set()
+    prefixes = []
+
+    for media_type in media_types:
+        media_type = media_type.lower()
+        if media_type.endswith('/*'):
+            prefixes.append(media_type[:-1])
+        else:
+            exact.add(media_type)
+
+    prefixes = tuple(prefixes)
+
+    def is_compressible(content_type):
+        media_type = content_type.partition(';')[0].strip().lower()
+        return media_type in exact or media_type.startswith(prefixes)
+
+    return is_compressible
+
+
+def _is_compressible_default(content_type):
+    media_type = content_type.partition(';')[0].strip().lower()
+
+    return (
+        media_type.startswith('text/') or
+        media_type in _COMPRESSIBLE_MEDIA_TYPES or
+        media_type.endswith(('+json', '+xml'))
+    )
+
+
+def _compress_all(compressor, data):
+    return compressor.compress(data) + compressor.flush()
+
+
+def _compress_stream(stream, compressor):
+    try:
+        if hasattr(stream, 'read'):
+            chunks = iter(lambda: stream.read(_STREAM_BLOCK_SIZE), b'')
+        else:
+            chunks = stream
+
+        for chunk in chunks:
+            if chunk:
+                data = compressor.compress(chunk)
+                if data:
+                    yield data
+
+        yield compressor.flush()
+
+    finally:
+        if hasattr(stream, 'close'):
+            stream.close()
+
+
+def _get_content_length(resp):
+    content_length = resp.content_length
+    return None if content_length is None else int(content_length)
+
+
+def _set_compressed_body(resp, encoding, data):
+    resp.text = None
+    resp.data = data
+
+    _set_encoding_headers(resp, encoding)
+
+
+def _set_compressed_stream(resp, encoding, stream):
+    resp.stream = stream
+    resp.content_length = None
+
+    _set_encoding_headers(resp, encoding)
+
+
+def _set_head_encoding(resp, encoding):
+    # NOTE(kgriffs): The body of a response to a HEAD request is never sent,
+    #   so there is no point in compressing it. However, the headers must
+    #   still match those of the corresponding GET response. Since the length
+    #   of the compressed body is not known, we swap in an empty stream in
+    #   order for the app to omit Content-Length, rather than advertising the
+    #   length of the uncompressed body (see also: RFC 9110, Section 8.6).
+    if resp.stream is None:
+        resp.text = None
+        resp.data = None
+        resp.media = None
+        resp.stream = iter(())
+
+    resp.content_length = None
+
+    _set_encoding_headers(resp, encoding)
+
+
+def _set_encoding_headers(resp, encoding):
+    resp.set_header('Content-Encoding', encoding)
+
+    # NOTE(kgriffs): The compressed representation is not byte-for-byte
+    #   identical to the original one, so a strong entity-tag no longer
+    #   applies (see also: RFC 7232, Section 2.1).
+    etag = resp.get_header('ETag')
+    if etag is not None and not etag.startswith('W/'):
+        resp.set_header('ETag', 'W/' + etag)
+
+
+# PERF(kgriffs): Only a handful of distinct Cache-Control values are normally
+#   used by any given app, so we memoize parsing them.
+@_lru_cache_safe(maxsize=256)
+def _parse_cache_control(cache_control):
+    if not cache_control:
+        return {}
+
+    directives = {}
+    for directive in cache_control.split(','):
+        name, __, value = directive.partition('=')
+        directives[name.strip().lower()] = value.strip().strip('"') or None
+
+    return directives
+
+
+def _parse_vary(vary):
+    if not vary:
+        return []
+
+    names = sorted({name.strip().lower() for name in vary.split(',')} - {''})
+
+    # NOTE(kgriffs): Vary: * means that the response can not be reused for
+    #   any other request.
+    return None if '*' in names else names
+
+
+def _get_cache_key(req):
+    return 'GET {}{}?{}'.format(req.netloc, req.path, req.query_string)
+
+
+def _get_variant_key(req, key, vary):
+    return key + ''.join('\n' + (req.get_header(name) or '') for name in vary)
+
+
+def _encode_cache_entry(meta, body):
+    return json.dumps(meta, separators=(',', ':')).encode() + b'\n' + body
+
+
+def _decode_cache_entry(value):
+    meta, __, body = value.partition(b'\n')
+    return json.loads(meta.decode()), body
+
+
+def _set_cached_response(resp, meta, body):
+    stored, status, headers, extra_headers = meta
+
+    resp.status = status
+    resp._headers.update(headers)
+    if extra_headers:
+        resp._extra_headers = [tuple(header) for header in extra_headers]
+
+    resp._headers['age'] = str(max(0, int(time.time() - stored)))
+    resp.data = body
+    resp.complete = True
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _create_body_hasher():
+    try:
+        import xxhash
+    except ImportError:
+        def hash_body(data):
+            return hashlib.sha1(data).hexdigest()
+    else:
+        def hash_body(data):
+            return xxhash.xxh64(data).hexdigest()
+
+    return hash_body
+
+
+def _apply_validator(req, resp, etag):
+    if etag is None:
+        return
+
+    if isinstance(etag, ETag):
+        header_value = etag.dumps()
+    else:
+        header_value = '"' + etag + '"'
+
+    resp.set_header('ETag', header_value)
+
+    if _is_none_match_satisfied(req, header_value):
+        _set_not_modified(resp)
+        resp.complete = True
+
+
+def _is_none_match_satisfied(req, etag):
+    if_none_match = req.if_none_match
+    if not if_none_match:
+        return False
+
+    # NOTE(kgriffs): If-None-Match uses the weak comparison function, as per
+    #   RFC 7232, Section 3.2.
+    opaque_tag = ETag.loads(etag)
+    return any(tag == '*' or tag == opaque_tag for tag in if_none_match)
+
+
+def _set_not_modified(resp):
+    resp.status = HTTP_304
+    resp.text = None
+    resp.data = None
+    resp.media = None
+
+    resp.content_type = None
+    resp.delete_header('Content-Length')
+
+
+def _get_coalescing_key(req):
+    if req.method != 'GET' or req.get_header('Authorization') or req.get_header('Cookie'):
+        return None
+
+    return req.netloc + req.path + '?' + req.query_string
+
+
+async def _get_response_snapshot(resp):
+    body = await resp.render_body()
+
+    # NOTE(kgriffs): Content-Length will be set by the framework to match
+    #   the body of each copy of the response.
+    headers = [item for item in resp._headers.items() if item[0] != 'content-length']
+    extra_headers = list(resp._extra_headers) if resp._extra_headers else None
+
+    if extra_headers and any(name.lower() == 'set-cookie' for name, __ in extra_headers):
+        return None
+
+    return (resp.status, headers, extra_headers, body)
+
+
+def _set_response_snapshot(resp, snapshot):
+    status, headers, extra_headers, body = snapshot
+
+    resp.status = status
+    resp._headers.update(headers)
+    if extra_headers:
+        resp._extra_headers = list(extra_headers)
+
+    resp.data = body
+
+
+def _get_rate_limit_key(req):
+    return req.remote_addr
+
+
+def _get_bucket_index(key_hash, shards, shard_slots):
+    shard = key_hash % shards
+    slot = (key_hash // shards) % shard_slots
+
+    # NOTE(kgriffs): Each bucket consists of two floats: the number of tokens
+    #   remaining, and the time at which it was last updated.
+    return shard, (shard * shard_slots + slot) * 2
+
+
+def _take_token(buckets, index, rate, burst):
+    now = time.monotonic()
+    updated = buckets[index + 1]
+
+    # NOTE(kgriffs): A zeroed bucket has never been used, and so is full. The
+    #   same goes for a bucket that was seemingly updated in the future, as
+    #   may be the case for a shared file that outlived a reboot.
+    if 0 < updated <= now:
+        tokens = min(burst, buckets[index] + (now - updated) * rate)
+    else:
+        tokens = burst
+
+    buckets[index + 1] = now
+
+    if tokens >= 1:
+        buckets[index] = tokens - 1
+        return 0.0
+
+    buckets[index] = tokens
+    return (1 - tokens) / rate
@@ -25,9 +25,11 @@ from falcon.forwarded import _parse_forwarded_header
 from falcon.forwarded import Forwarded  # NOQA
 from falcon.media import Handlers
 from falcon.media.json import _DEFAULT_JSON_HANDLER
-from falcon.stream import BoundedStream
+from falcon.stream import _DecodedStream, BoundedStream
 from falcon.util import structures
 from falcon.util.misc import isascii
+from falcon.util.uri import _FORM_CHUNK_SIZE
+from falcon.util.uri import _URLEncodedFormParser
 from falcon.util.uri import parse_host, parse_query_string
 from falcon.vendor import mimeparse
 
@@ -1036,11 +1038,17 @@ class Request:
             self.options.default_media_type
         )
 
+        stream = self.bounded_stream
+
+        # NOTE(kgriffs): The length of a decompressed body is not known
+        #   up front.
+        content_length = None if type(stream) is _DecodedStream else self.content_length
+
         try:
             self._media = handler.deserialize(
-                self.bounded_stream,
+                stream,
                 self.content_type,
-                self.content_length
+                content_length
             )
         except errors.MediaNotFoundError as err:
             self._media_error = err
@@ -1876,35 +1884,58 @@ class Request:
             # but it had an invalid value. Assume no content.
             content_length = 0
 
-        return BoundedStream(self.env['wsgi.input'], content_length)
+        stream = BoundedStream(self.env['wsgi.input'], content_length)
+
+        decoder = helpers._create_body_decoder(
+            self.env.get('HTTP_CONTENT_ENCODING'), self.options)
+        if decoder is not None:
+            return _DecodedStream(stream, decoder)
+
+        return stream
 
     def _parse_form_urlencoded(self):
         content_length = self.content_length
         if not content_length:
             return
 
-        body = self.stream.read(content_length)
+        parser = _URLEncodedFormParser(
+            keep_blank=self.options.keep_blank_qs_values,
+            csv=self.options.auto_parse_qs_csv,
+            max_pairs=self.options.max_form_pairs,
+            max_key_size=self.options.max_form_key_size,
+            max_value_size=self.options.max_form_value_size,
+        )
+
+        try:
+            # NOTE(vytas): Parse the form incrementally as it is read, rather
+            #   than reading the whole body into memory at once.
+            while content_length > 0:
+                chunk = self.stream.read(min(content_length, _FORM_CHUNK_SIZE))
+                if not chunk:
+                    break
+
+                content_length -= len(chunk)
+                parser.feed(chunk)
+
+            extra_params = parser.close()
 
         # NOTE(kgriffs): According to http://goo.gl/6rlcux the
         # body should be US-ASCII. Enforcing this also helps
         # catch malicious input.
-        try:
-            body = body.decode('ascii')
         except UnicodeDecodeError:
-            body = None
             self.log_error('Non-ASCII characters found in form body '
                            'with Content-Type of '
                            'application/x-www-form-urlencoded. Body '
                            'will be ignored.')
+            return
+        except ValueError as err:
+            self.log_error('Form body with Content-Type of '
+                           'application/x-www-form-urlencoded exceeds the '
+                           'configured limits ({}). Body will be '
+                           'ignored.'.format(err))
+            return
 
-        if body:
-            extra_params = parse_query_string(
-                body,
-                keep_blank=self.options.keep_blank_qs_values,
-                csv=self.options.auto_parse_qs_csv,
-            )
-
-            self._params.update(extra_params)
+        self._params.update(extra_params)
 
 
 # PERF: To avoid typos and improve storage space and speed over a dict.
@@ -1956,6 +1987,27 @@ class RequestOptions:
                 encoded according to the standard W3C algorithm (see
                 also http://goo.gl/6rlcux).
 
+            Note:
+                The form is parsed incrementally as the request stream is
+                read, and can be constrained using the `max_form_pairs`,
+                `max_form_key_size`, and `max_form_value_size` options
+                below. If the form exceeds any of these limits, the body
+                is ignored, and an error is logged.
+
+        max_form_pairs (int): The maximum number of ``&``-separated fields
+            to accept when parsing a form via `auto_parse_form_urlencoded`
+            (default ``0``, meaning no limit).
+
+        max_form_key_size (int): The maximum length (in bytes, before
+            percent-decoding) of a field name to accept when parsing a form
+            via `auto_parse_form_urlencoded` (default ``0``, meaning no
+            limit).
+
+        max_form_value_size (int): The maximum length (in bytes, before
+            percent-decoding) of a field value to accept when parsing a form
+            via `auto_parse_form_urlencoded` (default ``0``, meaning no
+            limit).
+
         auto_parse_qs_csv: Set to ``True`` to split query string values on
             any non-percent-encoded commas (default ``False``).
 
@@ -1997,20 +2049,58 @@ class RequestOptions:
             media-types to handle. By default, handlers are provided for the
             ``application/json``, ``application/x-www-form-urlencoded`` and
             ``multipart/form-data`` media types.
+
+        decompress_body (bool): Set to ``True`` in order to transparently
+            decompress request bodies that specify a ``gzip``, ``deflate``,
+            or ``zstd`` Content-Encoding (default ``False``). When this
+            option is enabled, :attr:`~falcon.Request.bounded_stream` (WSGI),
+            :attr:`falcon.asgi.Request.stream` (ASGI), and thus
+            :attr:`~falcon.Request.media` as well, yield the decompressed
+            body. The body is decompressed incrementally as it is read.
+
+            Requests specifying any other content coding are rejected with
+            a ``415 Unsupported Media Type`` error once the body is read,
+            while a body that can not be decompressed results in a
+            ``400 Bad Request`` error.
+
+            Note:
+                The ``zstd`` content coding requires the ``zstandard``
+                package to be installed.
+
+            Note:
+                The :attr:`~falcon.Request.content_length` of the request
+                still refers to the length of the compressed body.
+
+        max_decompressed_body_size (int): The maximum size, in bytes, of a
+            request body after decompressing it via `decompress_body`
+            (default ``16777216``, i.e., 16 MiB). A ``413 Payload Too Large``
+            error is raised as soon as the decompressed body is found to
+            exceed this size, in order to guard against decompression bombs.
+            Set to ``0`` to disable this check.
     """
     __slots__ = (
         'keep_blank_qs_values',
         'auto_parse_form_urlencoded',
+        'max_form_pairs',
+        'max_form_key_size',
+        'max_form_value_size',
         'auto_parse_qs_csv',
         'strip_url_path_trailing_slash',
         'default_media_type',
         'media_handlers',
+        'decompress_body',
+        'max_decompressed_body_size',
     )
 
     def __init__(self):
         self.keep_blank_qs_values = True
         self.auto_parse_form_urlencoded = False
+        self.max_form_pairs = 0
+        self.max_form_key_size = 0
+        self.max_form_value_size = 0
         self.auto_parse_qs_csv = False
         self.strip_url_path_trailing_slash = False
         self.default_media_type = DEFAULT_MEDIA_TYPE
         self.media_handlers = Handlers()
+        self.decompress_body = False
+        self.max_decompressed_body_size = 16 * 1024 * 1024
@@ -16,7 +16,9 @@
 
 from http import cookies as http_cookies
 import re
+import zlib
 
+from falcon import errors
 # TODO: BoundedStream  import here is for backwards-compatibility
 # and it should be removed in Falcon 4.0
 from falcon.stream import BoundedStream, Body  # NOQA
@@ -37,6 +39,9 @@ _COOKIE_NAME_RESERVED_CHARS = re.compile('[\x00-\x1F\x7F-\xFF()<>@,;:\\\\"/[\\]?
 #   and more performant.
 _ENTITY_TAG_PATTERN = re.compile(r'([Ww]/)?"([^"]*)"')
 
+_ZSTD_MAGIC_NUMBER = 0xFD2FB528
+_ZSTD_SKIPPABLE_MAGIC_NUMBER = 0x184D2A50
+
 
 def parse_cookie_header(header_value):
     """Parse a Cookie header value into a dict of named values.
@@ -171,3 +176,285 @@ def _parse_etags(etag_str):
     #   are all set to nothing, and so therefore basically should be
     #   treated as not having been set in the first place.
     return etags or None
+
+
+class _ZstdStreamDecompressor:
+    """Incrementally decompress Zstandard frames, one output buffer at a time.
+
+    Unlike zlib, the zstandard library does not let us cap the size of the
+    output of a single decompress() call. Instead, the data is pushed through
+    a stream writer, which hands the output over to :meth:`write` one buffer
+    at a time, so that its size can be checked before decompressing any
+    further.
+
+    The stream writer does not tell us where a frame ends, though, so we
+    also keep track of the frame and block headers (skipping over the block
+    contents) in order to tell whether or not the data is complete.
+
+    Args:
+        decompressor (zstandard.ZstdDecompressor): The decompressor to use.
+        check_size (callable): Called with each chunk of decompressed data
+            before it is accepted; may raise an error in order to abort
+            decompression.
+    """
+
+    __slots__ = [
+        '_check_size',
+        '_checksum',
+        '_chunks',
+        '_frames',
+        '_header',
+        '_need',
+        '_parse',
+        '_skip',
+        '_writer',
+        '_zstd_error',
+    ]
+
+    def __init__(self, decompressor, check_size):
+        import zstandard
+
+        self._check_size = check_size
+        self._chunks = []
+        self._writer = decompressor.stream_writer(self, closefd=False)
+        self._zstd_error = zstandard.ZstdError
+
+        self._checksum = False
+        self._frames = 0
+        self._header = bytearray()
+        self._need = 4
+        self._parse = self._parse_magic_number
+        self._skip = 0
+
+    @property
+    def eof(self):
+        return bool(
+            self._frames and
+            self._parse == self._parse_magic_number and
+            not self._header and
+            not self._skip
+        )
+
+    def decompress(self, data):
+        self._track(data)
+
+        try:
+            self._writer.write(data)
+        except self._zstd_error as ex:
+            raise ValueError(str(ex))
+
+        chunks = self._chunks
+        if not chunks:
+            return b''
+
+        data = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+        chunks.clear()
+
+        return data
+
+    def write(self, data):
+        self._check_size(data)
+        self._chunks.append(data)
+
+        return len(data)
+
+    def _track(self, data):
+        position = 0
+        size = len(data)
+
+        while position < size:
+            if self._skip:
+                skipped = min(self._skip, size - position)
+                self._skip -= skipped
+                position += skipped
+                continue
+
+            # NOTE(kgriffs): Headers may be split across chunks.
+            missing = self._need - len(self._header)
+            self._header += data[position:position + missing]
+            position += missing
+
+            if len(self._header) < self._need:
+                break
+
+            header = self._header
+            self._header = bytearray()
+            self._parse(header)
+
+    def _parse_magic_number(self, header):
+        magic_number = int.from_bytes(header, 'little')
+
+        if magic_number == _ZSTD_MAGIC_NUMBER:
+            self._frames += 1
+            self._need = 1
+            self._parse = self._parse_frame_header_descriptor
+        elif magic_number & 0xFFFFFFF0 == _ZSTD_SKIPPABLE_MAGIC_NUMBER:
+            self._need = 4
+            self._parse = self._parse_skippable_frame_size
+        else:
+            raise ValueError('Invalid zstd frame magic number')
+
+    def _parse_frame_header_descriptor(self, header):
+        descriptor = header[0]
+        single_segment = descriptor & 0x20
+
+        # NOTE(kgriffs): Skip the window descriptor, dictionary ID, and frame
+        #   content size fields, if present.
+        self._skip = (
+            (0 if single_segment else 1) +
+            (0, 1, 2, 4)[descriptor & 0x03] +
+            (1 if single_segment else 0, 2, 4, 8)[descriptor >> 6]
+        )
+        self._checksum = bool(descriptor & 0x04)
+
+        self._need = 3
+        self._parse = self._parse_block_header
+
+    def _parse_block_header(self, header):
+        block_header = int.from_bytes(header, 'little')
+        block_type = (block_header >> 1) & 0x03
+
+        if block_type == 3:
+            raise ValueError('Invalid zstd block type')
+
+        # NOTE(kgriffs): An RLE block consists of a single byte that is
+        #   repeated as many times as the block size says.
+        self._skip = 1 if block_type == 1 else block_header >> 3
+
+        if block_header & 0x01:
+            if self._checksum:
+                self._skip += 4
+
+            self._need = 4
+            self._parse = self._parse_magic_number
+
+    def _parse_skippable_frame_size(self, header):
+        self._skip = int.from_bytes(header, 'little')
+
+        self._need = 4
+        self._parse = self._parse_magic_number
+
+
+class _BodyDecoder:
+    """Incrementally decompress a request body.
+
+    Args:
+        encoding (str): The content coding of the body; one of ``'gzip'``,
+            ``'x-gzip'``, ``'deflate'``, or ``'zstd'``.
+        max_size (int): The maximum size of the decompressed body, or ``0``
+            for no limit.
+    """
+
+    __slots__ = ['_decompressor', '_decompress', '_max_size', '_size']
+
+    def __init__(self, encoding, max_size):
+        self._max_size = max_size
+        self._size = 0
+
+        if encoding in ('gzip', 'x-gzip'):
+            # NOTE(kgriffs): Only accept a gzip header.
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._decompress = self._decompress_zlib
+        elif encoding == 'deflate':
+            # NOTE(kgriffs): Per RFC 7230, deflate means zlib-wrapped data,
+            #   but some clients send raw DEFLATE data instead, so we
+            #   auto-detect either one.
+            self._decompressor = None
+            self._decompress = self._decompress_deflate
+        elif encoding == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise errors.HTTPUnsupportedMediaType(
+                    description='Unsupported Content-Encoding: zstd')
+
+            self._decompressor = _ZstdStreamDecompressor(
+                zstandard.ZstdDecompressor(), self._check_size)
+            self._decompress = self._decompressor.decompress
+        else:
+            raise errors.HTTPUnsupportedMediaType(
+                description='Unsupported Content-Encoding: ' + encoding)
+
+    def decode(self, data):
+        """Decompress the next chunk of the body.
+
+        Raises:
+            HTTPPayloadTooLarge: The decompressed body exceeds the maximum
+                allowed size.
+            HTTPBadRequest: The body could not be decompressed.
+        """
+
+        if not data:
+            return b''
+
+        try:
+            return self._decompress(data)
+        except (zlib.error, ValueError) as ex:
+            raise errors.HTTPBadRequest(
+                title='Invalid request body',
+                description='The request body could not be decompressed: {}'.format(ex)
+            )
+
+    def finish(self):
+        """Check that the complete body was received."""
+
+        decompressor = self._decompressor
+        if decompressor is not None and getattr(decompressor, 'eof', True) is False:
+            raise errors.HTTPBadRequest(
+                title='Invalid request body',
+                description='The compressed request body is truncated.'
+            )
+
+    def _check_size(self, data):
+        self._size += len(data)
+
+        if self._max_size and self._size > self._max_size:
+            raise errors.HTTPPayloadTooLarge(
+                description='The decompressed request body exceeds {} bytes.'.format(
+                    self._max_size)
+            )
+
+        return data
+
+    def _decompress_zlib(self, data):
+        if not self._max_size:
+            return self._decompressor.decompress(data)
+
+        # NOTE(kgriffs): Ask for one more byte than is allowed, so that we
+        #   can tell whether or not the limit was exceeded without
+        #   decompressing any further.
+        remaining = self._max_size - self._size
+        return self._check_size(self._decompressor.decompress(data, remaining + 1))
+
+    def _decompress_deflate(self, data):
+        if self._decompressor is None:
+            # NOTE(kgriffs): A zlib header is two bytes long; the low nibble
+            #   of the first byte denotes the DEFLATE method (8), and the
+            #   two bytes taken together are a multiple of 31.
+            is_zlib = len(data) > 1 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0
+            wbits = zlib.MAX_WBITS if is_zlib else -zlib.MAX_WBITS
+            self._decompressor = zlib.decompressobj(wbits)
+
+        return self._decompress_zlib(data)
+
+
+def _create_body_decoder(content_encoding, options):
+    """Create a decoder for the request body, if it needs to be decoded.
+
+    Args:
+        content_encoding (str): The value of the Content-Encoding header.
+        options (RequestOptions): The request options to use.
+
+    Returns:
+        _BodyDecoder: A decoder for the body, or ``None`` if the body
+        should not be decompressed.
+    """
+
+    if not content_encoding or not options.decompress_body:
+        return None
+
+    encoding = content_encoding.strip().lower()
+    if encoding == 'identity':
+        return None
+
+    return _BodyDecoder(encoding, options.max_decompressed_body_size)
@@ -154,6 +154,7 @@ class Response:
         '_extra_headers',
         '_headers',
         '_media',
+        '_media_cache_key',
         '_media_rendered',
         '__dict__',
     )
@@ -185,6 +186,7 @@ class Response:
         self.stream = None
         self._data = None
         self._media = None
+        self._media_cache_key = None
         self._media_rendered = _UNSET
 
         self.context = self.context_type()
@@ -224,6 +226,37 @@ class Response:
     @media.setter
     def media(self, value):
         self._media = value
+        self._media_cache_key = None
+        self._media_rendered = _UNSET
+
+    def set_media(self, media, cache_key=None, version=None):
+        """Set the response media, optionally tagging it for caching.
+
+        When a `cache_key` is provided, and a
+        :class:`~falcon.media.RenderCache` is configured via
+        :attr:`~falcon.ResponseOptions.media_render_cache`, the serialized
+        media is stored in the cache the first time it is rendered. Subsequent
+        responses that are tagged with the same key and version (and that use
+        the same Content-Type) will reuse the cached bytes instead of
+        serializing the media again.
+
+        Args:
+            media (object): A serializable object supported by the media
+                handlers configured via :class:`falcon.ResponseOptions`
+                (see also: :attr:`~.media`).
+
+        Keyword Args:
+            cache_key (object): A hashable value that identifies the media
+                content (default ``None``, meaning that the media is not
+                cached).
+            version (object): A hashable value that identifies the revision
+                of the media content (default ``None``). A different version
+                should be used whenever the content associated with
+                `cache_key` changes.
+        """
+
+        self._media = media
+        self._media_cache_key = None if cache_key is None else (cache_key, version)
         self._media_rendered = _UNSET
 
     @property
@@ -267,15 +300,20 @@ class Response:
                     if not self.content_type:
                         self.content_type = self.options.default_media_type
 
-                    handler, _, _ = self.options.media_handlers._resolve(
-                        self.content_type,
-                        self.options.default_media_type
-                    )
+                    self._media_rendered = self._get_cached_media()
+
+                    if self._media_rendered is _UNSET:
+                        handler, _, _ = self.options.media_handlers._resolve(
+                            self.content_type,
+                            self.options.default_media_type
+                        )
+
+                        self._media_rendered = handler.serialize(
+                            self._media,
+                            self.content_type
+                        )
 
-                    self._media_rendered = handler.serialize(
-                        self._media,
-                        self.content_type
-                    )
+                        self._cache_rendered_media()
 
                 data = self._media_rendered
         else:
@@ -291,6 +329,46 @@ class Response:
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.status)
 
+    def _get_cached_media(self):
+        """Look up the rendered media in the configured render cache.
+
+        Returns:
+            bytes: The cached serialized media, or ``_UNSET`` if the media was
+            not tagged for caching or was not found in the cache.
+        """
+
+        render_cache = self.options.media_render_cache
+        if render_cache is None or self._media_cache_key is None:
+            return _UNSET
+
+        entry = render_cache.get(self._media_cache_key, self.content_type)
+        if entry is None:
+            return _UNSET
+
+        data, etag = entry
+        if etag is not None and 'etag' not in self._headers:
+            self._headers['etag'] = etag
+
+        return data
+
+    def _cache_rendered_media(self):
+        """Store the rendered media in the configured render cache, if tagged."""
+
+        render_cache = self.options.media_render_cache
+        if (
+            render_cache is None or
+            self._media_cache_key is None or
+            self._media_rendered is None
+        ):
+            return
+
+        _, etag = render_cache.set(
+            self._media_cache_key, self.content_type, self._media_rendered
+        )
+
+        if etag is not None and 'etag' not in self._headers:
+            self._headers['etag'] = etag
+
     def set_stream(self, stream, content_length):
         """Set both `stream` and `content_length`.
 
@@ -1152,18 +1230,65 @@ class ResponseOptions:
         static_media_types (dict): A mapping of dot-prefixed file extensions to
             Internet media types (RFC 2046). Defaults to ``mimetypes.types_map``
             after calling ``mimetypes.init()``.
+
+        media_render_cache (falcon.media.RenderCache): An optional cache for
+            serialized media that was tagged via
+            :meth:`~falcon.Response.set_media` (default ``None``, meaning
+            that media is serialized anew for every response).
+
+        sse_batch_window (float): The number of seconds to wait for more
+            Server-Sent Events to be emitted after an event is ready to be
+            sent, so that events emitted in quick succession can be
+            coalesced into a single write (default ``0``, meaning that every
+            event is sent as soon as it is emitted). This option only applies
+            to ASGI apps (see also: :attr:`falcon.asgi.Response.sse`).
+
+        sse_heartbeat (float): The number of seconds after which to
+            automatically send a ``ping`` comment to the user agent when no
+            Server-Sent Events have been emitted in the meantime, in order to
+            keep the connection alive (default ``None``, meaning that the
+            app is responsible for emitting pings itself). This option only
+            applies to ASGI apps (see also: :attr:`falcon.asgi.Response.sse`).
+
+        stream_min_flush_size (int): The minimum number of bytes to buffer
+            when streaming a response from an async iterable, before sending
+            the buffered chunks to the ASGI server as a single body event
+            (default ``0``, meaning that every chunk is sent as soon as it
+            is yielded). Coalescing many tiny chunks in this manner can
+            substantially reduce the overhead of streaming a response. This
+            option only applies to ASGI apps (see also:
+            :attr:`falcon.asgi.Response.stream`).
+
+        stream_max_latency (float): When `stream_min_flush_size` is set, the
+            maximum number of seconds to hold on to buffered chunks before
+            sending them regardless of their size (default ``None``, meaning
+            that buffered chunks are only sent once the minimum flush size
+            is reached, or the stream is exhausted). This option only applies
+            to ASGI apps.
     """
     __slots__ = (
         'secure_cookies_by_default',
         'default_media_type',
         'media_handlers',
+        'media_render_cache',
+        'sse_batch_window',
+        'sse_heartbeat',
         'static_media_types',
+        'stream_max_latency',
+        'stream_min_flush_size',
     )
 
     def __init__(self):
         self.secure_cookies_by_default = True
         self.default_media_type = DEFAULT_MEDIA_TYPE
         self.media_handlers = Handlers()
+        self.media_render_cache = None
+
+        self.sse_batch_window = 0
+        self.sse_heartbeat = None
+
+        self.stream_min_flush_size = 0
+        self.stream_max_latency = None
 
         if not mimetypes.inited:
             mimetypes.init()
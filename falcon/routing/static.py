@@ -1,15 +1,47 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from functools import partial
 import io
 import os
 import re
+import stat as stat_module
+import threading
+import time
 
 import falcon
+from falcon.asgi_spec import EventType
+from falcon.util.misc import _lru_cache_safe, _negotiate_content_coding, http_date_to_dt
 from falcon.util.sync import get_running_loop
 
 
+# NOTE(kgriffs): Block size to use when reading static files in an executor
+#   (as opposed to handing them off to the ASGI server).
+_ASYNC_BLOCK_SIZE = 64 * 1024
+
+# NOTE(kgriffs): Maximum number of threads in the pool used for static file
+#   reads, so that serving static files does not starve the default executor
+#   (and vice versa).
+_ASYNC_MAX_WORKERS = 8
+
+_executor = None
+
+# NOTE(kgriffs): Precompressed siblings of static files, in order of
+#   preference.
+_PRECOMPRESSED_VARIANTS = (('br', '.br'), ('gzip', '.gz'))
+
+
 class StaticRoute:
     """Represents a static route.
 
+    Files are served with ``ETag`` and ``Last-Modified`` validators derived
+    from the file's size and modification time, so that conditional
+    requests (i.e., ``If-None-Match`` and ``If-Modified-Since``) can be
+    answered with ``304 Not Modified``. Single byte range requests are
+    also supported (including ``If-Range``), and are answered with
+    ``206 Partial Content``; requests for multiple ranges are simply
+    answered with the entire file.
+
     Args:
         prefix (str): The path prefix to match for this route. If the
             path in the requested URI starts with this string, the remainder
@@ -36,6 +68,21 @@ class StaticRoute:
                 Content-Disposition header (provided it was requested with the
                 `downloadable` parameter described above), are derived from the
                 fallback filename, as opposed to the requested filename.
+
+        cache_size (int): The maximum number of bytes of file contents to
+            cache in memory (default ``0``, meaning the cache is disabled).
+            When enabled, the least recently served files are evicted as
+            needed to stay within this limit. If a precompressed sibling of
+            a cached file exists (e.g., ``app.js.br`` or ``app.js.gz`` for
+            ``app.js``), it is cached as well, and served in lieu of the
+            original file to clients that accept the corresponding encoding.
+        cache_max_file_size (int): Files larger than this number of bytes
+            are never cached, but always streamed from disk (default
+            ``262144``, i.e., 256 KiB).
+        cache_revalidate_interval (float): The minimum number of seconds to
+            wait before checking whether a cached file was modified on disk
+            (default ``1.0``). A modified file is reloaded upon the first
+            request made after it is revalidated.
     """
 
     # NOTE(kgriffs): Don't allow control characters and reserved chars
@@ -45,7 +92,17 @@ class StaticRoute:
     # minimizes how much can be included in the payload.
     _MAX_NON_PREFIXED_LEN = 512
 
-    def __init__(self, prefix, directory, downloadable=False, fallback_filename=None):
+    # NOTE(kgriffs): Maximum number of distinct requested paths for which
+    #   to remember the result of validating and resolving the path.
+    _RESOLVED_CACHE_SIZE = 1024
+
+    # NOTE(kgriffs): Maximum number of files, and the number of seconds, for
+    #   which to remember that a file could not be opened.
+    _MISSING_CACHE_SIZE = 1024
+    _MISSING_TTL = 1.0
+
+    def __init__(self, prefix, directory, downloadable=False, fallback_filename=None,
+                 cache_size=0, cache_max_file_size=256 * 1024, cache_revalidate_interval=1.0):
         if not prefix.startswith('/'):
             raise ValueError("prefix must start with '/'")
 
@@ -71,6 +128,20 @@ class StaticRoute:
         self._prefix = prefix
         self._downloadable = downloadable
 
+        # PERF(kgriffs): The result of validating a given path never changes,
+        #   and the same paths tend to be requested over and over again.
+        self._resolve = _lru_cache_safe(maxsize=self._RESOLVED_CACHE_SIZE)(self._resolve_path)
+        self._missing = {}
+
+        if cache_size < 0:
+            raise ValueError('cache_size must not be negative')
+
+        if cache_size:
+            self._cache = _StaticFileCache(
+                cache_size, cache_max_file_size, cache_revalidate_interval)
+        else:
+            self._cache = None
+
     def match(self, path):
         """Check whether the given path matches this route."""
         if self._fallback_filename is None:
@@ -80,7 +151,42 @@ class StaticRoute:
     def __call__(self, req, resp):
         """Resource responder for this route."""
 
-        without_prefix = req.path[len(self._prefix):]
+        file_path = self._resolve(req.path[len(self._prefix):])
+        if file_path is None:
+            raise falcon.HTTPNotFound()
+
+        stream = self._open(file_path)
+        if stream is None:
+            if self._fallback_filename is None:
+                raise falcon.HTTPNotFound()
+
+            stream = self._open(self._fallback_filename)
+            if stream is None:
+                raise falcon.HTTPNotFound()
+
+            file_path = self._fallback_filename
+
+        suffix = os.path.splitext(file_path)[1]
+        resp.content_type = resp.options.static_media_types.get(
+            suffix,
+            'application/octet-stream'
+        )
+
+        if self._downloadable:
+            resp.downloadable_as = os.path.basename(file_path)
+
+        if type(stream) is _CachedFile:
+            _serve_cached(req, resp, stream)
+        else:
+            resp.stream = _make_conditional(req, resp, stream)
+
+    def _resolve_path(self, without_prefix):
+        """Validate the requested path and map it to a file path.
+
+        Returns:
+            str: The path of the file to serve, or ``None`` in the case
+            that the requested path is not allowed.
+        """
 
         # NOTE(kgriffs): Check surrounding whitespace and strip trailing
         # periods, which are illegal on windows
@@ -92,12 +198,12 @@ class StaticRoute:
                 '//' in without_prefix or
                 len(without_prefix) > self._MAX_NON_PREFIXED_LEN):
 
-            raise falcon.HTTPNotFound()
+            return None
 
         normalized = os.path.normpath(without_prefix)
 
         if normalized.startswith('../') or normalized.startswith('/'):
-            raise falcon.HTTPNotFound()
+            return None
 
         file_path = os.path.join(self._directory, normalized)
 
@@ -105,37 +211,243 @@ class StaticRoute:
         # should never succeed, but this should guard against us having
         # overlooked something.
         if '..' in file_path or not file_path.startswith(self._directory):
-            raise falcon.HTTPNotFound()
+            return None
+
+        return file_path
+
+    def _open(self, file_path):
+        """Open the given file, or return ``None`` if it can't be opened."""
+
+        # PERF(kgriffs): Remember files that could not be opened for a short
+        #   while, so that repeated requests for them (e.g., deep links into
+        #   a single-page app that are served via the fallback file) do not
+        #   incur the cost of a failed open() and the resulting exception.
+        missing = self._missing
+        expires = missing.get(file_path)
+        if expires is not None:
+            if expires > time.monotonic():
+                return None
+
+            missing.pop(file_path, None)
 
         try:
-            resp.stream = io.open(file_path, 'rb')
-        except IOError:
-            if self._fallback_filename is None:
-                raise falcon.HTTPNotFound()
-            try:
-                resp.stream = io.open(self._fallback_filename, 'rb')
-                file_path = self._fallback_filename
-            except IOError:
-                raise falcon.HTTPNotFound()
+            if self._cache is None:
+                return io.open(file_path, 'rb')
 
-        suffix = os.path.splitext(file_path)[1]
-        resp.content_type = resp.options.static_media_types.get(
-            suffix,
-            'application/octet-stream'
-        )
+            return self._cache.open(file_path, 'rb')
 
-        if self._downloadable:
-            resp.downloadable_as = os.path.basename(file_path)
+        except IOError:
+            if len(missing) >= self._MISSING_CACHE_SIZE:
+                missing.clear()
+
+            missing[file_path] = time.monotonic() + self._MISSING_TTL
+            return None
 
 
 class StaticRouteAsync(StaticRoute):
-    """Subclass of StaticRoute with modifications to support ASGI apps."""
+    """Subclass of StaticRoute with modifications to support ASGI apps.
+
+    When the ASGI server advertises support for either the
+    ``http.response.zerocopysend`` or the ``http.response.pathsend``
+    extension, the file is handed off to the server to be sent directly
+    (e.g., via ``os.sendfile()``) without passing its contents through
+    the app. Otherwise, the file is read in large blocks using a dedicated
+    thread pool, so that serving static files does not tie up the event
+    loop or the default executor.
+    """
 
     async def __call__(self, req, resp):
         super().__call__(req, resp)
 
         # NOTE(kgriffs): Fixup resp.stream so that it is non-blocking
-        resp.stream = _AsyncFileReader(resp.stream)
+        if resp.stream is not None:
+            resp.stream = _AsyncFileReader(resp.stream)
+            resp.stream_block_size = _ASYNC_BLOCK_SIZE
+
+
+class _CachedFile:
+    """The contents of a static file, as cached in memory.
+
+    Attributes:
+        checked (float): When the file was last (re)validated, per
+            ``time.monotonic()``.
+        data (bytes): The contents of the file.
+        etag (str): The entity-tag to use for `data`.
+        last_modified (datetime): The file's modification time.
+        mtime_ns (int): The file's modification time, in nanoseconds.
+        size (int): The total number of bytes cached for this file,
+            including any variants.
+        variants (tuple): Precompressed variants of the file, in order of
+            preference, as tuples of the form ``(encoding, data, etag)``.
+    """
+
+    __slots__ = [
+        'checked',
+        'data',
+        'etag',
+        'last_modified',
+        'mtime_ns',
+        'size',
+        'variants',
+    ]
+
+    def __init__(self, data, stat, variants, checked):
+        self.data = data
+        self.etag = _make_etag(stat)
+        self.last_modified = datetime.utcfromtimestamp(int(stat.st_mtime))
+        self.mtime_ns = stat.st_mtime_ns
+        self.variants = variants
+        self.checked = checked
+
+        self.size = len(data) + sum(len(v[1]) for v in variants)
+
+
+class _StaticFileCache:
+    """A bounded LRU cache of static files, keyed by path.
+
+    Args:
+        max_size (int): The maximum number of bytes to cache.
+        max_file_size (int): The maximum size of a single file to cache.
+        revalidate_interval (float): The minimum number of seconds between
+            checks of whether a given cached file has been modified.
+    """
+
+    __slots__ = [
+        '_entries',
+        '_lock',
+        '_max_file_size',
+        '_max_size',
+        '_revalidate_interval',
+        '_size',
+    ]
+
+    def __init__(self, max_size, max_file_size, revalidate_interval):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_file_size = max_file_size
+        self._max_size = max_size
+        self._revalidate_interval = revalidate_interval
+        self._size = 0
+
+    def open(self, path, mode):
+        """Get the cached file for the given path, loading it as needed.
+
+        Returns:
+            Either a :class:`_CachedFile`, or a file object in the case that
+            the file can not be cached.
+
+        Raises:
+            IOError: The file does not exist or could not be read.
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+
+        if entry is not None and now - entry.checked < self._revalidate_interval:
+            return entry
+
+        stat = os.stat(path)
+
+        if (entry is not None and entry.mtime_ns == stat.st_mtime_ns and
+                len(entry.data) == stat.st_size):
+            entry.checked = now
+            return entry
+
+        if not stat_module.S_ISREG(stat.st_mode) or stat.st_size > self._max_file_size:
+            self._discard(path)
+
+            # NOTE(kgriffs): Let io.open() raise an error as usual in the
+            #   case that the path does not refer to a file.
+            return io.open(path, mode)
+
+        with io.open(path, mode) as stream:
+            stat = os.fstat(stream.fileno())
+            data = stream.read()
+
+        entry = _CachedFile(data, stat, self._load_variants(path, stat), now)
+        self._store(path, entry)
+
+        return entry
+
+    def _load_variants(self, path, stat):
+        variants = []
+
+        for encoding, extension in _PRECOMPRESSED_VARIANTS:
+            try:
+                with io.open(path + extension, 'rb') as stream:
+                    variant_stat = os.fstat(stream.fileno())
+
+                    # NOTE(kgriffs): Ignore variants that are older than the
+                    #   original file, since they are likely to be stale.
+                    if (variant_stat.st_mtime_ns < stat.st_mtime_ns or
+                            variant_stat.st_size > self._max_file_size):
+                        continue
+
+                    data = stream.read()
+            except IOError:
+                continue
+
+            variants.append((encoding, data, _make_etag(stat, encoding)))
+
+        return tuple(variants)
+
+    def _discard(self, path):
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def _store(self, path, entry):
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            # NOTE(kgriffs): The entry is still served, just not retained,
+            #   in the case that it would not fit in the cache by itself.
+            if entry.size > self._max_size:
+                return
+
+            self._entries[path] = entry
+            self._size += entry.size
+
+            while self._size > self._max_size:
+                __, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+
+class _BoundedFileReader:
+    """Limit reads from a file to a given number of bytes.
+
+    Args:
+        file: The file object to read from, already positioned at the
+            start of the range to serve.
+        length (int): The number of bytes to serve.
+    """
+
+    __slots__ = ['file', 'remaining']
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+
+        if not size:
+            return b''
+
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
 
 
 class _AsyncFileReader:
@@ -146,4 +458,270 @@ class _AsyncFileReader:
         self._loop = get_running_loop()
 
     async def read(self, size=-1):
-        return await self._loop.run_in_executor(None, partial(self._file.read, size))
+        return await self._loop.run_in_executor(_get_executor(), partial(self._file.read, size))
+
+    async def close(self):
+        self._file.close()
+
+    async def send_with_extension(self, send, extensions):
+        """Hand the file off to the ASGI server, if supported.
+
+        Args:
+            send (coroutine function): The ASGI send() callable.
+            extensions (dict): The ASGI ``extensions`` advertised by the
+                server via the connection scope.
+
+        Returns:
+            bool: ``True`` if the response body was sent by way of an ASGI
+            extension (in which case the response is complete), ``False``
+            if the file must be streamed instead.
+        """
+
+        file = self._file
+        count = None
+
+        if type(file) is _BoundedFileReader:
+            count = file.remaining
+            file = file.file
+
+        if EventType.HTTP_RESPONSE_ZEROCOPYSEND in extensions:
+            try:
+                file.fileno()
+            except (AttributeError, OSError):
+                # NOTE(kgriffs): Not a real file (io.UnsupportedOperation
+                #   derives from OSError).
+                pass
+            else:
+                # NOTE(kgriffs): The server takes over the file at this
+                #   point, so we leave it to the server (or the garbage
+                #   collector, once the server drops its reference) to
+                #   close it.
+                event = {
+                    'type': EventType.HTTP_RESPONSE_ZEROCOPYSEND,
+                    'file': file,
+                    'offset': file.tell(),
+                    'more_body': False,
+                }
+                if count is not None:
+                    event['count'] = count
+
+                await send(event)
+                return True
+
+        if EventType.HTTP_RESPONSE_PATHSEND in extensions and count is None:
+            path = getattr(file, 'name', None)
+
+            # NOTE(kgriffs): The path extension always sends the complete
+            #   file, so we can only use it if we haven't read from or
+            #   seeked within the file.
+            if isinstance(path, str) and file.tell() == 0:
+                file.close()
+
+                await send({
+                    'type': EventType.HTTP_RESPONSE_PATHSEND,
+                    'path': os.path.abspath(path),
+                })
+                return True
+
+        return False
+
+
+def _get_executor():
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_ASYNC_MAX_WORKERS,
+            thread_name_prefix='falcon-static',
+        )
+
+    return _executor
+
+
+def _make_etag(stat, encoding=None):
+    # NOTE(kgriffs): HTTP dates only have a resolution of one second,
+    #   whereas the ETag can take advantage of the full resolution
+    #   supported by the filesystem.
+    etag = '{:x}-{:x}'.format(stat.st_mtime_ns, stat.st_size)
+
+    if encoding is not None:
+        etag += '-' + encoding
+
+    return etag
+
+
+def _make_conditional(req, resp, stream):
+    """Set validators, and honor conditional and range requests.
+
+    Returns:
+        The stream to use for the response body, or ``None`` in the
+        case that the client's cached copy is still fresh.
+    """
+
+    try:
+        stat = os.fstat(stream.fileno())
+    except (AttributeError, OSError):
+        # NOTE(kgriffs): Not a real file (io.UnsupportedOperation
+        #   derives from OSError), so there is nothing to go on.
+        return stream
+
+    size = stat.st_size
+    last_modified = datetime.utcfromtimestamp(int(stat.st_mtime))
+
+    try:
+        selected = _apply_validators(req, resp, _make_etag(stat), last_modified, size)
+    except falcon.HTTPRangeNotSatisfiable:
+        # NOTE(kgriffs): The file is already open at this point, and it would
+        #   otherwise be leaked, since it never makes it into the response.
+        stream.close()
+        raise
+
+    if selected is None:
+        stream.close()
+        return None
+
+    first, length = selected
+    if length == size:
+        return stream
+
+    stream.seek(first)
+    return _BoundedFileReader(stream, length)
+
+
+def _serve_cached(req, resp, entry):
+    data = entry.data
+    etag = entry.etag
+
+    if entry.variants:
+        resp.vary = ('Accept-Encoding',)
+
+        # NOTE(kgriffs): Byte ranges are only supported for the original
+        #   representation of the file.
+        if req.get_header('Range') is None:
+            variants = entry.variants
+            selected = _negotiate_content_coding(
+                req.get_header('Accept-Encoding'),
+                [encoding for encoding, __, __ in variants],
+            )
+
+            for encoding, variant_data, variant_etag in variants:
+                if encoding == selected:
+                    data = variant_data
+                    etag = variant_etag
+                    resp.set_header('Content-Encoding', encoding)
+                    break
+
+    size = len(data)
+
+    selected = _apply_validators(req, resp, etag, entry.last_modified, size)
+    if selected is None:
+        return
+
+    first, length = selected
+    resp.data = data if length == size else data[first:first + length]
+
+
+def _apply_validators(req, resp, etag, last_modified, size):
+    """Set validators, and evaluate conditional and range requests.
+
+    Returns:
+        tuple: The first byte to serve and the number of bytes to serve, or
+        ``None`` in the case that the client's cached copy is still fresh.
+    """
+
+    resp.etag = etag
+    resp.last_modified = last_modified
+    resp.accept_ranges = 'bytes'
+
+    if _is_not_modified(req, etag, last_modified):
+        resp.status = falcon.HTTP_304
+
+        # NOTE(kgriffs): A 304 response must not include a
+        #   Content-Type header, since there is no content.
+        resp.content_type = None
+        resp.delete_header('Content-Encoding')
+        return None
+
+    byte_range = _get_byte_range(req, etag, last_modified, size)
+    if byte_range is None:
+        resp.content_length = size
+        return 0, size
+
+    first, last = byte_range
+    length = last - first + 1
+
+    resp.status = falcon.HTTP_206
+    resp.content_range = (first, last, size)
+    resp.content_length = length
+
+    return first, length
+
+
+def _is_not_modified(req, etag, last_modified):
+    if req.method not in ('GET', 'HEAD'):
+        return False
+
+    # NOTE(kgriffs): Per RFC 7232, Section 6, If-Modified-Since is ignored
+    #   when If-None-Match is present.
+    if_none_match = req.if_none_match
+    if if_none_match:
+        return any(tag == '*' or tag == etag for tag in if_none_match)
+
+    if_modified_since = _parse_http_date(req.get_header('If-Modified-Since'))
+    return if_modified_since is not None and last_modified <= if_modified_since
+
+
+def _get_byte_range(req, etag, last_modified, size):
+    # NOTE(kgriffs): Per RFC 7233, Section 3.1, a Range header received
+    #   with any method other than GET must be ignored.
+    if req.method != 'GET':
+        return None
+
+    try:
+        byte_range = req.range
+        if byte_range is None or req.range_unit != 'bytes':
+            return None
+    except falcon.HTTPInvalidHeader:
+        # NOTE(kgriffs): Either the range is invalid, or multiple ranges
+        #   were requested. In either case, simply serve the entire file.
+        return None
+
+    if_range = req.get_header('If-Range')
+    if if_range is not None:
+        # NOTE(kgriffs): Per RFC 7233, Section 3.2, an entity-tag requires a
+        #   strong comparison, while a date must be an exact match.
+        if if_range.startswith(('"', 'W/')):
+            if if_range != '"' + etag + '"':
+                return None
+        elif _parse_http_date(if_range) != last_modified:
+            return None
+
+    first, last = byte_range
+
+    if first < 0:
+        # NOTE(kgriffs): A suffix range, i.e., the last N bytes.
+        if not size:
+            raise falcon.HTTPRangeNotSatisfiable(size)
+        return max(size + first, 0), size - 1
+
+    if last != -1 and last < first:
+        return None
+
+    if first >= size:
+        raise falcon.HTTPRangeNotSatisfiable(size)
+
+    if last == -1 or last >= size:
+        last = size - 1
+
+    return first, last
+
+
+def _parse_http_date(value):
+    if value is None:
+        return None
+
+    try:
+        return http_date_to_dt(value)
+    except ValueError:
+        # NOTE(kgriffs): Per RFC 7232, an invalid date is simply ignored.
+        return None
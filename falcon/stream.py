@@ -167,3 +167,103 @@ class BoundedStream(io.IOBase):
 
 # NOTE(kgriffs): Alias for backwards-compat
 Body = BoundedStream
+
+
+class _DecodedStream(io.IOBase):
+    """Wrap a BoundedStream in order to decompress the request body.
+
+    Args:
+        stream (BoundedStream): The stream to read the compressed body from.
+        decoder: The decoder to use for decompressing the body (see also:
+            :class:`falcon.request_helpers._BodyDecoder`).
+    """
+
+    def __init__(self, stream, decoder):
+        self.stream = stream
+
+        self._decoder = decoder
+        self._buffer = b''
+        self._eof = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        data = self.read(64 * 1024)
+        if not data:
+            raise StopIteration
+        return data
+
+    next = __next__
+
+    def readable(self):
+        """Return ``True`` always."""
+        return True
+
+    def seekable(self):
+        """Return ``False`` always."""
+        return False
+
+    def writable(self):
+        """Return ``False`` always."""
+        return False
+
+    def read(self, size=None):
+        """Read and decompress data from the stream.
+
+        Args:
+            size (int): Maximum number of decompressed bytes to read.
+                Defaults to reading until EOF.
+
+        Returns:
+            bytes: Data read from the stream.
+
+        """
+
+        if size is None or size < 0:
+            chunks = [self._buffer]
+            self._buffer = b''
+
+            while not self._eof:
+                chunks.append(self._read_chunk())
+
+            return b''.join(chunks)
+
+        while len(self._buffer) < size and not self._eof:
+            self._buffer += self._read_chunk()
+
+        data = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return data
+
+    def write(self, data):
+        """Raise IOError always; writing is not supported."""
+
+        raise IOError('Stream is not writeable')
+
+    def exhaust(self, chunk_size=64 * 1024):
+        """Exhaust the stream.
+
+        The remainder of the compressed body is consumed without being
+        decompressed.
+
+        Args:
+            chunk_size (int): The size for a chunk (default: 64 KB).
+        """
+
+        self._buffer = b''
+        self._eof = True
+        self.stream.exhaust(chunk_size)
+
+    @property
+    def eof(self):
+        return self._eof and not self._buffer
+
+    def _read_chunk(self):
+        chunk = self.stream.read(64 * 1024)
+        if not chunk:
+            self._eof = True
+            self._decoder.finish()
+            return b''
+
+        return self._decoder.decode(chunk)
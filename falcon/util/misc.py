@@ -469,6 +469,56 @@ def code_to_http_status(status):
         return '{} {}'.format(code, _DEFAULT_HTTP_REASON)
 
 
+def _negotiate_content_coding(accept_encoding, codings):
+    """Select the preferred content coding as per an Accept-Encoding value.
+
+    A coding's own q-value takes precedence over that of the wildcard
+    (``*``), so that, e.g., ``br;q=0, *`` rules out ``br`` while accepting
+    any other coding. Ties are resolved in favor of the coding that comes
+    first in `codings`.
+
+    Args:
+        accept_encoding (str): The value of the Accept-Encoding header.
+        codings (iterable): The content codings that are available, in
+            order of preference.
+
+    Returns:
+        str: The selected coding, or ``None`` if none of the codings are
+        acceptable.
+    """
+
+    if not accept_encoding:
+        return None
+
+    qvalues = {}
+
+    for coding in accept_encoding.split(','):
+        coding, __, params = coding.partition(';')
+
+        qvalue = 1.0
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                qvalue = float(params[2:])
+            except ValueError:
+                qvalue = 0.0
+
+        qvalues[coding.strip().lower()] = qvalue
+
+    wildcard = qvalues.get('*', 0.0)
+
+    best = None
+    best_qvalue = 0.0
+
+    for coding in codings:
+        qvalue = qvalues.get(coding, wildcard)
+        if qvalue > best_qvalue:
+            best = coding
+            best_qvalue = qvalue
+
+    return best
+
+
 def _isascii(string):
     """Return ``True`` if all characters in the string are ASCII.
 
@@ -28,10 +28,12 @@ from falcon.constants import PYPY
 try:
     from falcon.cyutil.uri import (
         decode as _cy_decode,
+        parse_form_fields as _cy_parse_form_fields,
         parse_query_string as _cy_parse_query_string,
     )
 except ImportError:
     _cy_decode = None
+    _cy_parse_form_fields = None
     _cy_parse_query_string = None
 
 
@@ -482,10 +484,216 @@ def unquote_string(quoted):
                           for q in tmp_quoted.split(r'\\')])
 
 
+# NOTE(vytas): The number of bytes to read at a time when parsing URL-encoded
+#   forms from a stream.
+_FORM_CHUNK_SIZE = 64 * 1024
+
+
+def _merge_params(params, extra_params):
+    if not params:
+        params.update(extra_params)
+        return
+
+    for key, value in extra_params.items():
+        old_value = params.get(key)
+
+        if old_value is None:
+            params[key] = value
+        elif isinstance(old_value, list):
+            if isinstance(value, list):
+                old_value.extend(value)
+            else:
+                old_value.append(value)
+        elif isinstance(value, list):
+            params[key] = [old_value] + value
+        else:
+            params[key] = [old_value, value]
+
+
+def _parse_form_fields(data, params, keep_blank, csv, max_fields,
+                       max_key_size, max_value_size):
+    """Parse a block of complete URL-encoded form fields, and merge them into params.
+
+    Args:
+        data (bytes): One or more ``&``-separated fields.
+        params (dict): The parameters parsed so far.
+        keep_blank (bool): See also :func:`parse_query_string`.
+        csv (bool): See also :func:`parse_query_string`.
+        max_fields (int): The maximum number of fields allowed in this
+            block, or ``-1`` for no limit.
+        max_key_size (int): The maximum length of a field name, or ``0`` for
+            no limit.
+        max_value_size (int): The maximum length of a field value, or ``0``
+            for no limit.
+
+    Returns:
+        int: The number of fields in `data`.
+
+    Raises:
+        ValueError: `data` contains non-ASCII characters, or exceeds one of
+            the specified limits.
+    """
+    count = data.count(b'&') + 1
+    if 0 <= max_fields < count:
+        raise ValueError('maximum number of form fields exceeded')
+
+    if max_key_size or max_value_size:
+        for field in data.split(b'&'):
+            _check_form_field(field, max_key_size, max_value_size)
+
+    # NOTE(kgriffs): According to http://goo.gl/6rlcux the
+    # body should be US-ASCII. Enforcing this also helps
+    # catch malicious input.
+    extra_params = parse_query_string(
+        data.decode('ascii'), keep_blank=keep_blank, csv=csv)
+
+    _merge_params(params, extra_params)
+    return count
+
+
+def _check_form_field(field, max_key_size, max_value_size):
+    # PERF(vytas): Avoid copying the field as opposed to partitioning it.
+    partition = field.find(b'=')
+    key_size = len(field) if partition < 0 else partition
+
+    if max_key_size and key_size > max_key_size:
+        raise ValueError('form field name is too long')
+    if max_value_size and len(field) - key_size - 1 > max_value_size:
+        raise ValueError('form field value is too long')
+
+
+class _URLEncodedFormParser:
+    """Incremental ``application/x-www-form-urlencoded`` parser.
+
+    The form body is fed to the parser in chunks, and complete fields are
+    parsed as soon as they become available, so that the body never has to
+    be buffered in its entirety. The result is identical to running
+    :func:`parse_query_string` on the whole (ASCII-decoded) body.
+
+    Keyword Args:
+        keep_blank (bool): See also :func:`parse_query_string`.
+        csv (bool): See also :func:`parse_query_string`.
+        max_pairs (int): The maximum number of ``&``-separated fields in the
+            form (default ``0``, meaning no limit).
+        max_key_size (int): The maximum length of a field name, in bytes,
+            before percent-decoding (default ``0``, meaning no limit).
+        max_value_size (int): The maximum length of a field value, in bytes,
+            before percent-decoding (default ``0``, meaning no limit).
+    """
+
+    __slots__ = (
+        '_csv',
+        '_keep_blank',
+        '_max_key_size',
+        '_max_pairs',
+        '_max_value_size',
+        '_pairs',
+        '_params',
+        '_tail',
+        '_tail_key_size',
+        '_tail_size',
+    )
+
+    def __init__(self, keep_blank=False, csv=True, max_pairs=0,
+                 max_key_size=0, max_value_size=0):
+        self._csv = csv
+        self._keep_blank = keep_blank
+        self._max_key_size = max_key_size
+        self._max_pairs = max_pairs
+        self._max_value_size = max_value_size
+
+        self._pairs = 0
+        self._params = {}
+
+        # NOTE(vytas): The incomplete last field is collected as a list of
+        #   chunks that is joined only once the field is complete, so that a
+        #   large field is neither copied nor scanned over and over again.
+        self._tail = []
+        self._tail_key_size = -1
+        self._tail_size = 0
+
+    def feed(self, data):
+        """Parse any complete fields, retaining the last incomplete one.
+
+        Raises:
+            ValueError: The data fed so far is malformed or exceeds one of the
+                configured limits.
+        """
+        # PERF(vytas): Only search the new chunk, since the retained tail is
+        #   already known not to contain any separators.
+        index = data.rfind(b'&')
+        if index >= 0:
+            if self._tail:
+                self._tail.append(data[:index])
+                self._parse(b''.join(self._tail))
+                self._reset_tail()
+            else:
+                self._parse(data[:index])
+
+            data = data[index + 1:]
+
+        if not data:
+            return
+
+        # NOTE(vytas): Fail early if the incomplete field can be already
+        #   determined to be too long, rather than buffering it further.
+        if self._max_key_size or self._max_value_size:
+            self._check_tail(data)
+
+        self._tail.append(data)
+        self._tail_size += len(data)
+
+    def close(self):
+        """Parse the last field, and return the resulting parameters.
+
+        Returns:
+            dict: A dictionary of (*name*, *value*) pairs as returned by
+            :func:`parse_query_string`.
+
+        Raises:
+            ValueError: The form is malformed or exceeds one of the configured
+                limits.
+        """
+        if self._tail:
+            self._parse(b''.join(self._tail))
+            self._reset_tail()
+
+        return self._params
+
+    def _check_tail(self, data):
+        key_size = self._tail_key_size
+        if key_size < 0:
+            partition = data.find(b'=')
+            if partition >= 0:
+                key_size = self._tail_key_size = self._tail_size + partition
+
+        size = self._tail_size + len(data)
+        if key_size < 0:
+            key_size = size
+
+        if self._max_key_size and key_size > self._max_key_size:
+            raise ValueError('form field name is too long')
+        if self._max_value_size and size - key_size - 1 > self._max_value_size:
+            raise ValueError('form field value is too long')
+
+    def _reset_tail(self):
+        self._tail = []
+        self._tail_key_size = -1
+        self._tail_size = 0
+
+    def _parse(self, data):
+        max_fields = self._max_pairs - self._pairs if self._max_pairs else -1
+
+        self._pairs += _parse_form_fields(
+            data, self._params, self._keep_blank, self._csv, max_fields,
+            self._max_key_size, self._max_value_size)
+
+
 # TODO(vytas): Restructure this in favour of a cleaner way to hoist the pure
 # Cython functions into this module.
 decode = _cy_decode or decode  # NOQA
 parse_query_string = _cy_parse_query_string or parse_query_string  # NOQA
+_parse_form_fields = _cy_parse_form_fields or _parse_form_fields
 
 
 __all__ = [
@@ -0,0 +1,316 @@
+import asyncio
+
+import pytest
+
+import falcon
+from falcon import testing
+import falcon.asgi
+import falcon.asgi.admission
+
+
+class BlockingResource:
+    def __init__(self):
+        self.called = 0
+        self.release = asyncio.Event()
+
+    async def on_get(self, req, resp):
+        self.called += 1
+        await self.release.wait()
+        resp.text = 'Done'
+
+    async def on_get_stream(self, req, resp):
+        async def chunks():
+            yield b'Hello'
+            await self.release.wait()
+            yield b', World!'
+
+        resp.stream = chunks()
+
+    async def on_get_error(self, req, resp):
+        async def chunks():
+            await self.release.wait()
+            raise RuntimeError('Oops')
+            yield b''  # pragma: no cover
+
+        resp.stream = chunks()
+
+
+class CountingMiddleware:
+    def __init__(self):
+        self.requests = 0
+        self.responses = 0
+
+    async def process_request(self, req, resp):
+        self.requests += 1
+
+    async def process_response(self, req, resp, resource, req_succeeded):
+        self.responses += 1
+
+
+async def settle():
+    for __ in range(50):
+        await asyncio.sleep(0)
+
+
+async def read_until(stream, suffix):
+    data = b''
+    for __ in range(1000):
+        data += await stream.read()
+        if data.endswith(suffix):
+            return data
+
+    raise AssertionError('Timed out reading the stream')
+
+
+def create_app(middleware=None, **kwargs):
+    limiter = falcon.asgi.ConcurrencyLimiter(**kwargs)
+    resource = BlockingResource()
+
+    app = falcon.asgi.App(concurrency_limiter=limiter, middleware=middleware or [])
+    app.add_route('/things', resource)
+    app.add_route('/stream', resource, suffix='stream')
+    app.add_route('/error', resource, suffix='error')
+    app.add_route('/reports', resource)
+    app.add_route('/health', resource)
+
+    return app, limiter, resource
+
+
+def get_all(conductor, paths):
+    return [asyncio.ensure_future(conductor.simulate_get(path)) for path in paths]
+
+
+@pytest.mark.asyncio
+async def test_limit_and_queue():
+    middleware = CountingMiddleware()
+    app, limiter, resource = create_app(middleware=[middleware], limit=2, queue_size=1)
+
+    async with testing.ASGIConductor(app) as conductor:
+        tasks = get_all(conductor, ['/things'] * 3)
+        await settle()
+
+        assert resource.called == 2
+        assert limiter.stats()['default']['in_flight'] == 2
+        assert limiter.stats()['default']['queued'] == 1
+
+        result = await conductor.simulate_get('/things')
+        assert result.status_code == 503
+        assert result.headers['Retry-After'] == '1'
+
+        resource.release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert [result.status_code for result in results] == [200] * 3
+    assert resource.called == 3
+
+    # NOTE(kgriffs): The shed request skipped process_request(), but since
+    #   middleware is independent by default, process_response() still ran.
+    assert middleware.requests == 3
+    assert middleware.responses == 4
+
+    assert limiter.stats() == {
+        'default': {
+            'limit': 2,
+            'in_flight': 0,
+            'queued': 0,
+            'admitted': 3,
+            'delayed': 1,
+            'shed': 1,
+            'latency': limiter.stats()['default']['latency'],
+        },
+    }
+    assert limiter.stats()['default']['latency'] >= 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout():
+    app, limiter, resource = create_app(limit=1, queue_timeout=0.01, retry_after=5)
+
+    async with testing.ASGIConductor(app) as conductor:
+        tasks = get_all(conductor, ['/things'])
+        await settle()
+
+        result = await conductor.simulate_get('/things')
+        assert result.status_code == 503
+        assert result.headers['Retry-After'] == '5'
+        assert limiter.stats()['default']['queued'] == 0
+
+        resource.release.set()
+        await asyncio.gather(*tasks)
+
+        assert (await conductor.simulate_get('/things')).status_code == 200
+
+    stats = limiter.stats()['default']
+    assert stats['admitted'] == 2
+    assert stats['shed'] == 1
+    assert stats['in_flight'] == 0
+
+
+@pytest.mark.parametrize('kwargs', [{'queue_size': 0}, {'queue_timeout': 0}])
+@pytest.mark.asyncio
+async def test_no_queue(kwargs):
+    app, limiter, resource = create_app(limit=1, **kwargs)
+
+    async with testing.ASGIConductor(app) as conductor:
+        tasks = get_all(conductor, ['/things'])
+        await settle()
+
+        assert (await conductor.simulate_get('/things')).status_code == 503
+
+        resource.release.set()
+        await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_classify():
+    def classify(req):
+        if req.path == '/health':
+            return None
+
+        return req.path.strip('/')
+
+    app, limiter, resource = create_app(
+        limit=2, limits={'reports': 1}, queue_size=0, classify=classify)
+
+    async with testing.ASGIConductor(app) as conductor:
+        tasks = get_all(conductor, ['/things', '/things', '/reports', '/health', '/health'])
+        await settle()
+
+        assert resource.called == 5
+        assert (await conductor.simulate_get('/things')).status_code == 503
+        assert (await conductor.simulate_get('/reports')).status_code == 503
+
+        resource.release.set()
+        results = await asyncio.gather(*tasks)
+        assert [result.status_code for result in results] == [200] * 5
+
+    stats = limiter.stats()
+    assert sorted(stats) == ['reports', 'things']
+    assert stats['things']['limit'] == 2
+    assert stats['things']['shed'] == 1
+    assert stats['reports']['limit'] == 1
+    assert stats['reports']['shed'] == 1
+
+
+@pytest.mark.asyncio
+async def test_slot_held_while_streaming():
+    app, limiter, resource = create_app(limit=1, queue_size=0)
+
+    async with testing.ASGIConductor(app) as conductor:
+        async with conductor.simulate_get_stream('/stream') as sr:
+            assert await read_until(sr.stream, b'Hello') == b'Hello'
+
+            assert limiter.stats()['default']['in_flight'] == 1
+            assert (await conductor.simulate_get('/things')).status_code == 503
+
+            resource.release.set()
+            assert await read_until(sr.stream, b'!') == b', World!'
+
+        await settle()
+        assert limiter.stats()['default']['in_flight'] == 0
+        assert (await conductor.simulate_get('/things')).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_slot_released_on_error():
+    app, limiter, resource = create_app(limit=1)
+    resource.release.set()
+
+    async with testing.ASGIConductor(app) as conductor:
+        with pytest.raises(RuntimeError):
+            await conductor.simulate_get('/error')
+
+    assert limiter.stats()['default']['in_flight'] == 0
+
+
+@pytest.mark.asyncio
+async def test_custom_error_handler():
+    app, limiter, resource = create_app(limit=1, queue_size=0)
+
+    async def handle(req, resp, ex, params):
+        resp.status = falcon.HTTP_429
+        resp.media = {'shed': True}
+
+    app.add_error_handler(falcon.HTTPServiceUnavailable, handle)
+
+    async with testing.ASGIConductor(app) as conductor:
+        tasks = get_all(conductor, ['/things'])
+        await settle()
+
+        result = await conductor.simulate_get('/things')
+        assert result.status_code == 429
+        assert result.json == {'shed': True}
+
+        resource.release.set()
+        await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter():
+    limiter = falcon.asgi.ConcurrencyLimiter(limit=1)
+
+    token = await limiter.acquire(None)
+
+    # NOTE(kgriffs): Cancel a waiter that is still in the queue.
+    waiter = asyncio.ensure_future(limiter.acquire(None))
+    await settle()
+    waiter.cancel()
+    await settle()
+    assert limiter.stats()['default']['queued'] == 0
+
+    # NOTE(kgriffs): Cancel a waiter right after the slot was handed to it.
+    waiter = asyncio.ensure_future(limiter.acquire(None))
+    await settle()
+    limiter.release(token)
+    waiter.cancel()
+    await settle()
+
+    stats = limiter.stats()['default']
+    assert stats['in_flight'] == 0
+    assert stats['queued'] == 0
+
+    token = await limiter.acquire(None)
+    assert limiter.stats()['default']['in_flight'] == 1
+    limiter.release(token)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(falcon.asgi.admission.time, 'monotonic', lambda: now[0])
+
+    limiter = falcon.asgi.ConcurrencyLimiter(limit=4, target_latency=0.1, min_limit=2)
+
+    async def request(latency, count=1):
+        tokens = [await limiter.acquire(None) for __ in range(count)]
+        now[0] += latency
+        for token in tokens:
+            limiter.release(token)
+
+    # NOTE(kgriffs): Slow requests reduce the limit, down to min_limit.
+    for __ in range(10):
+        await request(0.5)
+
+    assert limiter.stats()['default']['limit'] == 2
+    assert limiter.stats()['default']['latency'] > 0.1
+
+    # NOTE(kgriffs): Once the latency is back on target, the limit is only
+    #   raised while it is actually being reached.
+    for __ in range(50):
+        await request(0.01)
+
+    assert limiter.stats()['default']['limit'] == 2
+
+    for __ in range(20):
+        await request(0.01, count=int(limiter.stats()['default']['limit']))
+
+    assert limiter.stats()['default']['limit'] == 4
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'limit': 0},
+    {'limits': {'reports': 0}},
+])
+def test_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        falcon.asgi.ConcurrencyLimiter(**kwargs)
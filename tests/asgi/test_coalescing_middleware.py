@@ -0,0 +1,246 @@
+import asyncio
+
+import pytest
+
+import falcon
+from falcon import testing
+import falcon.asgi
+
+
+class ThingsResource:
+    def __init__(self, fail_first=False, set_cookie=False):
+        self.called = 0
+        self.release = None
+        self._fail_first = fail_first
+        self._set_cookie = set_cookie
+
+    async def on_get(self, req, resp):
+        self.called += 1
+        called = self.called
+
+        await self.release.wait()
+
+        if self._fail_first and called == 1:
+            raise falcon.HTTPServiceUnavailable()
+
+        if self._set_cookie:
+            resp.set_cookie('session', str(called))
+
+        resp.append_header('X-Things', str(called))
+        resp.media = {'called': called, 'query': req.query_string}
+
+    async def on_post(self, req, resp):
+        await self.on_get(req, resp)
+
+
+async def wait_for(predicate):
+    for __ in range(1000):
+        if predicate():
+            return
+
+        await asyncio.sleep(0)
+
+    raise AssertionError('Timed out waiting for the predicate')
+
+
+async def simulate_concurrently(conductor, resource, count, method='GET', **kwargs):
+    resource.release = asyncio.Event()
+
+    tasks = [
+        asyncio.ensure_future(conductor.simulate_request(method, '/things', **kwargs))
+        for __ in range(count)
+    ]
+
+    # NOTE(kgriffs): Let all of the requests reach either the responder or
+    #   the coalescing middleware before releasing them.
+    for __ in range(50):
+        await asyncio.sleep(0)
+
+    resource.release.set()
+    return await asyncio.gather(*tasks)
+
+
+def create_app(resource, **kwargs):
+    coalescing = falcon.CoalescingMiddleware(**kwargs)
+
+    app = falcon.asgi.App(middleware=[coalescing])
+    app.add_route('/things', resource)
+
+    return app, coalescing
+
+
+@pytest.mark.asyncio
+async def test_coalesced():
+    resource = ThingsResource()
+    app, coalescing = create_app(resource)
+
+    async with testing.ASGIConductor(app) as conductor:
+        results = await simulate_concurrently(conductor, resource, 5, query_string='x=1')
+
+        assert resource.called == 1
+        for result in results:
+            assert result.status_code == 200
+            assert result.json == {'called': 1, 'query': 'x=1'}
+            assert result.headers['X-Things'] == '1'
+            assert result.headers['Content-Length'] == results[0].headers['Content-Length']
+
+        assert coalescing.in_flight == 0
+        assert coalescing.stats == {
+            'falconframework.org/things?x=1': {
+                'executed': 1,
+                'coalesced': 4,
+                'timeouts': 0,
+                'max_concurrency': 5,
+            },
+        }
+
+        # NOTE(kgriffs): Requests that are not concurrent are not coalesced.
+        results = await simulate_concurrently(conductor, resource, 1, query_string='x=1')
+        assert results[0].json['called'] == 2
+        assert coalescing.stats['falconframework.org/things?x=1']['executed'] == 2
+
+
+@pytest.mark.asyncio
+async def test_different_keys():
+    resource = ThingsResource()
+    app, coalescing = create_app(resource)
+    resource.release = asyncio.Event()
+
+    async with testing.ASGIConductor(app) as conductor:
+        tasks = [
+            asyncio.ensure_future(conductor.simulate_get('/things', query_string=query))
+            for query in ('x=1', 'x=2', 'x=1')
+        ]
+
+        await wait_for(lambda: coalescing.in_flight == 2)
+        resource.release.set()
+
+        results = await asyncio.gather(*tasks)
+
+    assert resource.called == 2
+    assert [result.json for result in results] == [
+        {'called': 1, 'query': 'x=1'},
+        {'called': 2, 'query': 'x=2'},
+        {'called': 1, 'query': 'x=1'},
+    ]
+
+
+@pytest.mark.parametrize('method,headers', [
+    ('POST', None),
+    ('GET', {'Authorization': 'Bearer token'}),
+    ('GET', {'Cookie': 'session=abc123'}),
+])
+@pytest.mark.asyncio
+async def test_not_coalesced(method, headers):
+    resource = ThingsResource()
+    app, coalescing = create_app(resource)
+
+    async with testing.ASGIConductor(app) as conductor:
+        results = await simulate_concurrently(
+            conductor, resource, 3, method=method, headers=headers)
+
+    assert resource.called == 3
+    assert sorted(result.json['called'] for result in results) == [1, 2, 3]
+    assert coalescing.stats == {}
+
+
+@pytest.mark.parametrize('resource', [
+    ThingsResource(fail_first=True),
+    ThingsResource(set_cookie=True),
+])
+@pytest.mark.asyncio
+async def test_not_shared(resource):
+    app, coalescing = create_app(resource)
+
+    async with testing.ASGIConductor(app) as conductor:
+        results = await simulate_concurrently(conductor, resource, 3)
+
+    assert resource.called == 3
+    assert coalescing.in_flight == 0
+
+    stats = coalescing.stats['falconframework.org/things?']
+    assert stats['executed'] == 1
+    assert stats['coalesced'] == 0
+    assert stats['max_concurrency'] == 3
+
+    if resource._fail_first:
+        assert [result.status_code for result in results] == [503, 200, 200]
+    else:
+        assert sorted(result.cookies['session'].value for result in results) == ['1', '2', '3']
+
+
+@pytest.mark.asyncio
+async def test_timeout():
+    resource = ThingsResource()
+    app, coalescing = create_app(resource, timeout=0.01)
+    resource.release = asyncio.Event()
+
+    async with testing.ASGIConductor(app) as conductor:
+        leader = asyncio.ensure_future(conductor.simulate_get('/things'))
+        await wait_for(lambda: resource.called == 1)
+
+        follower = asyncio.ensure_future(conductor.simulate_get('/things'))
+
+        # NOTE(kgriffs): Once the follower times out, it is processed as
+        #   usual, and the flight is abandoned.
+        await asyncio.sleep(0.05)
+        assert resource.called == 2
+        assert coalescing.in_flight == 0
+
+        resource.release.set()
+        results = await asyncio.gather(leader, follower)
+
+    assert [result.json['called'] for result in results] == [1, 2]
+
+    stats = coalescing.stats['falconframework.org/things?']
+    assert stats['executed'] == 1
+    assert stats['timeouts'] == 1
+    assert stats['coalesced'] == 0
+
+
+@pytest.mark.asyncio
+async def test_custom_key():
+    resource = ThingsResource()
+    app, coalescing = create_app(resource, key=lambda req: req.path)
+    resource.release = asyncio.Event()
+
+    async with testing.ASGIConductor(app) as conductor:
+        tasks = [
+            asyncio.ensure_future(conductor.simulate_get('/things', query_string=query))
+            for query in ('x=1', 'x=2')
+        ]
+
+        await wait_for(lambda: coalescing.stats.get('/things', {}).get('max_concurrency') == 2)
+        resource.release.set()
+
+        results = await asyncio.gather(*tasks)
+
+    assert resource.called == 1
+    assert results[0].json == results[1].json == {'called': 1, 'query': 'x=1'}
+
+
+@pytest.mark.parametrize('stats_size,expected', [
+    (0, []),
+    (1, ['/b']),
+    (2, ['/a', '/b']),
+])
+@pytest.mark.asyncio
+async def test_stats_size(stats_size, expected):
+    class Resource:
+        async def on_get(self, req, resp):
+            pass
+
+    coalescing = falcon.CoalescingMiddleware(key=lambda req: req.path, stats_size=stats_size)
+    app = falcon.asgi.App(middleware=[coalescing])
+    app.add_sink(Resource().on_get, '/')
+
+    async with testing.ASGIConductor(app) as conductor:
+        for path in ('/a', '/b', '/a', '/b'):
+            await conductor.simulate_get(path)
+
+    assert list(coalescing.stats) == expected
+
+
+def test_wsgi_not_supported():
+    with pytest.raises(TypeError):
+        falcon.App(middleware=[falcon.CoalescingMiddleware()])
@@ -1,3 +1,4 @@
+import asyncio
 import io
 import os
 import tempfile
@@ -313,3 +314,114 @@ class TestHelloWorld:
             wsgi_app.add_route('/', PartialCoroutineResource())
 
         assert 'responder must be a regular synchronous method' in str(exinfo.value)
+
+
+async def _collect_body_events(app):
+    body_events = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(event):
+        if event['type'] == 'http.response.body':
+            body_events.append(event.get('body', b''))
+
+    await app(testing.create_scope(), receive, send)
+
+    assert body_events[-1] == b''
+    return body_events[:-1]
+
+
+class TestStreamCoalescing:
+    @pytest.mark.parametrize('min_flush_size,expected_sizes', [
+        (0, [10] * 100),
+        (256, [260, 260, 260, 220]),
+        (1000, [1000]),
+        (4096, [1000]),
+    ])
+    def test_min_flush_size(self, min_flush_size, expected_sizes):
+        class Resource:
+            async def on_get(self, req, resp):
+                async def producer():
+                    for i in range(100):
+                        yield b'%-10d' % i
+
+                resp.stream = producer()
+
+        app = falcon.asgi.App()
+        app.add_route('/', Resource())
+        app.resp_options.stream_min_flush_size = min_flush_size
+
+        body_events = falcon.async_to_sync(_collect_body_events, app)
+
+        assert [len(body) for body in body_events] == expected_sizes
+        assert b''.join(body_events) == b''.join(b'%-10d' % i for i in range(100))
+
+    def test_max_latency(self):
+        class Resource:
+            async def on_get(self, req, resp):
+                async def producer():
+                    yield b'Hello'
+                    yield b', '
+                    yield b'World'
+
+                    await asyncio.sleep(0.1)
+                    yield b'!'
+
+                    for _ in range(4):
+                        yield b'x' * 300
+
+                resp.stream = producer()
+
+        app = falcon.asgi.App()
+        app.add_route('/', Resource())
+        app.resp_options.stream_min_flush_size = 1024
+        app.resp_options.stream_max_latency = 0.01
+
+        body_events = falcon.async_to_sync(_collect_body_events, app)
+
+        assert body_events[0] == b'Hello, World'
+        assert body_events[1] == b'!' + b'x' * 1200
+        assert len(body_events) == 2
+
+    def test_max_latency_error(self):
+        class Resource:
+            async def on_get(self, req, resp):
+                async def producer():
+                    yield b'Hello'
+                    raise ValueError('producer failed')
+
+                resp.stream = producer()
+
+        app = falcon.asgi.App()
+        app.add_route('/', Resource())
+        app.resp_options.stream_min_flush_size = 1024
+        app.resp_options.stream_max_latency = 0.01
+
+        with pytest.raises(ValueError):
+            falcon.async_to_sync(_collect_body_events, app)
+
+    @pytest.mark.parametrize('block_size', [None, 1000, 64 * SIZE_1_KB])
+    def test_stream_block_size(self, block_size):
+        data = os.urandom(20 * SIZE_1_KB)
+        reads = []
+
+        class RecordingReader(DataReader):
+            async def read(self, num_bytes):
+                reads.append(num_bytes)
+                return await super().read(num_bytes)
+
+        class Resource:
+            async def on_get(self, req, resp):
+                resp.stream = RecordingReader(data)
+                resp.stream_block_size = block_size
+
+        app = falcon.asgi.App()
+        app.add_route('/', Resource())
+
+        body_events = falcon.async_to_sync(_collect_body_events, app)
+        assert b''.join(body_events) == data
+
+        expected = block_size or 8 * SIZE_1_KB
+        assert set(reads) == {expected}
+        assert len(reads) == (len(data) + expected - 1) // expected + 1
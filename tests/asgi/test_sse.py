@@ -5,7 +5,7 @@ import pytest
 
 import falcon
 from falcon import testing
-from falcon.asgi import App, SSEvent
+from falcon.asgi import App, SSEReplayBuffer, SSEvent
 
 
 def test_no_events():
@@ -308,3 +308,150 @@ def test_non_iterable():
 
 # TODO: Test with uvicorn
 # TODO: Test in browser with JavaScript
+
+
+async def _collect_sse(app, disconnect_after=None):
+    disconnect = asyncio.Event()
+    body_events = []
+
+    async def receive():
+        if not body_events and not disconnect.is_set():
+            if receive.first:
+                receive.first = False
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        await disconnect.wait()
+        return {'type': 'http.disconnect'}
+
+    receive.first = True
+
+    async def send(event):
+        if event['type'] == 'http.response.body':
+            body_events.append(event.get('body', b''))
+
+            if disconnect_after and len(body_events) >= disconnect_after:
+                disconnect.set()
+
+    await app(testing.create_scope(), receive, send)
+    return body_events
+
+
+@pytest.mark.parametrize('batch_window', [0, 0.02])
+def test_batch_window(batch_window):
+    class SomeResource:
+        async def on_get(self, req, resp):
+            async def emitter():
+                for i in range(5):
+                    yield SSEvent(event_id=str(i))
+
+                await asyncio.sleep(0.1)
+                yield SSEvent(event_id='last')
+
+            resp.sse = emitter()
+
+    app = App()
+    app.add_route('/', SomeResource())
+    app.resp_options.sse_batch_window = batch_window
+    app.resp_options.sse_heartbeat = 10
+
+    body_events = falcon.async_to_sync(_collect_sse, app)
+
+    assert b''.join(body_events) == (
+        b''.join(b'id: %d\n\n' % i for i in range(5)) + b'id: last\n\n'
+    )
+    assert body_events[-1] == b''
+
+    # NOTE(kgriffs): Subtract the terminating body event.
+    if batch_window:
+        assert len(body_events) - 1 == 2
+    else:
+        assert len(body_events) - 1 >= 2
+
+
+def test_heartbeat():
+    emitter_closed = []
+
+    class SomeResource:
+        async def on_get(self, req, resp):
+            async def emitter():
+                try:
+                    yield SSEvent(text='hello')
+                    await asyncio.sleep(10)
+                    yield SSEvent(text='too late')
+                finally:
+                    emitter_closed.append(True)
+
+            resp.sse = emitter()
+
+    app = App()
+    app.add_route('/', SomeResource())
+    app.resp_options.sse_heartbeat = 0.01
+
+    body_events = falcon.async_to_sync(_collect_sse, app, 4)
+
+    assert body_events[:4] == [b'data: hello\n\n', b': ping\n\n', b': ping\n\n', b': ping\n\n']
+    assert body_events[-1] == b''
+    assert emitter_closed
+
+
+def test_buffered_emitter_error():
+    class SomeResource:
+        async def on_get(self, req, resp):
+            async def emitter():
+                yield SSEvent(text='hello')
+                raise ValueError('emitter failed')
+
+            resp.sse = emitter()
+
+    app = App()
+    app.add_route('/', SomeResource())
+    app.resp_options.sse_batch_window = 0.01
+
+    with pytest.raises(ValueError):
+        falcon.async_to_sync(_collect_sse, app)
+
+
+def test_serialize_cached():
+    event = SSEvent(json={'condiment': 'salsa'}, event_id='42')
+
+    serialized = event.serialize()
+    assert serialized == b'id: 42\ndata: {"condiment": "salsa"}\n\n'
+    assert event.serialize() is serialized
+
+    handler = falcon.media.JSONHandler(dumps=lambda obj: json.dumps(obj).upper())
+    assert event.serialize(handler) == b'id: 42\ndata: {"CONDIMENT": "SALSA"}\n\n'
+
+
+def test_replay_buffer():
+    history = SSEReplayBuffer(maxlen=3)
+    assert len(history) == 0
+    assert history.replay(None) == []
+    assert history.replay('0') is None
+
+    events = [SSEvent(text=str(i), event_id=str(i)) for i in range(5)]
+
+    for event in events[:3]:
+        history.append(event)
+
+    assert history.replay('0') == events[1:3]
+    assert history.replay('2') == []
+
+    for event in events[3:]:
+        history.append(event)
+
+    assert len(history) == 3
+    assert history.replay('0') is None
+    assert history.replay('1') is None
+    assert history.replay('2') == events[3:]
+    assert history.replay('3') == events[4:]
+
+    # NOTE(kgriffs): Replay from the latest occurrence of a reused ID.
+    history.append(SSEvent(text='5', event_id='3'))
+    assert [event.text for event in history.replay('3')] == []
+    assert [event.text for event in history.replay('4')] == ['5']
+
+    with pytest.raises(ValueError):
+        history.append(SSEvent(text='anonymous'))
+
+    with pytest.raises(ValueError):
+        SSEReplayBuffer(maxlen=0)
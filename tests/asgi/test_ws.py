@@ -1,5 +1,6 @@
 import asyncio
 from collections import deque
+import json
 import os
 
 import cbor2
@@ -26,6 +27,12 @@ except ImportError:
     msgpack = None
 
 
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+
 # NOTE(kgriffs): We do not use codes defined in the framework because we
 #   want to verify that the correct value is being used.
 class CloseCode:
@@ -537,6 +544,407 @@ async def test_send_receive_data(sample_data, conductor):
     assert resource.error_count == 4
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize('max_n', [None, 1, 3, 100])
+async def test_receive_many_send_many(max_n, conductor):
+    class Resource:
+        def __init__(self):
+            self.batches = []
+            self.ready = asyncio.Event()
+            self.timed_out = None
+            self.disconnect_code = None
+
+        async def on_websocket(self, req, ws):
+            await ws.accept()
+
+            self.timed_out = await ws.receive_many(timeout=0.01)
+            self.ready.set()
+
+            try:
+                while True:
+                    batch = await ws.receive_many(max_n)
+                    assert batch
+                    self.batches.append(batch)
+                    await ws.send_many(batch)
+            except falcon.WebSocketDisconnected as ex:
+                self.disconnect_code = ex.code
+
+    resource = Resource()
+    conductor.app.add_route('/', resource)
+    conductor.app.ws_options.max_receive_queue = 8
+
+    docs = [{'seq': i} for i in range(20)]
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws:
+            await resource.ready.wait()
+
+            for doc in docs:
+                await ws.send_json(doc)
+
+            for doc in docs:
+                assert (await ws.receive_json()) == doc
+
+            await ws.close(4001)
+
+    assert resource.timed_out == []
+    assert [doc for batch in resource.batches for doc in batch] == docs
+    assert max(len(batch) for batch in resource.batches) <= (max_n or 8)
+    assert resource.disconnect_code == 4001
+
+
+@pytest.mark.asyncio
+async def test_receive_many_before_disconnect(conductor):
+    class Resource:
+        def __init__(self):
+            self.batches = []
+            self.disconnect_code = None
+
+        async def on_websocket(self, req, ws):
+            await ws.accept()
+
+            # NOTE(kgriffs): Wait for the client to send both messages and
+            #   then disconnect, so that all events are enqueued at once.
+            while not ws.closed:
+                await asyncio.sleep(0)
+
+            try:
+                while True:
+                    self.batches.append(await ws.receive_many())
+            except falcon.WebSocketDisconnected as ex:
+                self.disconnect_code = ex.code
+
+    resource = Resource()
+    conductor.app.add_route('/', resource)
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws:
+            await ws.send_text('"first"')
+            await ws.send_text('{"second": true}')
+            await ws.close(4002)
+
+    assert resource.batches == [['first', {'second': True}]]
+    assert resource.disconnect_code == 4002
+
+
+@pytest.mark.asyncio
+async def test_send_many_binary(conductor):
+    if msgpack is None:
+        pytest.skip('msgpack is required for this test')
+
+    class Resource:
+        async def on_websocket(self, req, ws):
+            await ws.accept()
+            await ws.send_many(
+                [{'seq': i} for i in range(3)], falcon.WebSocketPayloadType.BINARY)
+
+            with pytest.raises(ValueError):
+                await ws.receive_many(0)
+
+    conductor.app.add_route('/', Resource())
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws:
+            for i in range(3):
+                assert (await ws.receive_msgpack()) == {'seq': i}
+
+
+@pytest.mark.asyncio
+async def test_close_while_receiving(conductor):
+    class Resource:
+        def __init__(self):
+            self.errors = []
+
+        async def on_websocket(self, req, ws):
+            await ws.accept()
+
+            async def close_later():
+                await asyncio.sleep(0.01)
+                await ws.close(4002)
+
+            closer = falcon.create_task(close_later())
+
+            for receive in (ws.receive_text, lambda: ws.receive_many(timeout=1)):
+                try:
+                    await receive()
+                except falcon.WebSocketDisconnected as ex:
+                    self.errors.append(ex)
+
+            await closer
+
+    resource = Resource()
+    conductor.app.add_route('/', resource)
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws:
+            with pytest.raises(falcon.WebSocketDisconnected):
+                await ws.receive_text()
+
+            assert ws.close_code == 4002
+
+    assert len(resource.errors) == 2
+
+
+@pytest.mark.asyncio
+async def test_extensions_left_to_server(conductor):
+    class Resource:
+        async def on_websocket(self, req, ws):
+            await ws.accept(headers={'X-Falcon': 'peregrine'})
+
+    conductor.app.add_route('/', Resource())
+
+    # NOTE(kgriffs): Extensions such as permessage-deflate are negotiated by
+    #   the ASGI server, since it is also the one (de)compressing frames.
+    headers = {'Sec-WebSocket-Extensions': 'permessage-deflate; client_max_window_bits'}
+
+    async with conductor as c:
+        async with c.simulate_ws(headers=headers) as ws:
+            pass
+
+    assert ws.headers == [(b'x-falcon', b'peregrine')]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('codec', ['zlib', 'zstd'])
+@pytest.mark.parametrize('dictionary', [None, b'{"ticker": "", "price": }'])
+async def test_compressed_media(codec, dictionary, conductor):
+    if codec == 'zstd' and zstandard is None:
+        pytest.skip('zstandard is required for this test')
+
+    handler = media.CompressedHandlerWS(codec=codec, dictionary=dictionary)
+
+    class Resource:
+        async def on_websocket(self, req, ws):
+            await ws.accept()
+
+            doc = await ws.receive_media()
+            await ws.send_media(doc, falcon.WebSocketPayloadType.BINARY)
+
+    conductor.app.add_route('/', Resource())
+    conductor.app.ws_options.media_handlers[falcon.WebSocketPayloadType.BINARY] = handler
+
+    doc = {'ticker': 'FLCN', 'price': 42.0}
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws:
+            await ws.send_json(doc)
+
+            payload = await ws.receive_data()
+            assert handler.deserialize(payload) == doc
+
+
+@pytest.mark.parametrize('codec', ['zlib', 'zstd'])
+def test_compressed_handler(codec):
+    if codec == 'zstd' and zstandard is None:
+        pytest.skip('zstandard is required for this test')
+
+    dictionary = b'"answer": "runes": "falcon"' * 4
+    doc = {'answer': 42, 'runes': 'falcon' * 8}
+
+    handler = media.CompressedHandlerWS(codec=codec)
+    with_dict = media.CompressedHandlerWS(codec=codec, dictionary=dictionary, level=9)
+
+    assert handler.deserialize(handler.serialize(doc)) == doc
+    assert with_dict.deserialize(with_dict.serialize(doc)) == doc
+    assert len(with_dict.serialize(doc)) < len(handler.serialize(doc))
+
+    text_handler = media.CompressedHandlerWS(
+        handler=media.JSONHandlerWS(dumps=lambda obj: 'mock', loads=lambda s: s))
+    assert text_handler.deserialize(text_handler.serialize(doc)) == 'mock'
+
+    limited = media.CompressedHandlerWS(codec=codec, max_size=16)
+    with pytest.raises(ValueError):
+        limited.deserialize(handler.serialize(doc))
+    assert limited.deserialize(handler.serialize([1, 2, 3])) == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        handler.deserialize(b'\x00' + handler.serialize(doc))
+    with pytest.raises(ValueError):
+        handler.deserialize(handler.serialize(doc)[:-3])
+
+
+@pytest.mark.skipif(zstandard is None, reason='zstandard is required for this test')
+@pytest.mark.parametrize('max_size', [0, 4096])
+def test_compressed_handler_zstd_streamed_frame(max_size):
+    handler = media.CompressedHandlerWS(codec='zstd', max_size=max_size)
+    doc = {'runes': 'falcon' * 100}
+
+    # NOTE(kgriffs): Frames produced by streaming compressors do not record
+    #   the content size in the frame header.
+    cobj = zstandard.ZstdCompressor().compressobj()
+    payload = cobj.compress(json.dumps(doc).encode()) + cobj.flush()
+    assert zstandard.frame_content_size(payload) == -1
+
+    assert handler.deserialize(payload) == doc
+
+    with pytest.raises(ValueError):
+        handler.deserialize(payload[:-3])
+
+    if max_size:
+        cobj = zstandard.ZstdCompressor().compressobj()
+        payload = cobj.compress(b'[' + b' ' * 8192 + b']') + cobj.flush()
+        with pytest.raises(ValueError):
+            handler.deserialize(payload)
+
+
+def test_compressed_handler_bad_codec():
+    with pytest.raises(ValueError):
+        media.CompressedHandlerWS(codec='lzma')
+
+
+class BroadcastResource:
+    def __init__(self, group):
+        self.group = group
+        self.joined = asyncio.Semaphore(0)
+
+    async def on_websocket(self, req, ws):
+        await ws.accept()
+        self.group.add(ws)
+        self.joined.release()
+
+        try:
+            while True:
+                await ws.receive_text()
+        except falcon.WebSocketDisconnected:
+            await self.group.remove(ws)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_group(conductor):
+    group = falcon.asgi.BroadcastGroup()
+    resource = BroadcastResource(group)
+    conductor.app.add_route('/', resource)
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws1, c.simulate_ws() as ws2, c.simulate_ws() as ws3:
+            for _ in range(3):
+                await resource.joined.acquire()
+
+            assert len(group) == 3
+
+            assert group.broadcast({'seq': 1}) == 3
+            assert group.broadcast_text('hello') == 3
+            assert group.broadcast_data(b'\x00\x01') == 3
+
+            for ws in (ws1, ws2, ws3):
+                assert (await ws.receive_json()) == {'seq': 1}
+                assert (await ws.receive_text()) == 'hello'
+                assert (await ws.receive_data()) == b'\x00\x01'
+
+            await ws2.close()
+            while len(group) > 2:
+                await asyncio.sleep(0)
+
+            assert group.broadcast({'seq': 2}) == 2
+            for ws in (ws1, ws3):
+                assert (await ws.receive_json()) == {'seq': 2}
+
+            while group.stats()['sent'] < 11:
+                await asyncio.sleep(0)
+
+            stats = group.stats()
+            assert stats == {
+                'members': 2,
+                'queued': 0,
+                'max_queue_depth': 0,
+                'sent': 11,
+                'dropped': 0,
+                'disconnected': 0,
+            }
+
+            await group.close()
+            assert len(group) == 0
+            assert group.broadcast_text('nobody') == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('policy,expected', [
+    ('drop', [0, 1]),
+    ('drop_oldest', [2, 3]),
+])
+async def test_broadcast_group_drop(policy, expected, conductor):
+    group = falcon.asgi.BroadcastGroup(max_queue=2, slow_consumer=policy)
+    resource = BroadcastResource(group)
+    conductor.app.add_route('/', resource)
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws:
+            await resource.joined.acquire()
+
+            # NOTE: Broadcasting without yielding to the event loop prevents
+            #   the member's sender task from draining its queue.
+            for i in range(4):
+                group.broadcast({'seq': i})
+
+            stats = group.stats()
+            assert stats['queued'] == 2
+            assert stats['max_queue_depth'] == 2
+            assert stats['dropped'] == 2
+
+            for i in expected:
+                assert (await ws.receive_json()) == {'seq': i}
+
+            assert group.broadcast({'seq': 4}) == 1
+            assert (await ws.receive_json()) == {'seq': 4}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_group_disconnect_slow_consumer(conductor):
+    group = falcon.asgi.BroadcastGroup(max_queue=2, slow_consumer='disconnect')
+    resource = BroadcastResource(group)
+    conductor.app.add_route('/', resource)
+
+    async with conductor as c:
+        async with c.simulate_ws() as ws:
+            await resource.joined.acquire()
+
+            assert group.broadcast({'seq': 0}) == 1
+            assert group.broadcast({'seq': 1}) == 1
+            assert group.broadcast({'seq': 2}) == 0
+            assert group.broadcast({'seq': 3}) == 0
+
+            with pytest.raises(falcon.WebSocketDisconnected):
+                await ws.receive_json()
+
+            assert ws.close_code == falcon.asgi_spec.WSCloseCode.POLICY_VIOLATION
+
+    assert len(group) == 0
+
+    stats = group.stats()
+    assert stats['dropped'] == 2
+    assert stats['disconnected'] == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_group_errors(conductor):
+    with pytest.raises(ValueError):
+        falcon.asgi.BroadcastGroup(max_queue=0)
+    with pytest.raises(ValueError):
+        falcon.asgi.BroadcastGroup(slow_consumer='block')
+
+    group = falcon.asgi.BroadcastGroup()
+
+    with pytest.raises(TypeError):
+        group.broadcast_text(b'hello')
+    with pytest.raises(TypeError):
+        group.broadcast_data('hello')
+
+    class Resource:
+        async def on_websocket(self, req, ws):
+            with pytest.raises(falcon.OperationNotAllowed):
+                group.add(ws)
+
+            await ws.accept()
+
+    conductor.app.add_route('/', Resource())
+
+    async with conductor as c:
+        async with c.simulate_ws():
+            pass
+
+    assert len(group) == 0
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize('subprotocols', [
     ['SIS508'],
@@ -0,0 +1,373 @@
+import gzip
+import os
+import time
+
+import pytest
+
+import falcon
+from falcon import testing
+from falcon.middleware import MemoryCacheBackend, SharedMemoryCacheBackend
+
+from _util import create_app, disable_asgi_non_coroutine_wrapping  # NOQA
+
+
+class ThingsResource:
+    def __init__(self, cache_control='max-age=60', headers=None, status=falcon.HTTP_200):
+        self.called = 0
+        self._cache_control = cache_control
+        self._headers = headers or {}
+        self._status = status
+
+    def on_get(self, req, resp):
+        self.called += 1
+
+        resp.status = self._status
+        resp.set_headers(self._headers)
+        if self._cache_control:
+            resp.set_header('Cache-Control', self._cache_control)
+
+        resp.media = {
+            'called': self.called,
+            'language': req.get_header('Accept-Language'),
+            'query': req.query_string,
+        }
+
+        if req.get_param_as_bool('cookie'):
+            resp.set_cookie('session', 'abc123')
+
+    on_head = on_get
+
+    def on_post(self, req, resp):
+        self.on_get(req, resp)
+
+
+class ThingsResourceAsync(ThingsResource):
+    async def on_get(self, req, resp):
+        super().on_get(req, resp)
+
+    on_head = on_get
+
+    async def on_post(self, req, resp):
+        super().on_get(req, resp)
+
+
+def create_client(asgi, resource=None, middleware=None, **kwargs):
+    caching = falcon.CachingMiddleware(**kwargs)
+
+    # NOTE(kgriffs): Disable wrapping to test that built-in middleware does
+    #   not require it (since this will be the case for non-test apps).
+    with disable_asgi_non_coroutine_wrapping():
+        app = create_app(asgi, middleware=[caching] + (middleware or []))
+
+    if resource is None:
+        resource = ThingsResourceAsync() if asgi else ThingsResource()
+
+    app.add_route('/things', resource)
+
+    client = testing.TestClient(app)
+    client.caching = caching
+    client.resource = resource
+    return client
+
+
+def things_resource(asgi, **kwargs):
+    return ThingsResourceAsync(**kwargs) if asgi else ThingsResource(**kwargs)
+
+
+class TestCachingMiddleware:
+
+    def test_hit(self, asgi):
+        client = create_client(asgi)
+
+        result1 = client.simulate_get('/things', query_string='x=1')
+        assert result1.json['called'] == 1
+        assert 'Age' not in result1.headers
+
+        result2 = client.simulate_get('/things', query_string='x=1')
+        assert result2.json == result1.json
+        assert result2.headers['Content-Type'] == result1.headers['Content-Type']
+        assert result2.headers['Content-Length'] == result1.headers['Content-Length']
+        assert result2.headers['Cache-Control'] == 'max-age=60'
+        assert result2.headers['Age'] == '0'
+
+        result3 = client.simulate_head('/things', query_string='x=1')
+        assert result3.status_code == 200
+        assert result3.headers['Content-Length'] == result1.headers['Content-Length']
+        assert result3.content == b''
+
+        assert client.resource.called == 1
+        assert client.caching.hits == 2
+        assert client.caching.misses == 1
+        assert client.caching.hit_ratio == pytest.approx(2 / 3)
+
+    def test_key(self, asgi):
+        client = create_client(asgi)
+
+        assert client.simulate_get('/things').json['called'] == 1
+        assert client.simulate_get('/things', query_string='x=1').json['called'] == 2
+        assert client.simulate_get('/things', query_string='x=2').json['called'] == 3
+        assert client.simulate_get('/things', host='example.org').json['called'] == 4
+        assert client.simulate_get('/things', query_string='x=2').json['called'] == 3
+
+    def test_hit_ratio_no_requests(self):
+        assert falcon.CachingMiddleware().hit_ratio == 0.0
+
+    def test_vary(self, asgi):
+        client = create_client(asgi, things_resource(asgi, headers={
+            'Vary': 'Accept-Language',
+        }))
+
+        def get(language=None):
+            headers = {'Accept-Language': language} if language else {}
+            return client.simulate_get('/things', headers=headers).json
+
+        assert get('en') == {'called': 1, 'language': 'en', 'query': ''}
+        assert get('de') == {'called': 2, 'language': 'de', 'query': ''}
+        assert get() == {'called': 3, 'language': None, 'query': ''}
+        assert get('en') == {'called': 1, 'language': 'en', 'query': ''}
+        assert get('de') == {'called': 2, 'language': 'de', 'query': ''}
+        assert get() == {'called': 3, 'language': None, 'query': ''}
+
+    @pytest.mark.parametrize('cache_control,headers,status,params', [
+        (None, None, falcon.HTTP_200, None),
+        ('no-store', None, falcon.HTTP_200, None),
+        ('no-cache, max-age=60', None, falcon.HTTP_200, None),
+        ('private, max-age=60', None, falcon.HTTP_200, None),
+        ('max-age=0', None, falcon.HTTP_200, None),
+        ('max-age=invalid', None, falcon.HTTP_200, None),
+        ('max-age=60', {'Vary': '*'}, falcon.HTTP_200, None),
+        ('max-age=60', None, falcon.HTTP_201, None),
+        ('max-age=60', None, falcon.HTTP_500, None),
+        ('max-age=60', None, falcon.HTTP_200, {'cookie': True}),
+    ])
+    def test_not_cached(self, asgi, cache_control, headers, status, params):
+        resource = things_resource(
+            asgi, cache_control=cache_control, headers=headers, status=status)
+        client = create_client(asgi, resource)
+
+        for expected in (1, 2):
+            result = client.simulate_get('/things', params=params)
+            assert result.json['called'] == expected
+
+    @pytest.mark.parametrize('headers', [
+        {'Authorization': 'Bearer token'},
+        {'Cache-Control': 'no-store'},
+    ])
+    def test_request_not_cached(self, asgi, headers):
+        client = create_client(asgi)
+
+        assert client.simulate_get('/things', headers=headers).json['called'] == 1
+        assert client.simulate_get('/things', headers=headers).json['called'] == 2
+        assert client.simulate_get('/things').json['called'] == 3
+        assert client.simulate_get('/things').json['called'] == 3
+
+    def test_request_no_cache(self, asgi):
+        client = create_client(asgi)
+
+        assert client.simulate_get('/things').json['called'] == 1
+
+        result = client.simulate_get('/things', headers={'Cache-Control': 'no-cache'})
+        assert result.json['called'] == 2
+        assert client.simulate_get('/things').json['called'] == 2
+
+        assert client.caching.hits == 1
+        assert client.caching.misses == 1
+
+    def test_post_not_cached(self, asgi):
+        client = create_client(asgi)
+
+        assert client.simulate_post('/things').json['called'] == 1
+        assert client.simulate_post('/things').json['called'] == 2
+        assert client.simulate_get('/things').json['called'] == 3
+        assert client.simulate_post('/things').json['called'] == 4
+
+    def test_head_not_stored(self, asgi):
+        client = create_client(asgi)
+
+        client.simulate_head('/things')
+        assert client.simulate_get('/things').json['called'] == 2
+
+    @pytest.mark.parametrize('cache_control,default_ttl,expected', [
+        ('max-age=1', None, 1),
+        ('public, s-maxage=1, max-age=60', None, 1),
+        ('public', 1, 1),
+        (None, 1, 1),
+        (None, None, 2),
+    ])
+    def test_ttl(self, asgi, monkeypatch, cache_control, default_ttl, expected):
+        client = create_client(
+            asgi, things_resource(asgi, cache_control=cache_control), default_ttl=default_ttl)
+
+        assert client.simulate_get('/things').json['called'] == 1
+        assert client.simulate_get('/things').json['called'] == expected
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, 'monotonic', lambda: now + 1)
+        assert client.simulate_get('/things').json['called'] == expected + 1
+
+    def test_max_body_size(self, asgi):
+        client = create_client(asgi, max_body_size=10)
+
+        assert client.simulate_get('/things').json['called'] == 1
+        assert client.simulate_get('/things').json['called'] == 2
+
+    def test_compression(self, asgi):
+        client = create_client(asgi, middleware=[
+            falcon.CompressionMiddleware(min_size=1, encodings=['gzip']),
+        ])
+
+        for __ in range(2):
+            result = client.simulate_get('/things', headers={'Accept-Encoding': 'gzip'})
+            assert result.headers['Content-Encoding'] == 'gzip'
+            assert result.headers['Vary'] == 'Accept-Encoding'
+            assert b'"called": 1' in gzip.decompress(result.content)
+
+            result = client.simulate_get('/things')
+            assert 'Content-Encoding' not in result.headers
+            assert result.json['called'] == 2
+
+        assert client.caching.hits == 2
+        assert client.caching.misses == 2
+
+    def test_extra_headers(self, asgi):
+        class LinkResource:
+            def on_get(self, req, resp):
+                resp.cache_control = ['max-age=60']
+                resp.append_link('/things/1', 'item')
+                resp.append_header('X-Things', '1')
+                resp.text = 'Things'
+
+        class LinkResourceAsync:
+            async def on_get(self, req, resp):
+                LinkResource.on_get(self, req, resp)
+
+        client = create_client(asgi, LinkResourceAsync() if asgi else LinkResource())
+
+        result1 = client.simulate_get('/things')
+        result2 = client.simulate_get('/things')
+
+        assert result2.headers['Age'] == '0'
+        assert result2.headers['Link'] == result1.headers['Link']
+        assert result2.headers['X-Things'] == '1'
+        assert result2.text == 'Things'
+        assert client.caching.hits == 1
+
+    def test_custom_backend(self, asgi):
+        class Backend:
+            def __init__(self):
+                self.entries = {}
+
+            def get(self, key):
+                return self.entries.get(key)
+
+            def set(self, key, value, ttl):
+                self.entries[key] = value
+
+        backend = Backend()
+        client = create_client(asgi, backend=backend)
+
+        assert client.simulate_get('/things').json['called'] == 1
+        assert client.simulate_get('/things').json['called'] == 1
+        assert len(backend.entries) == 1
+
+
+class TestMemoryCacheBackend:
+
+    def test_get_set(self):
+        backend = MemoryCacheBackend()
+
+        assert backend.get('a') is None
+        backend.set('a', b'value', 60)
+        assert backend.get('a') == b'value'
+        backend.set('a', b'other', 60)
+        assert backend.get('a') == b'other'
+
+        backend.delete('a')
+        assert backend.get('a') is None
+
+        backend.set('b', b'value', 60)
+        backend.clear()
+        assert backend.get('b') is None
+
+    def test_expired(self, monkeypatch):
+        backend = MemoryCacheBackend()
+        backend.set('a', b'value', 1)
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, 'monotonic', lambda: now + 1)
+        assert backend.get('a') is None
+        assert backend._size == 0
+
+    def test_max_size(self):
+        backend = MemoryCacheBackend(max_size=10)
+
+        backend.set('a', b'1234', 60)
+        backend.set('b', b'1234', 60)
+        assert backend.get('a') == b'1234'
+
+        backend.set('c', b'1234', 60)
+        assert backend.get('a') == b'1234'
+        assert backend.get('b') is None
+        assert backend.get('c') == b'1234'
+
+        backend.set('d', b'12345678901', 60)
+        assert backend.get('d') is None
+        assert backend._size == 8
+
+
+class TestSharedMemoryCacheBackend:
+
+    def test_get_set(self, tmpdir):
+        directory = str(tmpdir.join('cache'))
+        backend = SharedMemoryCacheBackend(directory)
+        other = SharedMemoryCacheBackend(directory)
+
+        assert backend.get('a') is None
+        backend.set('a', b'value', 60)
+        assert other.get('a') == b'value'
+        other.set('a', b'other', 60)
+        assert backend.get('a') == b'other'
+        assert len(os.listdir(directory)) == 1
+
+        backend.delete('a')
+        assert other.get('a') is None
+
+        backend.set('b', b'value', 60)
+        other.clear()
+        assert backend.get('b') is None
+        assert os.listdir(directory) == []
+
+    def test_expired(self, tmpdir, monkeypatch):
+        directory = str(tmpdir)
+        backend = SharedMemoryCacheBackend(directory)
+        backend.set('a', b'value', 1)
+
+        now = time.time()
+        monkeypatch.setattr(time, 'time', lambda: now + 1)
+        assert backend.get('a') is None
+        assert os.listdir(directory) == []
+
+    def test_prune(self, tmpdir, monkeypatch):
+        directory = str(tmpdir)
+        backend = SharedMemoryCacheBackend(directory, prune_interval=3)
+
+        backend.set('a', b'value', 1)
+        backend.set('b', b'value', 60)
+        assert len(os.listdir(directory)) == 2
+
+        now = time.time()
+        monkeypatch.setattr(time, 'time', lambda: now + 1)
+        backend.set('c', b'value', 60)
+        assert len(os.listdir(directory)) == 2
+        assert backend.get('b') == b'value'
+        assert backend.get('c') == b'value'
+
+    def test_middleware(self, asgi, tmpdir):
+        backend = SharedMemoryCacheBackend(str(tmpdir))
+        client1 = create_client(asgi, backend=backend)
+        client2 = create_client(asgi, backend=SharedMemoryCacheBackend(str(tmpdir)))
+
+        assert client1.simulate_get('/things').json['called'] == 1
+        assert client2.simulate_get('/things').json['called'] == 1
+        assert client2.caching.hits == 1
+        assert client2.resource.called == 0
@@ -0,0 +1,345 @@
+import gzip
+import io
+import zlib
+
+import pytest
+
+import falcon
+from falcon import testing
+
+from _util import create_app, disable_asgi_non_coroutine_wrapping  # NOQA
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+TEXT = 'Hello, World! ' * 200
+DATA = TEXT.encode()
+
+
+def decompress(encoding, data):
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    if encoding == 'br':
+        return brotli.decompress(data)
+    if encoding == 'zstd':
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+class TextResource:
+    def __init__(self, text=TEXT, content_type=falcon.MEDIA_TEXT, status=falcon.HTTP_200,
+                 headers=None):
+        self._text = text
+        self._content_type = content_type
+        self._status = status
+        self._headers = headers or {}
+
+    def on_get(self, req, resp):
+        resp.status = self._status
+        resp.text = self._text
+        resp.content_type = self._content_type
+        resp.set_headers(self._headers)
+
+    on_head = on_get
+
+
+class TextResourceAsync(TextResource):
+    async def on_get(self, req, resp):
+        super().on_get(req, resp)
+
+    on_head = on_get
+
+
+class MediaResource:
+    def on_get(self, req, resp):
+        resp.media = {'messages': [TEXT] * 10}
+
+
+class MediaResourceAsync:
+    async def on_get(self, req, resp):
+        resp.media = {'messages': [TEXT] * 10}
+
+
+class StreamResource:
+    def __init__(self):
+        self.stream = None
+
+    def on_get(self, req, resp):
+        resp.content_type = falcon.MEDIA_TEXT
+
+        if req.get_param_as_bool('filelike'):
+            self.stream = io.BytesIO(DATA)
+            resp.stream = self.stream
+        else:
+            resp.stream = (DATA[i:i + 100] for i in range(0, len(DATA), 100))
+
+        resp.content_length = len(DATA)
+
+
+class StreamResourceAsync:
+    def __init__(self):
+        self.stream = None
+
+    async def on_get(self, req, resp):
+        resp.content_type = falcon.MEDIA_TEXT
+
+        if req.get_param_as_bool('filelike'):
+            self.stream = _AsyncBytesIO(DATA)
+            resp.stream = self.stream
+        else:
+            async def chunks():
+                for i in range(0, len(DATA), 100):
+                    yield DATA[i:i + 100]
+
+            resp.stream = chunks()
+
+
+class _AsyncBytesIO:
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    @property
+    def closed(self):
+        return self._stream.closed
+
+    async def read(self, size=-1):
+        return self._stream.read(size)
+
+    async def close(self):
+        self._stream.close()
+
+
+def create_client(asgi, resource, **kwargs):
+    # NOTE(kgriffs): Disable wrapping to test that built-in middleware does
+    #   not require it (since this will be the case for non-test apps).
+    with disable_asgi_non_coroutine_wrapping():
+        app = create_app(asgi, middleware=[falcon.CompressionMiddleware(**kwargs)])
+
+    app.add_route('/', resource)
+    return testing.TestClient(app)
+
+
+def text_resource(asgi, **kwargs):
+    return TextResourceAsync(**kwargs) if asgi else TextResource(**kwargs)
+
+
+class TestCompressionMiddleware:
+
+    def test_gzip(self, asgi):
+        client = create_client(asgi, text_resource(asgi), encodings=['gzip'])
+        result = client.simulate_get(headers={'Accept-Encoding': 'gzip, deflate'})
+
+        assert result.status_code == 200
+        assert result.headers['Content-Encoding'] == 'gzip'
+        assert result.headers['Vary'] == 'Accept-Encoding'
+        assert result.headers['Content-Type'] == falcon.MEDIA_TEXT
+        assert int(result.headers['Content-Length']) == len(result.content)
+        assert len(result.content) < len(DATA)
+        assert gzip.decompress(result.content) == DATA
+
+    def test_no_accept_encoding(self, asgi):
+        client = create_client(asgi, text_resource(asgi))
+
+        for headers in ({}, {'Accept-Encoding': 'identity'}, {'Accept-Encoding': 'gzip;q=0'}):
+            result = client.simulate_get(headers=headers)
+
+            assert result.text == TEXT
+            assert 'Content-Encoding' not in result.headers
+            assert result.headers['Vary'] == 'Accept-Encoding'
+
+    @pytest.mark.parametrize('accept_encoding,expected', [
+        ('gzip', 'gzip'),
+        ('GZIP', 'gzip'),
+        ('*', 'br'),
+        ('gzip, deflate, br', 'br'),
+        ('gzip, deflate, br, zstd', 'br'),
+        ('gzip, zstd', 'zstd'),
+        ('br;q=0.5, gzip', 'gzip'),
+        ('br;q=0.5, zstd; q=0.8, gzip;q=0.2', 'zstd'),
+        ('*;q=0.1, gzip;q=0.5', 'gzip'),
+        ('*, br;q=0', 'zstd'),
+        ('deflate, compress', None),
+        ('gzip;q=invalid', None),
+    ])
+    def test_negotiation(self, asgi, accept_encoding, expected):
+        if brotli is None or zstandard is None:
+            pytest.skip('brotli and zstandard are required for this test')
+
+        client = create_client(asgi, text_resource(asgi))
+        result = client.simulate_get(headers={'Accept-Encoding': accept_encoding})
+
+        assert result.headers.get('Content-Encoding') == expected
+        assert decompress(expected, result.content) == DATA
+
+    def test_encodings_and_levels(self, asgi):
+        client = create_client(
+            asgi, text_resource(asgi),
+            encodings=['gzip', 'br'], levels={'gzip': 1, 'br': 11},
+        )
+
+        result = client.simulate_get(headers={'Accept-Encoding': 'br, gzip, zstd'})
+        assert result.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(result.content) == DATA
+
+        result = client.simulate_get(headers={'Accept-Encoding': 'zstd'})
+        assert 'Content-Encoding' not in result.headers
+
+    def test_invalid_encodings(self):
+        with pytest.raises(ValueError):
+            falcon.CompressionMiddleware(encodings=['deflate'])
+
+        with pytest.raises(ValueError):
+            falcon.CompressionMiddleware(encodings=[])
+
+    def test_media(self, asgi):
+        resource = MediaResourceAsync() if asgi else MediaResource()
+        client = create_client(asgi, resource, encodings=['gzip'])
+        result = client.simulate_get(headers={'Accept-Encoding': 'gzip'})
+
+        assert result.headers['Content-Encoding'] == 'gzip'
+        assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+        assert gzip.decompress(result.content) == client.simulate_get().content
+
+    @pytest.mark.parametrize('resource_kwargs,encoding', [
+        ({'text': 'Too small'}, None),
+        ({'content_type': falcon.MEDIA_PNG}, None),
+        ({'content_type': 'application/octet-stream'}, None),
+        ({'headers': {'Content-Encoding': 'identity'}}, 'identity'),
+        ({'headers': {'Cache-Control': 'public, no-transform'}}, None),
+        ({'status': falcon.HTTP_206}, None),
+        ({'status': falcon.HTTP_204, 'text': None, 'content_type': None}, None),
+    ])
+    def test_not_compressed(self, asgi, resource_kwargs, encoding):
+        client = create_client(asgi, text_resource(asgi, **resource_kwargs))
+        result = client.simulate_get(headers={'Accept-Encoding': 'gzip'})
+
+        assert result.headers.get('Content-Encoding') == encoding
+        assert 'Vary' not in result.headers
+
+    def test_head(self, asgi):
+        client = create_client(asgi, text_resource(asgi, headers={'ETag': '"abc"'}))
+        headers = {'Accept-Encoding': 'gzip'}
+
+        expected = client.simulate_get(headers=headers)
+        result = client.simulate_head(headers=headers)
+
+        assert result.content == b''
+        assert result.headers['Content-Encoding'] == 'gzip'
+        assert 'Content-Length' not in result.headers
+        for name in ('Content-Encoding', 'Vary', 'ETag'):
+            assert result.headers[name] == expected.headers[name]
+
+    def test_head_not_compressed(self, asgi):
+        client = create_client(asgi, text_resource(asgi))
+        result = client.simulate_head(headers={'Accept-Encoding': 'identity'})
+
+        assert 'Content-Encoding' not in result.headers
+        assert result.headers['Vary'] == 'Accept-Encoding'
+        assert result.headers['Content-Length'] == str(len(DATA))
+
+    @pytest.mark.parametrize('content_type', [
+        'text/html; charset=utf-8',
+        'application/javascript',
+        'application/problem+json',
+        'application/atom+xml',
+        'image/svg+xml',
+    ])
+    def test_compressible_media_types(self, asgi, content_type):
+        client = create_client(asgi, text_resource(asgi, content_type=content_type))
+        result = client.simulate_get(headers={'Accept-Encoding': 'gzip'})
+
+        assert result.headers['Content-Encoding'] == 'gzip'
+
+    def test_custom_media_types(self, asgi):
+        for content_type, compressed in (
+            ('application/octet-stream', True),
+            ('image/x-portable-pixmap', True),
+            ('text/plain', False),
+        ):
+            client = create_client(
+                asgi, text_resource(asgi, content_type=content_type),
+                media_types=['application/octet-stream', 'image/*'],
+            )
+            result = client.simulate_get(headers={'Accept-Encoding': 'gzip'})
+
+            assert ('Content-Encoding' in result.headers) is compressed
+
+    def test_min_size(self, asgi):
+        client = create_client(asgi, text_resource(asgi, text='Small'), min_size=1)
+        result = client.simulate_get(headers={'Accept-Encoding': 'gzip'})
+
+        assert result.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(result.content) == b'Small'
+
+    def test_vary_and_etag(self, asgi):
+        client = create_client(asgi, text_resource(asgi, headers={
+            'Vary': 'Accept-Language',
+            'ETag': '"abc"',
+        }))
+
+        result = client.simulate_get(headers={'Accept-Encoding': 'gzip'})
+        assert result.headers['Vary'] == 'Accept-Language, Accept-Encoding'
+        assert result.headers['ETag'] == 'W/"abc"'
+
+        result = client.simulate_get()
+        assert result.headers['Vary'] == 'Accept-Language, Accept-Encoding'
+        assert result.headers['ETag'] == '"abc"'
+
+    @pytest.mark.parametrize('filelike', [True, False])
+    def test_stream(self, asgi, filelike):
+        resource = StreamResourceAsync() if asgi else StreamResource()
+        client = create_client(asgi, resource, encodings=['gzip'])
+
+        result = client.simulate_get(
+            params={'filelike': filelike}, headers={'Accept-Encoding': 'gzip'})
+
+        assert result.headers['Content-Encoding'] == 'gzip'
+        assert 'Content-Length' not in result.headers or (
+            int(result.headers['Content-Length']) == len(result.content)
+        )
+        assert gzip.decompress(result.content) == DATA
+
+        if filelike:
+            assert resource.stream.closed
+
+        result = client.simulate_get(params={'filelike': filelike})
+        assert 'Content-Encoding' not in result.headers
+        assert result.content == DATA
+
+    @pytest.mark.parametrize('encoding', ['br', 'zstd'])
+    def test_stream_other_encodings(self, asgi, encoding):
+        if brotli is None or zstandard is None:
+            pytest.skip('brotli and zstandard are required for this test')
+
+        resource = StreamResourceAsync() if asgi else StreamResource()
+        client = create_client(asgi, resource)
+
+        result = client.simulate_get(headers={'Accept-Encoding': encoding})
+
+        assert result.headers['Content-Encoding'] == encoding
+        assert decompress(encoding, result.content) == DATA
+
+    @pytest.mark.parametrize('filelike', [True, False])
+    def test_executor_threshold(self, filelike):
+        client = create_client(True, MediaResourceAsync(), executor_threshold=1)
+        result = client.simulate_get(headers={'Accept-Encoding': 'gzip'})
+
+        assert result.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(result.content) == client.simulate_get().content
+
+        client = create_client(
+            True, StreamResourceAsync(), encodings=['gzip'], executor_threshold=1)
+        result = client.simulate_get(
+            params={'filelike': filelike}, headers={'Accept-Encoding': 'gzip'})
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert decompressor.decompress(result.content) == DATA
+        assert decompressor.eof
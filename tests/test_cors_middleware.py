@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 import falcon
@@ -199,3 +201,118 @@ class TestCustomCorsMiddleware:
         assert res.headers['Access-Control-Expose-Headers'] == exp
         h = dict(res.headers.lower_items()).keys()
         assert 'Access-Control-Allow-Credentials'.lower() not in h
+
+    @pytest.mark.parametrize('origin, allowed', (
+        ('https://example.com', True),
+        ('https://api.example.com', True),
+        ('https://a-b.example.com', True),
+        ('https://example.org', True),
+        ('https://api.example.com.evil.com', False),
+        ('https://evil.com/.example.com', False),
+        ('http://api.example.com', False),
+        ('https://example.net', False),
+    ))
+    def test_allow_origin_regex(self, make_cors_client, origin, allowed):
+        client = make_cors_client(falcon.CORSMiddleware(allow_origins=[
+            'https://example.com',
+            re.compile(r'https://[a-z0-9-]+\.example\.com'),
+            re.compile(r'https://example\.(org|io)'),
+        ]))
+        client.app.add_route('/', CORSHeaderResource())
+
+        for __ in range(2):
+            res = client.simulate_get(headers={'Origin': origin})
+            if allowed:
+                assert res.headers['Access-Control-Allow-Origin'] == origin
+            else:
+                assert 'Access-Control-Allow-Origin' not in res.headers
+
+    def test_origin_headers_memoized(self, make_cors_client):
+        cors = falcon.CORSMiddleware(allow_origins=['foo', 'bar'], allow_credentials=['foo'])
+        client = make_cors_client(cors)
+        client.app.add_route('/', CORSHeaderResource())
+
+        for origin in ('foo', 'bar', 'baz', 'foo', 'bar', 'baz'):
+            client.simulate_get(headers={'Origin': origin})
+
+        if hasattr(cors._get_origin_headers, 'cache_info'):
+            info = cors._get_origin_headers.cache_info()
+            assert (info.hits, info.misses) == (3, 3)
+
+    @pytest.mark.parametrize('allow_headers, expected_headers', (
+        (None, 'X-PINGOTHER, Content-Type'),
+        ('X-Foo', 'X-Foo'),
+        (['X-Foo', 'X-Bar'], 'X-Foo, X-Bar'),
+    ))
+    def test_preflight_allow_methods(self, asgi, allow_headers, expected_headers):
+        calls = []
+
+        class Middleware:
+            def process_response(self, req, resp, resource, req_succeeded):
+                calls.append((resource, req_succeeded))
+
+        cors = falcon.CORSMiddleware(
+            allow_origins='foo',
+            allow_methods=['GET', 'POST'],
+            allow_headers=allow_headers,
+        )
+
+        with disable_asgi_non_coroutine_wrapping():
+            app = create_app(asgi, middleware=[cors])
+        app.add_middleware(Middleware())
+        client = testing.TestClient(app)
+
+        # NOTE(kgriffs): The preflight request is answered by the middleware
+        #   without being routed, even if no matching route exists.
+        for path in ('/', '/no/such/route'):
+            res = client.simulate_options(path, headers=(
+                ('Origin', 'foo'),
+                ('Access-Control-Request-Method', 'POST'),
+                ('Access-Control-Request-Headers', 'X-PINGOTHER, Content-Type'),
+            ))
+            assert res.status_code == 200
+            assert res.headers['Access-Control-Allow-Origin'] == 'foo'
+            assert res.headers['Access-Control-Allow-Methods'] == 'GET, POST'
+            assert res.headers['Access-Control-Allow-Headers'] == expected_headers
+            assert res.headers['Access-Control-Max-Age'] == '86400'
+            assert 'Allow' not in res.headers
+            assert res.content == b''
+
+        assert calls == [(None, True)] * 2
+
+        # NOTE(kgriffs): Requests that are not preflighted, or that come from
+        #   other origins, are routed as usual.
+        app.add_route('/', CORSHeaderResource())
+
+        res = client.simulate_options(headers={'Origin': 'foo'})
+        assert res.headers['Allow'] == 'DELETE, GET'
+        assert 'Access-Control-Allow-Methods' not in res.headers
+
+        res = client.simulate_options(headers=(
+            ('Origin', 'bar'),
+            ('Access-Control-Request-Method', 'POST'),
+        ))
+        assert res.headers['Allow'] == 'DELETE, GET'
+        assert 'Access-Control-Allow-Origin' not in res.headers
+        assert 'Access-Control-Allow-Methods' not in res.headers
+
+    def test_preflight_allow_headers(self, make_cors_client):
+        client = make_cors_client(falcon.CORSMiddleware(allow_headers=['X-Foo', 'X-Bar']))
+        client.app.add_route('/', CORSHeaderResource())
+
+        res = client.simulate_options(headers=(
+            ('Origin', 'localhost'),
+            ('Access-Control-Request-Method', 'GET'),
+            ('Access-Control-Request-Headers', 'X-PINGOTHER'),
+        ))
+        assert res.headers['Access-Control-Allow-Methods'] == 'DELETE, GET'
+        assert res.headers['Access-Control-Allow-Headers'] == 'X-Foo, X-Bar'
+
+    def test_request_hooks_only_for_preflight(self):
+        cors = falcon.CORSMiddleware()
+        assert not hasattr(cors, 'process_request')
+        assert not hasattr(cors, 'process_request_async')
+
+        cors = falcon.CORSMiddleware(allow_methods='GET')
+        assert cors.process_request is not None
+        assert cors.process_request_async is not None
@@ -0,0 +1,235 @@
+import hashlib
+
+import pytest
+
+import falcon
+from falcon import testing
+
+from _util import create_app, disable_asgi_non_coroutine_wrapping  # NOQA
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+TEXT = 'Hello, World!'
+
+
+def expected_etag(data, weak=False):
+    if xxhash is None:
+        digest = hashlib.sha1(data).hexdigest()
+    else:
+        digest = xxhash.xxh64(data).hexdigest()
+
+    return ('W/"' if weak else '"') + digest + '"'
+
+
+class ThingResource:
+    def __init__(self, status=falcon.HTTP_200, etag=None):
+        self.called = 0
+        self._etag = etag
+        self._status = status
+
+    def on_get(self, req, resp, thing_id):
+        self.called += 1
+
+        resp.status = self._status
+        resp.content_length = len(TEXT)
+        resp.text = TEXT
+        if self._etag:
+            resp.etag = self._etag
+
+    on_head = on_get
+
+    def on_post(self, req, resp, thing_id):
+        self.on_get(req, resp, thing_id)
+
+
+class ThingResourceAsync(ThingResource):
+    async def on_get(self, req, resp, thing_id):
+        super().on_get(req, resp, thing_id)
+
+    on_head = on_get
+
+    async def on_post(self, req, resp, thing_id):
+        super().on_get(req, resp, thing_id)
+
+
+class MediaResource:
+    def on_get(self, req, resp, thing_id):
+        resp.media = {'thing_id': thing_id}
+
+
+class MediaResourceAsync:
+    async def on_get(self, req, resp, thing_id):
+        resp.media = {'thing_id': thing_id}
+
+
+def create_client(asgi, resource=None, middleware=None, **kwargs):
+    if middleware is None:
+        middleware = [falcon.ETagMiddleware(**kwargs)]
+
+    # NOTE(kgriffs): Disable wrapping to test that built-in middleware does
+    #   not require it (since this will be the case for non-test apps).
+    with disable_asgi_non_coroutine_wrapping():
+        app = create_app(asgi, middleware=middleware)
+
+    if resource is None:
+        resource = ThingResourceAsync() if asgi else ThingResource()
+
+    app.add_route('/things/{thing_id}', resource)
+
+    client = testing.TestClient(app)
+    client.resource = resource
+    return client
+
+
+class TestETagMiddleware:
+
+    @pytest.mark.parametrize('weak', [True, False])
+    def test_etag(self, asgi, weak):
+        client = create_client(asgi, weak=weak)
+        etag = expected_etag(TEXT.encode(), weak)
+
+        result = client.simulate_get('/things/1')
+        assert result.status_code == 200
+        assert result.headers['ETag'] == etag
+        assert result.text == TEXT
+
+        result = client.simulate_head('/things/1')
+        assert result.headers['ETag'] == etag
+
+        for if_none_match in (etag, '*', '"other", ' + etag, 'W/' + etag.replace('W/', '')):
+            result = client.simulate_get('/things/1', headers={'If-None-Match': if_none_match})
+            assert result.status_code == 304
+            assert result.headers['ETag'] == etag
+            assert 'Content-Type' not in result.headers
+            assert 'Content-Length' not in result.headers
+            assert result.content == b''
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': '"other"'})
+        assert result.status_code == 200
+        assert result.text == TEXT
+
+    def test_media(self, asgi):
+        client = create_client(asgi, MediaResourceAsync() if asgi else MediaResource())
+
+        etag1 = client.simulate_get('/things/1').headers['ETag']
+        etag2 = client.simulate_get('/things/2').headers['ETag']
+        assert etag1 == expected_etag(b'{"thing_id": "1"}')
+        assert etag1 != etag2
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': etag1})
+        assert result.status_code == 304
+
+    def test_existing_etag(self, asgi):
+        resource = (ThingResourceAsync if asgi else ThingResource)(etag='"v1"')
+        client = create_client(asgi, resource)
+
+        assert client.simulate_get('/things/1').headers['ETag'] == '"v1"'
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': '"v1"'})
+        assert result.status_code == 304
+
+    @pytest.mark.parametrize('status,status_code', [
+        (falcon.HTTP_201, 201),
+        (falcon.HTTP_404, 404),
+    ])
+    def test_not_applicable_status(self, asgi, status, status_code):
+        resource = (ThingResourceAsync if asgi else ThingResource)(status=status)
+        client = create_client(asgi, resource)
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': '*'})
+        assert result.status_code == status_code
+        assert 'ETag' not in result.headers
+
+    def test_not_applicable_method(self, asgi):
+        client = create_client(asgi)
+
+        result = client.simulate_post('/things/1', headers={'If-None-Match': '*'})
+        assert result.status_code == 200
+        assert 'ETag' not in result.headers
+
+    @pytest.mark.parametrize('validator_etag', ['v1', falcon.ETag('v1')])
+    def test_validator(self, asgi, validator_etag):
+        calls = []
+
+        def validator(req, resource, params):
+            calls.append((resource, params))
+            return validator_etag
+
+        client = create_client(asgi, validator=validator)
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': '"v1"'})
+        assert result.status_code == 304
+        assert result.headers['ETag'] == '"v1"'
+        assert client.resource.called == 0
+        assert calls == [(client.resource, {'thing_id': '1'})]
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': '"v0"'})
+        assert result.status_code == 200
+        assert result.headers['ETag'] == '"v1"'
+        assert result.text == TEXT
+        assert client.resource.called == 1
+
+        client.simulate_post('/things/1', headers={'If-None-Match': '"v1"'})
+        assert len(calls) == 2
+
+    def test_validator_weak(self, asgi):
+        etag = falcon.ETag('v1')
+        etag.is_weak = True
+
+        client = create_client(asgi, validator=lambda req, resource, params: etag)
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': '"v1"'})
+        assert result.status_code == 304
+        assert result.headers['ETag'] == 'W/"v1"'
+
+    def test_validator_none(self, asgi):
+        client = create_client(asgi, validator=lambda req, resource, params: None)
+        etag = expected_etag(TEXT.encode())
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': etag})
+        assert result.status_code == 304
+        assert client.resource.called == 1
+
+    def test_validator_coroutine(self):
+        async def validator(req, resource, params):
+            return params['thing_id']
+
+        client = create_client(True, validator=validator)
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': '"1"'})
+        assert result.status_code == 304
+        assert client.resource.called == 0
+
+        result = client.simulate_get('/things/2', headers={'If-None-Match': '"1"'})
+        assert result.status_code == 200
+        assert result.headers['ETag'] == '"2"'
+
+    def test_cached_response(self, asgi):
+        class CachedResource:
+            def __init__(self):
+                self.called = 0
+
+            def on_get(self, req, resp, thing_id):
+                self.called += 1
+                resp.cache_control = ['max-age=60']
+                resp.text = TEXT
+
+        class CachedResourceAsync(CachedResource):
+            async def on_get(self, req, resp, thing_id):
+                super().on_get(req, resp, thing_id)
+
+        resource = CachedResourceAsync() if asgi else CachedResource()
+        client = create_client(asgi, resource, middleware=[
+            falcon.CachingMiddleware(),
+            falcon.ETagMiddleware(),
+        ])
+
+        etag = client.simulate_get('/things/1').headers['ETag']
+
+        result = client.simulate_get('/things/1', headers={'If-None-Match': etag})
+        assert result.status_code == 304
+        assert resource.called == 1
@@ -8,6 +8,7 @@ import pytest
 import falcon
 from falcon import media
 from falcon import testing
+from falcon.media import multipart
 from falcon.util import BufferedReader
 
 from _util import create_app  # NOQA: I100
@@ -297,6 +298,145 @@ def test_body_part_properties():
             assert part.secure_filename == part.filename
 
 
+@pytest.mark.parametrize('spool_threshold', [0, 16, 1024 * 1024])
+def test_spooled_body_parts(spool_threshold, tmpdir):
+    handler = media.MultipartFormHandler()
+    handler.parse_options.spool_threshold = spool_threshold
+    handler.parse_options.spool_directory = str(tmpdir)
+
+    example = EXAMPLES['boundary']
+    form = handler.deserialize(
+        io.BytesIO(example), 'multipart/form-data; boundary=boundary', len(example))
+
+    names = []
+    maps = []
+    for part in form:
+        names.append(part.name)
+        assert part.stream is part.file
+
+        if part.name == 'lorem1':
+            assert part.data == LOREM_IPSUM
+            maps.append(part.get_mmap())
+        elif part.name == 'lorem2':
+            assert part.stream.read(6) == b'Lorem '
+
+            # NOTE: Memory-mapping the part must not disturb a pending read.
+            assert part.get_mmap()[:5] == b'Lorem'
+            assert part.stream.read(5) == b'ipsum'
+        else:
+            assert part.text == ''
+            assert part.get_mmap() == b''
+
+    assert names == ['lorem1', 'empty', 'lorem2']
+
+    # NOTE: A memory map outlives the spooled file it was created from.
+    assert bytes(maps[0]) == LOREM_IPSUM
+
+
+@pytest.mark.parametrize('spool_threshold', [0, 1024 * 1024])
+def test_spooled_body_parts_closed(spool_threshold, tmpdir):
+    handler = media.MultipartFormHandler()
+    handler.parse_options.spool_threshold = spool_threshold
+    handler.parse_options.spool_directory = str(tmpdir)
+
+    example = EXAMPLES['boundary']
+
+    form = handler.deserialize(
+        io.BytesIO(example), 'multipart/form-data; boundary=boundary', len(example))
+    files = []
+    for part in form:
+        assert not part.file.closed
+        assert all(file.closed for file in files)
+        files.append(part.file)
+
+    assert len(files) == 3
+    assert all(file.closed for file in files)
+
+    # NOTE: Cutting the iteration short closes the current part as well.
+    form = handler.deserialize(
+        io.BytesIO(example), 'multipart/form-data; boundary=boundary', len(example))
+    parts = iter(form)
+    file = next(parts).file
+    parts.close()
+    assert file.closed
+
+    assert tmpdir.listdir() == []
+
+
+def test_spooled_body_parts_rollover(tmpdir):
+    handler = media.MultipartFormHandler()
+    handler.parse_options.spool_threshold = 32
+    handler.parse_options.spool_directory = str(tmpdir)
+
+    example = EXAMPLES['boundary']
+    form = handler.deserialize(
+        io.BytesIO(example), 'multipart/form-data; boundary=boundary', len(example))
+
+    for part in form:
+        if part.name == 'empty':
+            assert not part.file._rolled
+        else:
+            assert part.file._rolled
+
+
+def test_spooled_body_parts_zero_threshold(tmpdir):
+    handler = media.MultipartFormHandler()
+    handler.parse_options.spool_threshold = 0
+    handler.parse_options.spool_directory = str(tmpdir)
+
+    example = EXAMPLES['boundary']
+    form = handler.deserialize(
+        io.BytesIO(example), 'multipart/form-data; boundary=boundary', len(example))
+
+    for part in form:
+        assert part.file._rolled
+
+
+def test_mmap_without_spooling():
+    handler = media.MultipartFormHandler()
+    form = handler.deserialize(
+        io.BytesIO(EXAMPLE1),
+        'multipart/form-data; boundary=5b11af82ab65407ba8cdccf37d2a9c4f',
+        len(EXAMPLE1))
+
+    for part in form:
+        assert part.file is None
+        with pytest.raises(falcon.MediaMalformedError):
+            part.get_mmap()
+
+
+@pytest.fixture(params=['python', 'cython'])
+def parse_headers(request):
+    if request.param == 'cython':
+        cy_multipart = pytest.importorskip('falcon.cyutil.multipart')
+        return cy_multipart.parse_headers
+
+    return multipart._py_parse_headers
+
+
+@pytest.mark.parametrize('headers_block,expected', [
+    (b'', {}),
+    (b'Content-Type: text/plain', {b'content-type': b'text/plain'}),
+    (
+        b'Content-Disposition: form-data; name="a"\r\nContent-Type: application/json',
+        {b'content-disposition': b'form-data; name="a"', b'content-type': b'application/json'},
+    ),
+    (b'X-Coolness: fair\r\ncontent-TYPE: a: b\r\n\r\nfoo', {b'content-type': b'a: b'}),
+    (b'Content-Type: a\rb\r\nContent-Type: c', {b'content-type': b'c'}),
+    (b'Content-Type: \r\n', {b'content-type': b''}),
+    (b': \r\n:', {}),
+    (b'Content-Type:text/plain\r', {}),
+    (
+        b'Content-Transfer-Encoding: binary\r\nContent-Type: text/plain',
+        {b'content-transfer-encoding': b'binary', b'content-type': b'text/plain'},
+    ),
+    (b'Content-Transfer-Encoding: base64', None),
+    (b'Content-Type: text/plain\r\ncontent-transfer-encoding: 7bit', None),
+])
+def test_parse_headers(parse_headers, headers_block, expected):
+    assert parse_headers(headers_block) == expected
+
+
 def test_empty_filename():
     data = (
         b'--a0d738bcdb30449eb0d13f4b72c2897e\r\n'
@@ -328,6 +468,139 @@ async def test_async_unsupported():
             'Dummy', 'multipart/form-data; boundary=BOUNDARY', None)
 
 
+class AsyncChunks:
+    def __init__(self, data, chunk_size):
+        self._data = data
+        self._chunk_size = chunk_size
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for offset in range(0, len(self._data), self._chunk_size):
+            yield self._data[offset:offset + self._chunk_size]
+
+
+def _parse_async(data, boundary, chunk_size, parse_options=None, via_stream=False):
+    from falcon.asgi import multipart as asgi_multipart
+
+    async def parse():
+        form = asgi_multipart.MultipartForm(
+            AsyncChunks(data, chunk_size), boundary.encode(), len(data),
+            parse_options or multipart.MultipartParseOptions())
+
+        parts = []
+        async for part in form:
+            content = await (part.stream.read() if via_stream else part.get_data())
+            parts.append((part.name, content))
+        return parts
+
+    return falcon.async_to_sync(parse)
+
+
+@pytest.mark.parametrize('boundary', list(EXAMPLES))
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 1024, 1024 * 1024])
+@pytest.mark.parametrize('via_stream', [True, False])
+def test_parse_async_chunks(boundary, chunk_size, via_stream):
+    if not falcon.ASGI_SUPPORTED:
+        pytest.skip('ASGI requires CPython 3.6+')
+
+    example = EXAMPLES[boundary]
+    handler = media.MultipartFormHandler()
+    form = handler.deserialize(
+        io.BytesIO(example), 'multipart/form-data; boundary=' + boundary,
+        len(example))
+    expected = [(part.name, part.stream.read()) for part in form]
+
+    # NOTE(vytas): Do not feed the 2 MiB example byte by byte.
+    if len(example) > 1024 * 1024:
+        chunk_size = max(chunk_size, 1024)
+
+    parse_options = multipart.MultipartParseOptions()
+    parse_options.max_body_part_buffer_size = len(example)
+    result = _parse_async(example, boundary, chunk_size, parse_options, via_stream)
+    assert result == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1024])
+def test_parse_async_skip_parts(chunk_size):
+    if not falcon.ASGI_SUPPORTED:
+        pytest.skip('ASGI requires CPython 3.6+')
+
+    from falcon.asgi import multipart as asgi_multipart
+
+    async def parse():
+        form = asgi_multipart.MultipartForm(
+            AsyncChunks(EXAMPLE4, chunk_size), b'boundary', len(EXAMPLE4),
+            multipart.MultipartParseOptions())
+
+        names = []
+        async for part in form:
+            names.append(part.name)
+            if part.name == 'lorem1':
+                # NOTE(vytas): Only partially read the part; the rest should
+                #   be discarded when advancing to the next one.
+                assert await part.stream.read(16) == LOREM_IPSUM[:16]
+            elif part.name == 'lorem2':
+                assert await part.get_data() == LOREM_IPSUM
+        return names
+
+    assert falcon.async_to_sync(parse) == ['lorem1', 'empty', 'lorem2']
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1024])
+@pytest.mark.parametrize('data,description', [
+    (
+        EXAMPLE1.replace(
+            b'--5b11af82ab65407ba8cdccf37d2a9c4f\r\n'
+            b'Content-Disposition: form-data; name="document"',
+            b'--5b11af82ab65407ba8cdccf37d2a9c4f\r\n'
+            b'Content-Transfer-Encoding: base64\r\n'
+            b'Content-Disposition: form-data; name="document"',
+        ),
+        'the deprecated Content-Transfer-Encoding header field is unsupported',
+    ),
+    (
+        EXAMPLE1.replace(
+            b'world\r\n--5b11af82ab65407ba8cdccf37d2a9c4f\r\n',
+            b'world\r\n--5b11af82ab65407ba8cdccf37d2a9c4f??',
+        ),
+        'unexpected form structure',
+    ),
+    (
+        EXAMPLE1[:-40],
+        'unexpected form structure',
+    ),
+    (
+        EXAMPLE1[:EXAMPLE1.index(b'Content-Type: application/json') + 16],
+        'incomplete body part headers',
+    ),
+])
+def test_parse_async_errors(chunk_size, data, description):
+    if not falcon.ASGI_SUPPORTED:
+        pytest.skip('ASGI requires CPython 3.6+')
+
+    from falcon.asgi import multipart as asgi_multipart
+
+    async def parse():
+        form = asgi_multipart.MultipartForm(
+            AsyncChunks(data, chunk_size), b'5b11af82ab65407ba8cdccf37d2a9c4f',
+            len(data), multipart.MultipartParseOptions())
+
+        names = []
+        with pytest.raises(multipart.MultipartParseError) as excinfo:
+            async for part in form:
+                await part.get_data()
+                names.append(part.name)
+
+        assert excinfo.value.description == description
+        return names
+
+    # NOTE(vytas): Any preceding well-formed parts must still be yielded
+    #   before the error is raised.
+    assert falcon.async_to_sync(parse)[0] == 'hello'
+
+
 class MultipartAnalyzer:
     def on_post(self, req, resp):
         values = []
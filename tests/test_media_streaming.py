@@ -0,0 +1,214 @@
+import io
+
+import cbor2
+import pytest
+
+import falcon
+from falcon import media
+from falcon import testing
+
+from _util import create_app  # NOQA
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+
+RECORDS = [
+    {'sensor': 'a1', 'value': 1.5},
+    {'sensor': 'b2', 'value': None, 'tags': ['x', 'y']},
+    'falcon',
+    b'\x00\x01\x02',
+    42,
+] * 50
+
+
+class AsyncBytesIO:
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    async def read(self, size=-1):
+        return self._stream.read(size)
+
+
+def _serialize(handler_type, records):
+    if handler_type is media.MessagePackStreamHandler:
+        return b''.join(msgpack.packb(record, use_bin_type=True) for record in records)
+
+    return b''.join(cbor2.dumps(record) for record in records)
+
+
+def _deserialize(asgi, handler, data):
+    if asgi:
+        async def consume():
+            stream = AsyncBytesIO(data)
+            records = await handler.deserialize_async(stream, None, len(data))
+            return [record async for record in records]
+
+        return falcon.async_to_sync(consume)
+
+    return list(handler.deserialize(io.BytesIO(data), None, len(data)))
+
+
+@pytest.fixture(params=[media.MessagePackStreamHandler, media.CBORStreamHandler])
+def handler_type(request):
+    if request.param is media.MessagePackStreamHandler and msgpack is None:
+        pytest.skip('msgpack is required for this test')
+
+    return request.param
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 64 * 1024])
+def test_deserialize(asgi, handler_type, chunk_size):
+    handler = handler_type(chunk_size=chunk_size)
+    data = _serialize(handler_type, RECORDS)
+
+    assert _deserialize(asgi, handler, data) == RECORDS
+
+
+def test_deserialize_empty(asgi, handler_type):
+    with pytest.raises(falcon.MediaNotFoundError):
+        _deserialize(asgi, handler_type(), b'')
+
+
+@pytest.mark.parametrize('chunk_size', [3, 64 * 1024])
+def test_deserialize_truncated(asgi, handler_type, chunk_size):
+    handler = handler_type(chunk_size=chunk_size)
+    data = _serialize(handler_type, RECORDS[:3])[:-1]
+
+    with pytest.raises(falcon.MediaMalformedError):
+        _deserialize(asgi, handler, data)
+
+
+def test_deserialize_malformed(asgi, handler_type):
+    handler = handler_type()
+    data = _serialize(handler_type, RECORDS[:2]) + b'\xc1\xff\xff\xff'
+
+    with pytest.raises(falcon.MediaMalformedError):
+        _deserialize(asgi, handler, data)
+
+
+def test_deserialize_lazily(handler_type):
+    handler = handler_type(chunk_size=16)
+    stream = io.BytesIO(_serialize(handler_type, RECORDS))
+
+    records = handler.deserialize(stream, None, None)
+    assert next(records) == RECORDS[0]
+    assert stream.tell() < len(stream.getvalue())
+
+
+def test_serialize(asgi, handler_type):
+    handler = handler_type()
+    expected = _serialize(handler_type, RECORDS)
+
+    if asgi:
+        assert falcon.async_to_sync(handler.serialize_async, RECORDS, None) == expected
+    else:
+        assert handler.serialize(RECORDS, None) == expected
+
+    assert handler.serialize(iter(RECORDS), None) == expected
+    assert handler.serialize([], None) == b''
+
+
+@pytest.mark.parametrize('chunk_size', [16, 64])
+def test_max_buffer_size(asgi, handler_type, chunk_size):
+    handler = handler_type(chunk_size=chunk_size, max_buffer_size=256)
+    data = _serialize(handler_type, [{'data': 'x' * 8}, {'data': 'x' * 1024}])
+
+    with pytest.raises(falcon.MediaMalformedError):
+        _deserialize(asgi, handler, data)
+
+    data = _serialize(handler_type, [{'data': 'x' * 8}] * 100)
+    assert _deserialize(asgi, handler, data) == [{'data': 'x' * 8}] * 100
+
+
+def test_default_max_buffer_size(handler_type):
+    assert handler_type()._max_buffer_size == 100 * 1024 * 1024
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 4096])
+def test_cbor_large_and_indefinite_items(asgi, chunk_size):
+    items = [
+        {'data': b'x' * 100000, 'values': list(range(1000))},
+        cbor2.CBORTag(1234, ['a', 'b']),
+        'falcon',
+    ]
+    # NOTE(kgriffs): An indefinite-length array containing an
+    #   indefinite-length byte string and map.
+    indefinite = bytes([
+        0x9f, 0x01, 0x5f, 0x41, 0x61, 0x41, 0x62, 0xff, 0xbf, 0x61, 0x6b, 0x02, 0xff, 0xff,
+    ])
+    data = (b''.join(cbor2.dumps(item) for item in items) + indefinite) * 2
+
+    expected = [cbor2.loads(cbor2.dumps(item)) for item in items] + [[1, b'ab', {'k': 2}]]
+    assert _deserialize(asgi, media.CBORStreamHandler(chunk_size=chunk_size), data) == (
+        expected * 2)
+
+
+@pytest.mark.parametrize('data', [
+    b'\x1c',
+    b'\xff',
+    b'\x82\x01\xff',
+])
+def test_cbor_invalid_structure(asgi, data):
+    with pytest.raises(falcon.MediaMalformedError):
+        _deserialize(asgi, media.CBORStreamHandler(chunk_size=1), data)
+
+
+def test_cbor_handler(asgi):
+    handler = media.CBORHandler()
+    data = cbor2.dumps(RECORDS)
+
+    if asgi:
+        result = falcon.async_to_sync(handler.deserialize_async, AsyncBytesIO(data), None, None)
+        assert falcon.async_to_sync(handler.serialize_async, RECORDS, None) == data
+    else:
+        result = handler.deserialize(io.BytesIO(data), None, None)
+        assert handler.serialize(RECORDS, None) == data
+
+    assert result == RECORDS
+
+    with pytest.raises(falcon.MediaNotFoundError):
+        handler.deserialize(io.BytesIO(b''), None, 0)
+
+    with pytest.raises(falcon.MediaMalformedError):
+        handler.deserialize(io.BytesIO(data[:-1]), None, None)
+
+
+class Ingest:
+
+    def on_post(self, req, resp):
+        resp.media = {'count': sum(1 for _ in req.get_media())}
+
+
+class IngestAsync:
+
+    async def on_post(self, req, resp):
+        count = 0
+        async for _ in await req.get_media():
+            count += 1
+
+        resp.media = {'count': count}
+
+
+def test_registered_handler(asgi, handler_type):
+    app = create_app(asgi)
+    app.req_options.media_handlers['application/x-records'] = handler_type(chunk_size=100)
+    app.add_route('/ingest', IngestAsync() if asgi else Ingest())
+
+    resp = testing.simulate_post(
+        app, '/ingest',
+        body=_serialize(handler_type, RECORDS),
+        content_type='application/x-records',
+    )
+    assert resp.status_code == 200
+    assert resp.json == {'count': len(RECORDS)}
+
+    resp = testing.simulate_post(
+        app, '/ingest',
+        body=_serialize(handler_type, RECORDS[:4])[:-1],
+        content_type='application/x-records',
+    )
+    assert resp.status_code == 400
@@ -23,6 +23,87 @@ def test_deserialize_invalid_unicode():
     assert isinstance(err.value.__cause__, UnicodeDecodeError)
 
 
+class ChunkedStream:
+
+    def __init__(self, data, chunk_size):
+        self._stream = io.BytesIO(data)
+        self._chunk_size = chunk_size
+
+    def read(self, size=-1):
+        return self._stream.read(min(size, self._chunk_size))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 16, 1024])
+@pytest.mark.parametrize('keep_blank,csv', [
+    (True, False),
+    (False, False),
+    (True, True),
+    (False, True),
+])
+def test_deserialize_chunked(chunk_size, keep_blank, csv):
+    body = (
+        'a=1&b=&c=3&&color=green&color=black,white&flag%1&=empty&'
+        'food=hamburger+%28%F0%9F%8D%94%29&sauce=BBQ&color=red,,blue&c=%2C&'
+    ) * 3
+    handler = media.URLEncodedFormHandler(keep_blank=keep_blank, csv=csv)
+    stream = ChunkedStream(body.encode(), chunk_size)
+
+    result = handler.deserialize(stream, falcon.MEDIA_URLENCODED, len(body))
+    assert result == falcon.uri.parse_query_string(body, keep_blank=keep_blank, csv=csv)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+@pytest.mark.parametrize('options,body', [
+    ({'max_pairs': 3}, b'a=1&b=2&c=3&d=4'),
+    ({'max_pairs': 3}, b'a=1&&b=2&c=3'),
+    ({'max_key_size': 4}, b'a=1&bcdef=2'),
+    ({'max_key_size': 4}, b'a=1&bcdef'),
+    ({'max_value_size': 4}, b'a=1&b=23456&c=3'),
+    ({'max_value_size': 4}, b'a=1&b=23456'),
+])
+def test_deserialize_limits_exceeded(asgi, chunk_size, options, body):
+    handler = media.URLEncodedFormHandler(**options)
+
+    with pytest.raises(falcon.MediaMalformedError) as err:
+        if asgi:
+            from falcon.asgi.stream import BoundedStream
+
+            emitter = testing.ASGIRequestEventEmitter(body, chunk_size=chunk_size)
+            stream = BoundedStream(emitter, content_length=len(body))
+            falcon.async_to_sync(
+                handler.deserialize_async, stream, falcon.MEDIA_URLENCODED, len(body))
+        else:
+            stream = ChunkedStream(body, chunk_size)
+            handler.deserialize(stream, falcon.MEDIA_URLENCODED, len(body))
+
+    assert isinstance(err.value.__cause__, ValueError)
+
+
+@pytest.mark.parametrize('options', [
+    {'max_pairs': 3},
+    {'max_key_size': 4, 'max_value_size': 5},
+])
+def test_deserialize_within_limits(options):
+    handler = media.URLEncodedFormHandler(**options)
+    stream = ChunkedStream(b'a=1&abcd=12345&c', 2)
+
+    result = handler.deserialize(stream, falcon.MEDIA_URLENCODED, 16)
+    assert result == {'a': '1', 'abcd': '12345', 'c': ''}
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'max_key_size': 4, 'max_value_size': 1024 * 1024},
+])
+def test_deserialize_large_field(options):
+    handler = media.URLEncodedFormHandler(**options)
+    body = b'a=1&abcd=' + b'x' * (1024 * 1024) + b'&c=3&d=' + b'y' * 4096
+    stream = ChunkedStream(body, 1000)
+
+    result = handler.deserialize(stream, falcon.MEDIA_URLENCODED, len(body))
+    assert result == {'a': '1', 'abcd': 'x' * (1024 * 1024), 'c': '3', 'd': 'y' * 4096}
+
+
 @pytest.mark.parametrize('data,expected', [
     ({'hello': 'world'}, b'hello=world'),
     ({'number': [1, 2]}, b'number=1&number=2'),
@@ -12,6 +12,9 @@ class TestRequestOptions:
         assert not options.auto_parse_form_urlencoded
         assert not options.auto_parse_qs_csv
         assert not options.strip_url_path_trailing_slash
+        assert options.max_form_pairs == 0
+        assert options.max_form_key_size == 0
+        assert options.max_form_value_size == 0
 
     @pytest.mark.parametrize('option_name', [
         'keep_blank_qs_values',
@@ -973,6 +973,34 @@ class TestPostQueryParams:
         req = resource.captured_req
         assert req.get_param('q') is None
 
+    def test_large_body(self, client, resource):
+        client.app.add_route('/', resource)
+        query_string = '&'.join('p{}=v{}'.format(i, i) for i in range(20000))
+        simulate_request_post_query_params(client=client, path='/', query_string=query_string)
+
+        req = resource.captured_req
+        assert len(req.params) == 20000
+        assert req.get_param('p0') == 'v0'
+        assert req.get_param('p19999') == 'v19999'
+
+    @pytest.mark.parametrize('option_name,value,query_string', [
+        ('max_form_pairs', 2, 'q=42&limit=25&marker=deadbeef'),
+        ('max_form_key_size', 5, 'q=42&marker=deadbeef'),
+        ('max_form_value_size', 4, 'q=42&marker=deadbeef'),
+    ])
+    def test_form_limits(self, client, resource, option_name, value, query_string):
+        client.app.add_route('/', resource)
+
+        setattr(client.app.req_options, option_name, value)
+        simulate_request_post_query_params(client=client, path='/', query_string=query_string)
+        req = resource.captured_req
+        assert req.get_param('q') is None
+
+        setattr(client.app.req_options, option_name, 32)
+        simulate_request_post_query_params(client=client, path='/', query_string=query_string)
+        req = resource.captured_req
+        assert req.get_param('q') == '42'
+
     def test_explicitly_disable_auto_parse(self, client, resource):
         client.app.add_route('/', resource)
         client.app.req_options.auto_parse_form_urlencoded = False
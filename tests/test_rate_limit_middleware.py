@@ -0,0 +1,221 @@
+import os
+import threading
+import time
+
+import pytest
+
+import falcon
+from falcon import testing
+from falcon.middleware import MemoryRateLimitBackend, SharedMemoryRateLimitBackend
+
+from _util import create_app, disable_asgi_non_coroutine_wrapping  # NOQA
+
+
+class ThingsResource:
+    def on_get(self, req, resp):
+        resp.text = 'Things'
+
+
+class ThingsResourceAsync:
+    async def on_get(self, req, resp):
+        resp.text = 'Things'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class Clock:
+        now = 1000.0
+
+        def advance(self, seconds):
+            self.now += seconds
+
+    clock = Clock()
+    monkeypatch.setattr(time, 'monotonic', lambda: clock.now)
+    return clock
+
+
+def create_client(asgi, **kwargs):
+    # NOTE(kgriffs): Disable wrapping to test that built-in middleware does
+    #   not require it (since this will be the case for non-test apps).
+    with disable_asgi_non_coroutine_wrapping():
+        app = create_app(asgi, middleware=[falcon.RateLimitMiddleware(**kwargs)])
+
+    app.add_route('/things', ThingsResourceAsync() if asgi else ThingsResource())
+    return testing.TestClient(app)
+
+
+class TestRateLimitMiddleware:
+
+    def test_burst(self, asgi, clock):
+        client = create_client(asgi, rate=1, burst=3)
+
+        for __ in range(3):
+            assert client.simulate_get('/things').status_code == 200
+
+        result = client.simulate_get('/things')
+        assert result.status_code == 429
+        assert result.headers['Retry-After'] == '1'
+
+        clock.advance(0.5)
+        result = client.simulate_get('/things')
+        assert result.status_code == 429
+        assert result.headers['Retry-After'] == '1'
+
+        clock.advance(0.5)
+        assert client.simulate_get('/things').status_code == 200
+        assert client.simulate_get('/things').status_code == 429
+
+        clock.advance(60)
+        for __ in range(3):
+            assert client.simulate_get('/things').status_code == 200
+
+        assert client.simulate_get('/things').status_code == 429
+
+    @pytest.mark.parametrize('rate,burst,retry_after', [
+        (0.1, 1, '10'),
+        (2.5, 3, '1'),
+        (100, 100, '1'),
+    ])
+    def test_default_burst(self, asgi, clock, rate, burst, retry_after):
+        client = create_client(asgi, rate=rate)
+
+        for __ in range(burst):
+            assert client.simulate_get('/things').status_code == 200
+
+        result = client.simulate_get('/things')
+        assert result.status_code == 429
+        assert result.headers['Retry-After'] == retry_after
+
+    def test_remote_addr(self, asgi, clock):
+        client = create_client(asgi, rate=1)
+
+        assert client.simulate_get('/things', remote_addr='10.0.0.1').status_code == 200
+        assert client.simulate_get('/things', remote_addr='10.0.0.2').status_code == 200
+        assert client.simulate_get('/things', remote_addr='10.0.0.1').status_code == 429
+        assert client.simulate_get('/things', remote_addr='10.0.0.2').status_code == 429
+
+    def test_custom_key(self, asgi, clock):
+        client = create_client(asgi, rate=1, key=lambda req: req.get_header('X-API-Key'))
+
+        for __ in range(3):
+            assert client.simulate_get('/things').status_code == 200
+
+        headers = {'X-API-Key': 'key1'}
+        assert client.simulate_get('/things', headers=headers).status_code == 200
+        assert client.simulate_get('/things', headers=headers).status_code == 429
+        assert client.simulate_get('/things', headers={'X-API-Key': 'key2'}).status_code == 200
+
+    def test_custom_backend(self, asgi):
+        class Backend:
+            def __init__(self):
+                self.calls = []
+
+            def acquire(self, key, rate, burst):
+                self.calls.append((key, rate, burst))
+                return 2.5 if len(self.calls) > 1 else 0
+
+        backend = Backend()
+        client = create_client(asgi, rate=0.5, burst=2, backend=backend)
+
+        assert client.simulate_get('/things').status_code == 200
+
+        result = client.simulate_get('/things')
+        assert result.status_code == 429
+        assert result.headers['Retry-After'] == '3'
+
+        assert backend.calls == [('127.0.0.1', 0.5, 2)] * 2
+
+    @pytest.mark.parametrize('kwargs', [
+        {'rate': 0},
+        {'rate': -1},
+        {'rate': 1, 'burst': 0},
+    ])
+    def test_invalid_args(self, kwargs):
+        with pytest.raises(ValueError):
+            falcon.RateLimitMiddleware(**kwargs)
+
+
+class TestMemoryRateLimitBackend:
+
+    def test_acquire(self, clock):
+        backend = MemoryRateLimitBackend()
+
+        assert backend.acquire('a', 2, 2) == 0.0
+        assert backend.acquire('a', 2, 2) == 0.0
+        assert backend.acquire('a', 2, 2) == pytest.approx(0.5)
+        assert backend.acquire('b', 2, 2) == 0.0
+
+        clock.advance(0.25)
+        assert backend.acquire('a', 2, 2) == pytest.approx(0.25)
+
+        clock.advance(0.25)
+        assert backend.acquire('a', 2, 2) == 0.0
+
+    def test_shared_slot(self, clock):
+        backend = MemoryRateLimitBackend(slots=1, shards=1)
+
+        assert backend.acquire('a', 1, 1) == 0.0
+        assert backend.acquire('b', 1, 1) == pytest.approx(1.0)
+
+    def test_threads(self):
+        backend = MemoryRateLimitBackend(slots=16, shards=4)
+        results = []
+
+        def acquire():
+            for __ in range(100):
+                results.append(backend.acquire('key', 0.001, 250))
+
+        threads = [threading.Thread(target=acquire) for __ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(0.0) == 250
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='Requires a POSIX platform')
+class TestSharedMemoryRateLimitBackend:
+
+    def test_acquire(self, tmpdir, clock):
+        path = str(tmpdir.join('buckets'))
+        backend1 = SharedMemoryRateLimitBackend(path, slots=1024, shards=4)
+        backend2 = SharedMemoryRateLimitBackend(path, slots=1024, shards=4)
+
+        assert os.path.getsize(path) == 1024 * 16
+
+        assert backend1.acquire('a', 1, 2) == 0.0
+        assert backend2.acquire('a', 1, 2) == 0.0
+        assert backend1.acquire('a', 1, 2) == pytest.approx(1.0)
+        assert backend2.acquire('a', 1, 2) == pytest.approx(1.0)
+        assert backend2.acquire('b', 1, 2) == 0.0
+
+        clock.advance(1)
+        assert backend2.acquire('a', 1, 2) == 0.0
+        assert backend1.acquire('a', 1, 2) == pytest.approx(1.0)
+
+        backend1.close()
+        backend2.close()
+
+        backend3 = SharedMemoryRateLimitBackend(path, slots=1024, shards=4)
+        assert backend3.acquire('a', 1, 2) == pytest.approx(1.0)
+
+        # NOTE(kgriffs): Buckets that were seemingly updated in the future
+        #   (e.g., before a reboot) are deemed to be full.
+        clock.now = 1.0
+        assert backend3.acquire('a', 1, 2) == 0.0
+        assert backend3.acquire('a', 1, 2) == 0.0
+        assert backend3.acquire('a', 1, 2) == pytest.approx(1.0)
+
+        backend3.close()
+
+    def test_middleware(self, asgi, tmpdir, clock):
+        path = str(tmpdir.join('buckets'))
+        backend = SharedMemoryRateLimitBackend(path)
+
+        client1 = create_client(asgi, rate=1, backend=backend)
+        client2 = create_client(asgi, rate=1, backend=SharedMemoryRateLimitBackend(path))
+
+        assert client1.simulate_get('/things').status_code == 200
+        assert client2.simulate_get('/things').status_code == 429
+        assert client1.simulate_get('/things').status_code == 429
@@ -0,0 +1,261 @@
+import gzip
+import json
+import tracemalloc
+import zlib
+
+import pytest
+
+import falcon
+from falcon import testing
+
+from _util import create_app  # NOQA
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+DOC = {'messages': ['Hello, World!'] * 100}
+BODY = json.dumps(DOC).encode()
+
+
+def compress(encoding, data):
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.compress(data)
+    if encoding == 'deflate':
+        return zlib.compress(data)
+    if encoding == 'deflate-raw':
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+class MediaResource:
+    def on_post(self, req, resp):
+        resp.media = req.get_media()
+
+    def on_put(self, req, resp):
+        chunks = []
+        while True:
+            chunk = req.bounded_stream.read(100)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        resp.data = b''.join(chunks)
+
+
+class MediaResourceAsync:
+    async def on_post(self, req, resp):
+        resp.media = await req.get_media()
+
+    async def on_put(self, req, resp):
+        if req.get_param_as_bool('iterate'):
+            resp.data = b''.join([chunk async for chunk in req.stream])
+            return
+
+        chunks = []
+        while True:
+            chunk = await req.stream.read(100)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        resp.data = b''.join(chunks)
+
+
+def create_client(asgi, **options):
+    app = create_app(asgi)
+    app.add_route('/', MediaResourceAsync() if asgi else MediaResource())
+
+    app.req_options.decompress_body = True
+    for name, value in options.items():
+        setattr(app.req_options, name, value)
+
+    return testing.TestClient(app)
+
+
+@pytest.mark.parametrize('encoding', [
+    'gzip',
+    'x-gzip',
+    'deflate',
+    'zstd',
+])
+def test_media(asgi, encoding):
+    if encoding == 'zstd' and zstandard is None:
+        pytest.skip('zstandard is required for this test')
+
+    client = create_client(asgi)
+    result = client.simulate_post('/', body=compress(encoding, BODY), headers={
+        'Content-Type': falcon.MEDIA_JSON,
+        'Content-Encoding': encoding.upper() if encoding == 'gzip' else encoding,
+    })
+
+    assert result.status_code == 200
+    assert result.json == DOC
+
+
+def test_raw_deflate(asgi):
+    client = create_client(asgi)
+    result = client.simulate_put('/', body=compress('deflate-raw', BODY), headers={
+        'Content-Encoding': 'deflate',
+    })
+
+    assert result.status_code == 200
+    assert result.content == BODY
+
+
+@pytest.mark.parametrize('iterate', [True, False])
+def test_stream(asgi, iterate):
+    if iterate and not asgi:
+        pytest.skip('Only applies to ASGI')
+
+    client = create_client(asgi)
+    result = client.simulate_put(
+        '/', body=compress('gzip', BODY),
+        headers={'Content-Encoding': 'gzip'},
+        params={'iterate': iterate},
+    )
+
+    assert result.status_code == 200
+    assert result.content == BODY
+
+
+@pytest.mark.parametrize('encoding', [None, 'identity'])
+def test_not_compressed(asgi, encoding):
+    client = create_client(asgi)
+    headers = {'Content-Encoding': encoding} if encoding else {}
+    result = client.simulate_post('/', body=BODY, headers=headers)
+
+    assert result.status_code == 200
+    assert result.json == DOC
+
+
+def test_disabled_by_default(asgi):
+    app = create_app(asgi)
+    app.add_route('/', MediaResourceAsync() if asgi else MediaResource())
+    client = testing.TestClient(app)
+
+    body = compress('gzip', BODY)
+    result = client.simulate_put('/', body=body, headers={'Content-Encoding': 'gzip'})
+
+    assert result.content == body
+
+
+@pytest.mark.parametrize('encoding', ['br', 'gzip, deflate', 'compress'])
+def test_unsupported_encoding(asgi, encoding):
+    client = create_client(asgi)
+    result = client.simulate_post('/', body=BODY, headers={'Content-Encoding': encoding})
+
+    assert result.status_code == 415
+
+
+@pytest.mark.parametrize('body', [
+    b'Not compressed',
+    compress('gzip', BODY)[:-20],
+    compress('gzip', BODY)[:30],
+])
+def test_invalid_body(asgi, body):
+    client = create_client(asgi)
+    result = client.simulate_post('/', body=body, headers={'Content-Encoding': 'gzip'})
+
+    assert result.status_code == 400
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'deflate', 'zstd'])
+@pytest.mark.parametrize('max_size,status_code', [
+    (len(BODY) - 1, 413),
+    (len(BODY), 200),
+    (0, 200),
+])
+def test_max_decompressed_body_size(asgi, encoding, max_size, status_code):
+    if encoding == 'zstd' and zstandard is None:
+        pytest.skip('zstandard is required for this test')
+
+    client = create_client(asgi, max_decompressed_body_size=max_size)
+    result = client.simulate_post('/', body=compress(encoding, BODY), headers={
+        'Content-Encoding': encoding,
+    })
+
+    assert result.status_code == status_code
+
+
+def test_decompression_bomb(asgi):
+    client = create_client(asgi, max_decompressed_body_size=1024 * 1024)
+
+    # NOTE: Expands to 64 MiB
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    zeros = b'\0' * (1024 * 1024)
+    body = b''.join(compressor.compress(zeros) for _ in range(64)) + compressor.flush()
+    assert len(body) < 100 * 1024
+
+    result = client.simulate_put('/', body=body, headers={'Content-Encoding': 'gzip'})
+    assert result.status_code == 413
+
+
+@pytest.mark.skipif(zstandard is None, reason='zstandard is required for this test')
+def test_decompression_bomb_zstd(asgi):
+    client = create_client(asgi, max_decompressed_body_size=1024)
+
+    # NOTE: Expands to 256 MiB
+    body = zstandard.ZstdCompressor(level=19).compress(b'\0' * (256 * 1024 * 1024))
+    assert len(body) < 10 * 1024
+
+    tracemalloc.start()
+    try:
+        result = client.simulate_put('/', body=body, headers={'Content-Encoding': 'zstd'})
+        __, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.status_code == 413
+
+    # NOTE: Only a single output buffer (128 KiB) should be decompressed
+    #   before the limit is enforced.
+    assert peak < 1024 * 1024
+
+
+@pytest.mark.skipif(zstandard is None, reason='zstandard is required for this test')
+@pytest.mark.parametrize('body', [
+    b'Not compressed',
+    compress('zstd', BODY)[:-5] if zstandard else None,
+    compress('zstd', BODY)[:10] if zstandard else None,
+])
+def test_invalid_body_zstd(asgi, body):
+    client = create_client(asgi)
+    result = client.simulate_post('/', body=body, headers={'Content-Encoding': 'zstd'})
+
+    assert result.status_code == 400
+
+
+def test_multipart(asgi):
+    client = create_client(asgi)
+
+    body = (
+        b'--BOUNDARY\r\n'
+        b'Content-Disposition: form-data; name="field"\r\n\r\n'
+        b'value\r\n'
+        b'--BOUNDARY--\r\n'
+    )
+
+    class MultipartResource:
+        def on_post(self, req, resp):
+            resp.media = {part.name: part.text for part in req.get_media()}
+
+    class MultipartResourceAsync:
+        async def on_post(self, req, resp):
+            form = await req.get_media()
+            resp.media = {part.name: await part.text async for part in form}
+
+    client.app.add_route('/form', MultipartResourceAsync() if asgi else MultipartResource())
+
+    result = client.simulate_post('/form', body=compress('gzip', body), headers={
+        'Content-Encoding': 'gzip',
+        'Content-Type': 'multipart/form-data; boundary=BOUNDARY',
+    })
+
+    assert result.status_code == 200
+    assert result.json == {'field': 'value'}
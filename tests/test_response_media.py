@@ -212,3 +212,125 @@ def test_media_rendered_cached(client):
 
     resp.media = 123
     assert first is not resp.render_body()
+
+
+class CountingJSONHandler(media.JSONHandler):
+    def __init__(self):
+        self.calls = 0
+
+        def dumps(obj):
+            self.calls += 1
+            return json.dumps(obj)
+
+        super().__init__(dumps=dumps)
+
+        # NOTE: Reset the counter, since JSONHandler probes the return type
+        #   of dumps() upon initialization.
+        self.calls = 0
+
+
+class CachedMediaResource:
+
+    def __init__(self, document):
+        self.document = document
+        self.version = 1
+
+    def on_get(self, req, resp):
+        resp.set_media(self.document, cache_key='doc', version=self.version)
+
+
+def test_media_render_cache():
+    handler = CountingJSONHandler()
+    resource = CachedMediaResource({'catalog': ['falcon', 'ostrich']})
+
+    app = falcon.App()
+    app.add_route('/', resource)
+    app.resp_options.media_handlers[falcon.MEDIA_JSON] = handler
+    app.resp_options.media_render_cache = media.RenderCache()
+    client = testing.TestClient(app)
+
+    results = [client.simulate_get('/') for _ in range(3)]
+    assert handler.calls == 1
+    assert app.resp_options.media_render_cache.hits == 2
+    assert app.resp_options.media_render_cache.misses == 1
+
+    etag = results[0].headers['ETag']
+    for result in results:
+        assert result.json == {'catalog': ['falcon', 'ostrich']}
+        assert result.headers['ETag'] == etag
+
+    resource.document = {'catalog': []}
+    resource.version = 2
+    result = client.simulate_get('/')
+    assert handler.calls == 2
+    assert result.json == {'catalog': []}
+    assert result.headers['ETag'] != etag
+
+
+def test_media_render_cache_untagged(client):
+    client.simulate_get('/')
+
+    resp = client.resource.captured_resp
+    resp.options.media_render_cache = media.RenderCache()
+    resp.media = {'foo': 'bar'}
+
+    assert resp.render_body() == b'{"foo": "bar"}'
+    assert len(resp.options.media_render_cache) == 0
+    assert resp.etag is None
+
+
+def test_media_render_cache_respects_etag(client):
+    client.simulate_get('/')
+
+    resp = client.resource.captured_resp
+    resp.options.media_render_cache = media.RenderCache()
+    resp.etag = 'custom'
+    resp.set_media({'foo': 'bar'}, cache_key='foo')
+
+    assert resp.render_body() == b'{"foo": "bar"}'
+    assert resp.etag == '"custom"'
+    assert len(resp.options.media_render_cache) == 1
+
+    resp.media = {'foo': 'baz'}
+    assert resp.render_body() == b'{"foo": "baz"}'
+    assert len(resp.options.media_render_cache) == 1
+
+
+def test_media_render_cache_content_type(client):
+    client.simulate_get('/')
+
+    resp = client.resource.captured_resp
+    resp.options.media_render_cache = media.RenderCache()
+    resp.options.media_handlers[falcon.MEDIA_MSGPACK] = media.MessagePackHandler()
+
+    resp.set_media({'foo': 'bar'}, cache_key='foo')
+    json_data = resp.render_body()
+
+    resp.content_type = falcon.MEDIA_MSGPACK
+    resp.set_media({'foo': 'bar'}, cache_key='foo')
+    msgpack_data = resp.render_body()
+
+    assert json_data != msgpack_data
+    assert len(resp.options.media_render_cache) == 2
+
+
+def test_media_render_cache_eviction():
+    cache = media.RenderCache(max_entries=2)
+
+    cache.set(('a', None), falcon.MEDIA_JSON, b'1')
+    cache.set(('b', None), falcon.MEDIA_JSON, b'2')
+    assert cache.get(('a', None), falcon.MEDIA_JSON)[0] == b'1'
+
+    cache.set(('c', None), falcon.MEDIA_JSON, b'3')
+    assert len(cache) == 2
+    assert cache.get(('b', None), falcon.MEDIA_JSON) is None
+    assert cache.get(('a', None), falcon.MEDIA_JSON)[0] == b'1'
+    assert cache.get(('c', None), falcon.MEDIA_JSON)[0] == b'3'
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_media_render_cache_invalid_size():
+    with pytest.raises(ValueError):
+        media.RenderCache(max_entries=0)
@@ -368,3 +368,492 @@ def test_filesystem_traversal_fuse(client, monkeypatch):
     monkeypatch.setattr('os.path.normpath', suspicious_normpath)
     response = client.simulate_request(path='/static/shadow')
     assert response.status == falcon.HTTP_404
+
+
+def _collect_asgi_events(app, path, extensions=None):
+    scope = testing.create_scope(path=path)
+    if extensions is not None:
+        scope['extensions'] = extensions
+
+    events = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(event):
+        events.append(event)
+
+    falcon.async_to_sync(app, scope, receive, send)
+    return events
+
+
+@pytest.fixture
+def static_app(tmp_path):
+    (tmp_path / 'hello.txt').write_bytes(b'Hello, World!' * 10000)
+
+    app = falcon.asgi.App()
+    app.add_static_route('/static', str(tmp_path))
+    return app
+
+
+def test_asgi_zerocopysend(static_app, tmp_path):
+    events = _collect_asgi_events(
+        static_app, '/static/hello.txt',
+        extensions={'http.response.zerocopysend': {}, 'http.response.pathsend': {}},
+    )
+
+    assert events[0]['type'] == 'http.response.start'
+    assert events[0]['status'] == 200
+    assert len(events) == 2
+
+    event = events[1]
+    assert event['type'] == 'http.response.zerocopysend'
+    assert event['offset'] == 0
+    assert not event['more_body']
+    assert os.path.samefile(event['file'].name, str(tmp_path / 'hello.txt'))
+    event['file'].close()
+
+
+def test_asgi_pathsend(static_app, tmp_path):
+    events = _collect_asgi_events(
+        static_app, '/static/hello.txt',
+        extensions={'http.response.pathsend': {}},
+    )
+
+    assert len(events) == 2
+    assert events[1] == {
+        'type': 'http.response.pathsend',
+        'path': os.path.abspath(str(tmp_path / 'hello.txt')),
+    }
+
+
+@pytest.mark.parametrize('extensions', [None, {}, {'tls': {}}])
+def test_asgi_no_file_extensions(static_app, extensions):
+    events = _collect_asgi_events(static_app, '/static/hello.txt', extensions=extensions)
+
+    assert events[0]['type'] == 'http.response.start'
+    body_events = events[1:]
+    assert all(e['type'] == 'http.response.body' for e in body_events)
+    assert b''.join(e.get('body', b'') for e in body_events) == b'Hello, World!' * 10000
+    assert not body_events[-1].get('more_body', False)
+
+    # NOTE: Files are read in 64 KiB blocks.
+    assert len(body_events[0]['body']) == 64 * 1024
+
+
+def test_asgi_file_extensions_unsupported_stream(monkeypatch):
+    monkeypatch.setattr(io, 'open', lambda path, mode: io.BytesIO(b'Just a BytesIO'))
+
+    app = falcon.asgi.App()
+    app.add_static_route('/static', '/var/www/statics')
+
+    events = _collect_asgi_events(
+        app, '/static/hello.txt',
+        extensions={'http.response.zerocopysend': {}, 'http.response.pathsend': {}},
+    )
+
+    assert events[0]['type'] == 'http.response.start'
+    body = b''.join(e.get('body', b'') for e in events[1:])
+    assert body == b'Just a BytesIO'
+    assert all(e['type'] == 'http.response.body' for e in events[1:])
+
+
+@pytest.fixture
+def file_client(asgi, tmp_path):
+    (tmp_path / 'digits.txt').write_bytes(b'0123456789')
+
+    app = _util.create_app(asgi=asgi)
+    app.add_static_route('/static', str(tmp_path))
+    return testing.TestClient(app)
+
+
+def test_validators(file_client):
+    resp = file_client.simulate_get('/static/digits.txt')
+
+    assert resp.status == falcon.HTTP_200
+    assert resp.content == b'0123456789'
+    assert resp.headers['Content-Length'] == '10'
+    assert resp.headers['Accept-Ranges'] == 'bytes'
+    assert resp.headers['ETag'].startswith('"')
+    assert resp.headers['Last-Modified'].endswith(' GMT')
+
+
+@pytest.mark.parametrize('method', ['GET', 'HEAD'])
+def test_not_modified(file_client, method):
+    resp = file_client.simulate_get('/static/digits.txt')
+    etag = resp.headers['ETag']
+    last_modified = resp.headers['Last-Modified']
+
+    for headers in (
+        {'If-None-Match': etag},
+        {'If-None-Match': 'W/' + etag},
+        {'If-None-Match': '"foo", ' + etag},
+        {'If-None-Match': '*'},
+        {'If-Modified-Since': last_modified},
+        {'If-Modified-Since': 'Fri, 31 Dec 9999 23:59:59 GMT'},
+    ):
+        resp = file_client.simulate_request(method, '/static/digits.txt', headers=headers)
+        assert resp.status == falcon.HTTP_304
+        assert resp.content == b''
+        assert resp.headers['ETag'] == etag
+        assert resp.headers['Last-Modified'] == last_modified
+
+
+@pytest.mark.parametrize('headers', [
+    {'If-None-Match': '"foo"'},
+    {'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'},
+    {'If-Modified-Since': 'invalid'},
+])
+def test_modified(file_client, headers):
+    resp = file_client.simulate_get('/static/digits.txt', headers=headers)
+    assert resp.status == falcon.HTTP_200
+    assert resp.content == b'0123456789'
+
+
+def test_if_none_match_takes_precedence(file_client):
+    last_modified = file_client.simulate_get('/static/digits.txt').headers['Last-Modified']
+
+    resp = file_client.simulate_get('/static/digits.txt', headers={
+        'If-None-Match': '"foo"',
+        'If-Modified-Since': last_modified,
+    })
+    assert resp.status == falcon.HTTP_200
+
+
+@pytest.mark.parametrize('range_header, expected, content_range', [
+    ('bytes=0-3', b'0123', 'bytes 0-3/10'),
+    ('bytes=2-2', b'2', 'bytes 2-2/10'),
+    ('bytes=7-', b'789', 'bytes 7-9/10'),
+    ('bytes=5-100', b'56789', 'bytes 5-9/10'),
+    ('bytes=-3', b'789', 'bytes 7-9/10'),
+    ('bytes=-100', b'0123456789', 'bytes 0-9/10'),
+])
+def test_range(file_client, range_header, expected, content_range):
+    resp = file_client.simulate_get('/static/digits.txt', headers={'Range': range_header})
+
+    assert resp.status == falcon.HTTP_206
+    assert resp.content == expected
+    assert resp.headers['Content-Range'] == content_range
+    assert resp.headers['Content-Length'] == str(len(expected))
+
+
+@pytest.mark.parametrize('range_header', ['bytes=10-', 'bytes=100-200'])
+def test_range_not_satisfiable(file_client, range_header):
+    resp = file_client.simulate_get('/static/digits.txt', headers={'Range': range_header})
+
+    assert resp.status == falcon.HTTP_416
+    assert resp.headers['Content-Range'] == 'bytes */10'
+
+
+def test_range_not_satisfiable_closes_file(file_client, monkeypatch):
+    opened = []
+    io_open = io.open
+
+    def open_and_track(*args, **kwargs):
+        stream = io_open(*args, **kwargs)
+        opened.append(stream)
+        return stream
+
+    monkeypatch.setattr(io, 'open', open_and_track)
+
+    resp = file_client.simulate_get('/static/digits.txt', headers={'Range': 'bytes=10-'})
+    assert resp.status == falcon.HTTP_416
+
+    assert len(opened) == 1
+    assert opened[0].closed
+
+
+@pytest.mark.parametrize('method, range_header', [
+    ('GET', 'bytes=0-1,5-6'),
+    ('GET', 'bytes=5-3'),
+    ('GET', 'items=0-3'),
+    ('GET', 'bytes'),
+    ('HEAD', 'bytes=0-3'),
+])
+def test_range_ignored(file_client, method, range_header):
+    resp = file_client.simulate_request(
+        method, '/static/digits.txt', headers={'Range': range_header})
+
+    assert resp.status == falcon.HTTP_200
+    assert resp.headers['Content-Length'] == '10'
+    assert 'Content-Range' not in resp.headers
+
+
+def test_if_range(file_client):
+    resp = file_client.simulate_get('/static/digits.txt')
+    etag = resp.headers['ETag']
+    last_modified = resp.headers['Last-Modified']
+
+    for if_range in (etag, last_modified):
+        resp = file_client.simulate_get('/static/digits.txt', headers={
+            'Range': 'bytes=0-3',
+            'If-Range': if_range,
+        })
+        assert resp.status == falcon.HTTP_206
+        assert resp.content == b'0123'
+
+    for if_range in ('"foo"', 'W/' + etag, 'Thu, 01 Jan 1970 00:00:00 GMT'):
+        resp = file_client.simulate_get('/static/digits.txt', headers={
+            'Range': 'bytes=0-3',
+            'If-Range': if_range,
+        })
+        assert resp.status == falcon.HTTP_200
+        assert resp.content == b'0123456789'
+
+
+def test_asgi_zerocopysend_range(static_app):
+    scope_extensions = {'http.response.zerocopysend': {}, 'http.response.pathsend': {}}
+
+    app = static_app
+    scope = testing.create_scope(path='/static/hello.txt', headers={'Range': 'bytes=13-25'})
+    scope['extensions'] = scope_extensions
+
+    events = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(event):
+        events.append(event)
+
+    falcon.async_to_sync(app, scope, receive, send)
+
+    assert events[0]['status'] == 206
+    assert len(events) == 2
+
+    event = events[1]
+    assert event['type'] == 'http.response.zerocopysend'
+    assert event['offset'] == 13
+    assert event['count'] == 13
+    event['file'].close()
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    (tmp_path / 'app.js').write_bytes(b'console.log("Hello, World!");')
+    (tmp_path / 'app.js.gz').write_bytes(b'gzipped')
+    (tmp_path / 'app.js.br').write_bytes(b'brotlied')
+    (tmp_path / 'index.html').write_bytes(b'<html></html>')
+    (tmp_path / 'large.bin').write_bytes(b'x' * 1024)
+    return tmp_path
+
+
+def _create_cached_client(asgi, directory, **kwargs):
+    app = _util.create_app(asgi=asgi)
+    app.add_static_route('/static', str(directory), **kwargs)
+    return testing.TestClient(app)
+
+
+def _get_cache(client):
+    sr = client.app._static_routes[0][0]
+    return sr._cache
+
+
+def test_cache_serves_from_memory(asgi, cache_dir):
+    client = _create_cached_client(
+        asgi, cache_dir, cache_size=4096, cache_revalidate_interval=3600)
+
+    resp = client.simulate_get('/static/index.html')
+    assert resp.status == falcon.HTTP_200
+    assert resp.content == b'<html></html>'
+    assert resp.headers['Content-Type'] == 'text/html'
+    assert resp.headers['Content-Length'] == '13'
+    assert 'Vary' not in resp.headers
+
+    stat = (cache_dir / 'index.html').stat()
+    (cache_dir / 'index.html').write_bytes(b'<html>Modified</html>')
+    os.utime(str(cache_dir / 'index.html'), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # NOTE: Not revalidated yet
+    resp = client.simulate_get('/static/index.html')
+    assert resp.content == b'<html></html>'
+
+    cache = _get_cache(client)
+    cache._revalidate_interval = 0
+
+    resp = client.simulate_get('/static/index.html')
+    assert resp.content == b'<html>Modified</html>'
+
+
+def test_cache_conditional_and_range(asgi, cache_dir):
+    client = _create_cached_client(asgi, cache_dir, cache_size=4096)
+
+    resp = client.simulate_get('/static/index.html')
+    etag = resp.headers['ETag']
+
+    resp = client.simulate_get('/static/index.html', headers={'If-None-Match': etag})
+    assert resp.status == falcon.HTTP_304
+    assert resp.content == b''
+
+    resp = client.simulate_get('/static/index.html', headers={'Range': 'bytes=1-4'})
+    assert resp.status == falcon.HTTP_206
+    assert resp.content == b'html'
+    assert resp.headers['Content-Range'] == 'bytes 1-4/13'
+
+
+@pytest.mark.parametrize('accept_encoding, encoding, expected', [
+    (None, None, b'console.log("Hello, World!");'),
+    ('identity', None, b'console.log("Hello, World!");'),
+    ('gzip', 'gzip', b'gzipped'),
+    ('gzip, deflate, br', 'br', b'brotlied'),
+    ('br;q=0, gzip;q=0.5', 'gzip', b'gzipped'),
+    ('BR', 'br', b'brotlied'),
+    ('*', 'br', b'brotlied'),
+    ('br; q=0, gzip; q=0', None, b'console.log("Hello, World!");'),
+    ('br;q=0, *', 'gzip', b'gzipped'),
+    ('gzip, *;q=0', 'gzip', b'gzipped'),
+    ('gzip;q=0.5, br;q=0.2', 'gzip', b'gzipped'),
+    ('br;q=0, gzip;q=0, *', None, b'console.log("Hello, World!");'),
+])
+def test_cache_precompressed(asgi, cache_dir, accept_encoding, encoding, expected):
+    client = _create_cached_client(asgi, cache_dir, cache_size=4096)
+
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+    resp = client.simulate_get('/static/app.js', headers=headers)
+
+    assert resp.status == falcon.HTTP_200
+    assert resp.content == expected
+    assert resp.headers['Content-Type'] == 'text/javascript'
+    assert resp.headers['Vary'] == 'Accept-Encoding'
+    assert resp.headers.get('Content-Encoding') == encoding
+
+    etag = resp.headers['ETag']
+    resp = client.simulate_get('/static/app.js', headers=dict(headers, **{'If-None-Match': etag}))
+    assert resp.status == falcon.HTTP_304
+
+
+def test_cache_precompressed_range(asgi, cache_dir):
+    client = _create_cached_client(asgi, cache_dir, cache_size=4096)
+
+    resp = client.simulate_get('/static/app.js', headers={
+        'Accept-Encoding': 'gzip, br',
+        'Range': 'bytes=0-6',
+    })
+
+    assert resp.status == falcon.HTTP_206
+    assert resp.content == b'console'
+    assert 'Content-Encoding' not in resp.headers
+
+
+def test_cache_stale_variant(asgi, cache_dir):
+    stat = (cache_dir / 'app.js').stat()
+    os.utime(str(cache_dir / 'app.js.gz'), ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+    client = _create_cached_client(asgi, cache_dir, cache_size=4096)
+
+    resp = client.simulate_get('/static/app.js', headers={'Accept-Encoding': 'gzip'})
+    assert resp.content == b'console.log("Hello, World!");'
+    assert 'Content-Encoding' not in resp.headers
+
+
+def test_cache_limits(asgi, cache_dir):
+    client = _create_cached_client(asgi, cache_dir, cache_size=100, cache_max_file_size=512)
+    cache = _get_cache(client)
+
+    resp = client.simulate_get('/static/large.bin')
+    assert resp.content == b'x' * 1024
+    assert not cache._entries
+
+    client.simulate_get('/static/index.html')
+    client.simulate_get('/static/app.js')
+    assert list(cache._entries) == [
+        str(cache_dir / 'index.html'),
+        str(cache_dir / 'app.js'),
+    ]
+    assert cache._size == 13 + 29 + 7 + 8
+
+    client.simulate_get('/static/index.html')
+    assert list(cache._entries)[-1] == str(cache_dir / 'index.html')
+
+    # NOTE: Evict the least recently used entry
+    (cache_dir / 'more.txt').write_bytes(b'y' * 50)
+    client.simulate_get('/static/more.txt')
+    assert list(cache._entries) == [
+        str(cache_dir / 'index.html'),
+        str(cache_dir / 'more.txt'),
+    ]
+    assert cache._size == 63
+
+    # NOTE: Still served, but not retained
+    (cache_dir / 'big.txt').write_bytes(b'z' * 200)
+    resp = client.simulate_get('/static/big.txt')
+    assert resp.content == b'z' * 200
+    assert str(cache_dir / 'big.txt') not in cache._entries
+
+
+def test_cache_not_found_and_fallback(asgi, cache_dir):
+    client = _create_cached_client(asgi, cache_dir, cache_size=4096)
+    resp = client.simulate_get('/static/missing.html')
+    assert resp.status == falcon.HTTP_404
+
+    client = _create_cached_client(
+        asgi, cache_dir, cache_size=4096, fallback_filename='index.html')
+    resp = client.simulate_get('/static/missing.html')
+    assert resp.status == falcon.HTTP_200
+    assert resp.content == b'<html></html>'
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        StaticRoute('/static', '/var/www/statics', cache_size=-1)
+
+
+def test_resolved_path_cache(asgi, tmp_path, monkeypatch):
+    (tmp_path / 'index.html').write_bytes(b'<html></html>')
+
+    client = _create_cached_client(asgi, tmp_path, fallback_filename='index.html')
+    sr = client.app._static_routes[0][0]
+
+    normpath_calls = []
+    normpath = os.path.normpath
+
+    def normpath_spy(path):
+        normpath_calls.append(path)
+        return normpath(path)
+
+    monkeypatch.setattr('os.path.normpath', normpath_spy)
+
+    for _ in range(3):
+        resp = client.simulate_get('/static/users/42')
+        assert resp.status == falcon.HTTP_200
+        assert resp.content == b'<html></html>'
+
+        resp = client.simulate_get('/static/../etc/passwd')
+        assert resp.status == falcon.HTTP_404
+
+    assert normpath_calls == ['users/42', '../etc/passwd']
+    assert list(sr._missing) == [str(tmp_path / 'users' / '42')]
+
+
+def test_missing_file_revalidated(asgi, tmp_path):
+    (tmp_path / 'index.html').write_bytes(b'<html></html>')
+
+    client = _create_cached_client(asgi, tmp_path, fallback_filename='index.html')
+    sr = client.app._static_routes[0][0]
+
+    resp = client.simulate_get('/static/app.js')
+    assert resp.content == b'<html></html>'
+
+    (tmp_path / 'app.js').write_bytes(b'// app')
+
+    resp = client.simulate_get('/static/app.js')
+    assert resp.content == b'<html></html>'
+
+    # NOTE: Simulate the passing of time
+    sr._missing[str(tmp_path / 'app.js')] = 0
+
+    resp = client.simulate_get('/static/app.js')
+    assert resp.content == b'// app'
+    assert not sr._missing
+
+
+def test_missing_file_cache_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(StaticRoute, '_MISSING_CACHE_SIZE', 4)
+
+    client = _create_cached_client(False, tmp_path)
+    sr = client.app._static_routes[0][0]
+
+    for i in range(10):
+        resp = client.simulate_get('/static/missing{}.txt'.format(i))
+        assert resp.status == falcon.HTTP_404
+        assert len(sr._missing) <= 4
@@ -600,6 +600,23 @@ class TestFalconUtils:
         else:
             assert not misc.isascii(string)
 
+    @pytest.mark.parametrize('accept_encoding,expected', [
+        (None, None),
+        ('', None),
+        ('identity', None),
+        ('gzip', 'gzip'),
+        ('gzip, br', 'br'),
+        ('BR;q=0.5, gzip; q=0.8', 'gzip'),
+        ('br;q=0.5, gzip;q=0.5', 'br'),
+        ('*', 'br'),
+        ('br;q=0, *', 'gzip'),
+        ('*;q=0.1, gzip', 'gzip'),
+        ('br;q=0, gzip;q=0, *', None),
+        ('br;q=invalid, gzip', 'gzip'),
+    ])
+    def test_misc_negotiate_content_coding(self, accept_encoding, expected):
+        assert misc._negotiate_content_coding(accept_encoding, ('br', 'gzip')) == expected
+
 
 @pytest.mark.parametrize(
     'protocol,method',
@@ -4,6 +4,11 @@ try:
     import jsonschema as _jsonschema  # NOQA
 except ImportError:
     pass
+
+try:
+    import fastjsonschema as _fastjsonschema  # NOQA
+except ImportError:
+    pass
 import pytest
 
 import falcon
@@ -17,6 +22,7 @@ from _util import create_app, disable_asgi_non_coroutine_wrapping  # NOQA
 #   of in the body of the except statement, above, to avoid flake8 import
 #   ordering errors.
 jsonschema = globals().get('_jsonschema')
+fastjsonschema = globals().get('_fastjsonschema')
 
 
 _VALID_MEDIA = {'message': 'something'}
@@ -39,6 +45,11 @@ skip_missing_dep = pytest.mark.skipif(
     reason='jsonschema dependency not found'
 )
 
+skip_missing_compiler_dep = pytest.mark.skipif(
+    fastjsonschema is None,
+    reason='fastjsonschema dependency not found'
+)
+
 
 class Resource:
     @validators.jsonschema.validate(req_schema=_TEST_SCHEMA)
@@ -95,14 +106,35 @@ class ResourceAsync:
         resp.media = _VALID_MEDIA
 
 
+class ResourceCompiled:
+    @validators.jsonschema.validate(
+        req_schema=_TEST_SCHEMA, resp_schema=_TEST_SCHEMA, compiled=True)
+    def both_validated(self, req, resp):
+        return req, resp
+
+
+class ResourceCompiledAsync:
+    @validators.jsonschema.validate(
+        req_schema=_TEST_SCHEMA, resp_schema=_TEST_SCHEMA, compiled=True)
+    async def both_validated(self, req, resp):
+        return req, resp
+
+
+class ResourceOffloadedAsync:
+    @validators.jsonschema.validate(req_schema=_TEST_SCHEMA, offload_threshold=1024)
+    async def request_validated(self, req, resp):
+        return resp
+
+
 class _MockReq:
     def __init__(self, valid=True):
         self.media = _VALID_MEDIA if valid else {}
 
 
 class _MockReqAsync:
-    def __init__(self, valid=True):
+    def __init__(self, valid=True, content_length=None):
         self._media = _VALID_MEDIA if valid else {}
+        self.content_length = content_length
 
     async def get_media(self):
         return self._media
@@ -194,3 +226,100 @@ def test_both_schemas_validation_failure(asgi):
 
     result = client.simulate_put('/test', json=_INVALID_MEDIA)
     assert result.status_code == 400
+
+
+@skip_missing_dep
+def test_schema_checked_once(monkeypatch):
+    created = []
+
+    class FormatChecker(jsonschema.FormatChecker):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(jsonschema, 'FormatChecker', FormatChecker)
+
+    class CountedResource:
+        @validators.jsonschema.validate(req_schema=_TEST_SCHEMA, resp_schema=_TEST_SCHEMA)
+        def both_validated(self, req, resp):
+            return req, resp
+
+    assert len(created) == 2
+
+    resource = CountedResource()
+    for i in range(3):
+        with pytest.raises(falcon.HTTPBadRequest):
+            resource.both_validated(_MockReq(False), MockResp())
+        with pytest.raises(falcon.HTTPInternalServerError):
+            resource.both_validated(_MockReq(True), MockResp(False))
+        resource.both_validated(_MockReq(True), MockResp())
+
+    assert len(created) == 2
+
+
+@skip_missing_dep
+def test_invalid_schema_fails_at_decoration_time():
+    decorator = validators.jsonschema.validate(req_schema={'type': 12})
+
+    def on_post(self, req, resp):
+        pass
+
+    with pytest.raises(jsonschema.SchemaError):
+        decorator(on_post)
+
+
+@skip_missing_compiler_dep
+def test_compiled_validation(asgi):
+    resource = ResourceCompiledAsync() if asgi else ResourceCompiled()
+
+    def call(*args):
+        if asgi:
+            return falcon.async_to_sync(resource.both_validated, *args)
+
+        return resource.both_validated(*args)
+
+    req = MockReq(asgi)
+    resp = MockResp()
+    assert call(req, resp) == (req, resp)
+
+    with pytest.raises(falcon.HTTPBadRequest) as excinfo:
+        call(MockReq(asgi, False), MockResp())
+
+    assert excinfo.value.title == 'Request data failed validation'
+    assert 'message' in excinfo.value.description
+
+    with pytest.raises(falcon.HTTPInternalServerError) as excinfo:
+        call(MockReq(asgi), MockResp(False))
+
+    assert excinfo.value.title == 'Response data failed validation'
+
+
+@skip_missing_dep
+@pytest.mark.parametrize('content_length,offloaded', [
+    (None, False),
+    (16, False),
+    (1023, False),
+    (1024, True),
+    (4096, True),
+])
+def test_offloaded_validation(content_length, offloaded, monkeypatch):
+    offloaded_calls = []
+
+    def sync_to_async(func, *args, **kwargs):
+        offloaded_calls.append(func)
+        return falcon.util.sync.sync_to_async(func, *args, **kwargs)
+
+    monkeypatch.setattr(validators.jsonschema, 'sync_to_async', sync_to_async)
+
+    resource = ResourceOffloadedAsync()
+    data = MockResp()
+
+    req = _MockReqAsync(content_length=content_length)
+    assert falcon.async_to_sync(resource.request_validated, req, data) is data
+
+    req = _MockReqAsync(valid=False, content_length=content_length)
+    with pytest.raises(falcon.HTTPBadRequest) as excinfo:
+        falcon.async_to_sync(resource.request_validated, req, data)
+
+    assert excinfo.value.description == "'message' is a required property"
+    assert len(offloaded_calls) == (2 if offloaded else 0)